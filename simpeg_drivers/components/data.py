@@ -11,17 +11,20 @@
 
 from __future__ import annotations
 
+import json
 from copy import deepcopy
+from logging import getLogger
 from re import findall
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 import numpy as np
-from geoh5py.objects import LargeLoopGroundTEMReceivers, PotentialElectrode
+from geoh5py.objects import DrapeModel, LargeLoopGroundTEMReceivers, PotentialElectrode
 from scipy.sparse import csgraph, csr_matrix
-from scipy.spatial import cKDTree
 from simpeg.electromagnetics.static.utils.static_utils import geometric_factor
 
-from simpeg_drivers.utils.utils import drape_2_tensor
+from simpeg_drivers.utils.tile_cache import hash_arrays
+from simpeg_drivers.utils.utils import DrapeGeometry
 
 from .factories import (
     EntityFactory,
@@ -36,6 +39,8 @@ if TYPE_CHECKING:
     from simpeg_drivers.components.meshes import InversionMesh
     from simpeg_drivers.options import InversionBaseOptions
 
+logger = getLogger(__name__)
+
 
 class InversionData(InversionLocations):
     """
@@ -83,6 +88,8 @@ class InversionData(InversionLocations):
         self.entity = None
         self.data_entity = None
         self._observed_data_types = {}
+        self._selection_hash: str | None = None
+        self._drape_geometry: DrapeGeometry | None = None
         self._survey = None
 
         self._initialize()
@@ -104,11 +111,110 @@ class InversionData(InversionLocations):
 
         self.normalizations: dict[str, Any] = self.get_normalizations()
 
-        self.entity = self.write_entity()
+        previous = self.previous_entity() if self.params.reuse_data else None
+
+        if previous is not None:
+            self.data_entity = previous
+            self.entity = self.copy_entity(previous)
+            self.save_data(reuse=True)
+        else:
+            self.entity = self.write_entity()
+            self.data_entity = self.entity
+            self.save_data()
+
+            if self.params.reuse_data:
+                self.register_entity()
 
-        self.save_data()
         self.locations = super().get_locations(self.entity)
 
+    @property
+    def selection_hash(self) -> str:
+        """
+        Hash of the data selection, from the source survey, receiver locations,
+        mask and normalized data.
+        """
+        if self._selection_hash is not None:
+            return self._selection_hash
+
+        values = []
+        for component, channels in self.observed.items():
+            for channel in channels or [None]:
+                values += [
+                    None if channels is None else channels[channel],
+                    None
+                    if self.uncertainties is None or channels is None
+                    else self.uncertainties[component][channel],
+                ]
+
+        survey = self.params.data_object
+        transmitters = getattr(survey, "transmitters", None)
+        self._selection_hash = hash_arrays(
+            self.params.inversion_type,
+            str(survey.uid),
+            self.locations,
+            getattr(survey, "cells", None),
+            getattr(transmitters, "vertices", None),
+            getattr(transmitters, "cells", None),
+            self.mask,
+            *values,
+        )
+
+        return self._selection_hash
+
+    @property
+    def selections_file(self):
+        """File listing the survey entities created for each data selection."""
+        return self.params.workpath / "data_selections.json"
+
+    def previous_entity(self):
+        """
+        Survey entity of a previous run with an identical data selection, if any.
+        """
+        if not self.selections_file.exists():
+            return None
+
+        selections = json.loads(self.selections_file.read_text(encoding="utf-8"))
+        uid = selections.get(self.selection_hash)
+        if uid is None:
+            return None
+
+        entity = self.workspace.get_entity(UUID(uid))[0]
+        concrete_object = EntityFactory(self.params).concrete_object
+        if not isinstance(entity, concrete_object):
+            return None
+
+        logger.info("Re-using survey '%s' from a previous run.", entity.name)
+        return entity
+
+    def copy_entity(self, entity):
+        """
+        Copy the geometry of the survey entity of a previous run under the group
+        of the current run, to hold the results of the run.
+
+        The observed data and uncertainties are not copied, but referenced on
+        the survey entity of the previous run.
+
+        :param entity: Survey entity of the previous run.
+        """
+        copy = entity.copy(parent=self.params.out_group, copy_children=False)
+        transmitters = getattr(entity, "transmitters", None)
+        if transmitters is not None:
+            for tx_freq in transmitters.get_data("Tx frequency"):
+                tx_freq.copy(parent=copy.transmitters)
+
+        return copy
+
+    def register_entity(self):
+        """Record the survey entity of the current data selection for later runs."""
+        selections = {}
+        if self.selections_file.exists():
+            selections = json.loads(self.selections_file.read_text(encoding="utf-8"))
+
+        selections[self.selection_hash] = str(self.entity.uid)
+        self.selections_file.write_text(
+            json.dumps(selections, indent=4), encoding="utf-8"
+        )
+
     @property
     def observed(self):
         """
@@ -116,7 +222,7 @@ class InversionData(InversionLocations):
         """
         if self._observed is None:
             filtered = self.filter(self.params.data, mask=self.mask)
-            self._observed = self.normalize(filtered)
+            self._observed = self.normalize(filtered, copy=False)
 
         return self._observed
 
@@ -127,7 +233,7 @@ class InversionData(InversionLocations):
         """
         if self._uncertainties is None and hasattr(self.params, "uncertainties"):
             filtered = self.filter(self.params.uncertainties, mask=self.mask)
-            self._uncertainties = self.normalize(filtered, absolute=True)
+            self._uncertainties = self.normalize(filtered, absolute=True, copy=False)
 
         return self._uncertainties
 
@@ -156,6 +262,21 @@ class InversionData(InversionLocations):
 
         return getattr(self.entity, "parts", None)
 
+    @property
+    def drape_geometry(self) -> DrapeGeometry | None:
+        """Geometry of the drape model used by the 2D simulations."""
+        if self._drape_geometry is None and isinstance(self.params.mesh, DrapeModel):
+            self._drape_geometry = DrapeGeometry(self.params.mesh)
+
+        return self._drape_geometry
+
+    @drape_geometry.setter
+    def drape_geometry(self, value: DrapeGeometry | None):
+        if not isinstance(value, DrapeGeometry | type(None)):
+            raise TypeError("Attribute 'drape_geometry' must be a DrapeGeometry.")
+
+        self._drape_geometry = value
+
     def drape_locations(self, locations: np.ndarray) -> np.ndarray:
         """
         Return pseudo locations along line in distance, depth.
@@ -163,20 +284,7 @@ class InversionData(InversionLocations):
         The horizontal distance is referenced to first node of the core mesh.
 
         """
-        local_tensor = drape_2_tensor(self.params.mesh)
-
-        # Interpolate distance assuming always inside the mesh trace
-        tree = cKDTree(self.params.mesh.prisms[:, :2])
-        rad, ind = tree.query(locations[:, :2], k=2)
-        distance_interp = 0.0
-        for ii in range(2):
-            distance_interp += local_tensor.cell_centers_x[ind[:, ii]] / (
-                rad[:, ii] + 1e-8
-            )
-
-        distance_interp /= ((rad + 1e-8) ** -1.0).sum(axis=1)
-
-        return np.c_[distance_interp, locations[:, 2:]]
+        return self.drape_geometry.drape_locations(locations)
 
     def get_data(self) -> tuple[list, dict, dict]:
         """
@@ -205,8 +313,13 @@ class InversionData(InversionLocations):
 
         return entity
 
-    def save_data(self):
-        """Write out the data to geoh5"""
+    def save_data(self, reuse: bool = False):
+        """
+        Write out the data to geoh5
+
+        :param reuse: Fetch the data already stored on the data entity by a
+            previous run instead of writing them.
+        """
         has_channels = self.params.inversion_type in [
             "magnetotellurics",
             "tipper",
@@ -231,24 +344,30 @@ class InversionData(InversionLocations):
                 if has_channels:
                     suffix += f"_[{ind}]"
 
-                normalized_data = values / self.normalizations[channel][component]
-                data_entity = self.entity.add_data(
-                    {"Observed" + suffix: {"values": normalized_data}}
-                )
-                uncerts = np.abs(
-                    self.uncertainties[component][channel].flatten()
-                    / self.normalizations[channel][component]
-                )
-                uncerts[np.isinf(uncerts)] = np.nan
-                uncert_entity = self.entity.add_data(
-                    {"Uncertainties" + suffix: {"values": uncerts}}
-                )
+                if reuse:
+                    data_entity, uncert_entity = (
+                        self.data_entity.get_data(name + suffix)[0]
+                        for name in ["Observed", "Uncertainties"]
+                    )
+                else:
+                    normalized_data = values / self.normalizations[channel][component]
+                    data_entity = self.data_entity.add_data(
+                        {"Observed" + suffix: {"values": normalized_data}}
+                    )
+                    uncerts = np.abs(
+                        np.ravel(self.uncertainties[component][channel])
+                        / self.normalizations[channel][component]
+                    )
+                    uncerts[np.isinf(uncerts)] = np.nan
+                    uncert_entity = self.data_entity.add_data(
+                        {"Uncertainties" + suffix: {"values": uncerts}}
+                    )
 
                 if has_channels:
-                    data_dict[component] = self.entity.add_data_to_group(
+                    data_dict[component] = self.data_entity.add_data_to_group(
                         data_entity, f"Observed_{component}"
                     )
-                    uncert_dict[component] = self.entity.add_data_to_group(
+                    uncert_dict[component] = self.data_entity.add_data_to_group(
                         uncert_entity, f"Uncertainties_{component}"
                     )
                 else:
@@ -261,7 +380,7 @@ class InversionData(InversionLocations):
         self.update_params(data_dict, uncert_dict)
 
     def normalize(
-        self, data: dict[str, np.ndarray], absolute=False
+        self, data: dict[str, np.ndarray], absolute=False, copy=True
     ) -> dict[str, np.ndarray]:
         """
         Apply data type specific normalizations to data.
@@ -270,21 +389,24 @@ class InversionData(InversionLocations):
         to the normalizations attribute list the value applied to the data.
 
         :param: data: Components and associated geophysical data.
+        :param: absolute: Return the absolute value of the normalized data.
+        :param: copy: Normalize a copy of the data. Otherwise, the arrays are
+            normalized in place, which is only safe for arrays owned by the caller.
 
         :return: d: Normalized data.
         """
-        d = deepcopy(data)
+        d = deepcopy(data) if copy else data
         for chan in getattr(self.params.data_object, "channels", [None]):
             for comp in self.params.active_components:
                 if isinstance(d[comp], dict):
                     if d[comp][chan] is not None:
                         d[comp][chan] *= self.normalizations[chan][comp]
                         if absolute:
-                            d[comp][chan] = np.abs(d[comp][chan])
+                            np.abs(d[comp][chan], out=d[comp][chan])
                 elif d[comp] is not None:
                     d[comp] *= self.normalizations[chan][comp]
                     if absolute:
-                        d[comp] = np.abs(d[comp])
+                        np.abs(d[comp], out=d[comp])
 
         return d
 
@@ -372,7 +494,7 @@ class InversionData(InversionLocations):
         """
         Update pointers to newly created object and data.
         """
-        self.params.data_object = self.entity
+        self.params.data_object = self.data_entity
         for comp in self.params.components:
             if getattr(self.params, "_".join([comp, "channel"]), None) is None:
                 continue
@@ -381,10 +503,15 @@ class InversionData(InversionLocations):
             setattr(self.params, f"{comp}_uncertainty", uncert_dict[comp])
 
         if getattr(self.params, "line_selection", None) is not None:
-            new_line = self.params.line_selection.line_object.copy(
-                parent=self.entity,
-                values=self.params.line_selection.line_object.values[self.mask],
-            )
+            line_object = self.params.line_selection.line_object
+            new_line = self.data_entity.get_data(line_object.name)
+            if new_line:
+                new_line = new_line[0]
+            else:
+                new_line = line_object.copy(
+                    parent=self.data_entity,
+                    values=line_object.values[self.mask],
+                )
             self.params.line_selection.line_object = new_line
 
     @property
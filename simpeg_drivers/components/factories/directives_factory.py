@@ -29,6 +29,9 @@ from simpeg.utils.mat_utils import cartesian2amplitude_dip_azimuth
 
 from simpeg_drivers.components.factories.simpeg_factory import SimPEGFactory
 from simpeg_drivers.options import BaseInversionOptions
+from simpeg_drivers.utils.async_writer import AsyncSaveGeoH5
+from simpeg_drivers.utils.checkpoints import SaveCheckpoint
+from simpeg_drivers.utils.placement import RebalanceMisfits
 
 
 if TYPE_CHECKING:
@@ -42,11 +45,14 @@ class DirectivesFactory:
         self.driver = driver
         self.params = driver.params
         self.factory_type = self.driver.params.inversion_type
+        self._async_save_directive = None
         self._directive_list: list[directives.InversionDirective] | None = None
         self._vector_inversion_directive = None
         self._update_sensitivity_weights_directive = None
         self._update_irls_directive = None
         self._beta_estimate_by_eigenvalues_directive = None
+        self._checkpoint_directive = None
+        self._rebalance_misfits_directive = None
         self._update_preconditioner_directive = None
         self._save_iteration_model_directive = None
         self._save_property_group = None
@@ -76,6 +82,21 @@ class DirectivesFactory:
         save_dirs[0].open_geoh5 = True
         save_dirs[-1].close_geoh5 = True
 
+    @property
+    def async_save_directive(self):
+        """Directive writing the save directives from a background thread."""
+        if (
+            self._async_save_directive is None
+            and self.params.directives.async_save
+            and not self.params.forward_only
+        ):
+            self._async_save_directive = AsyncSaveGeoH5(
+                self.save_directives,
+                queue_size=self.params.directives.save_queue_size,
+            )
+
+        return self._async_save_directive
+
     @property
     def beta_estimate_by_eigenvalues_directive(self):
         """"""
@@ -92,16 +113,42 @@ class DirectivesFactory:
 
         return self._beta_estimate_by_eigenvalues_directive
 
+    @property
+    def checkpoint_directive(self):
+        """Directive saving and restoring the state of the inversion."""
+        if self._checkpoint_directive is None and (
+            self.params.directives.save_checkpoints
+            or self.params.directives.resume_from is not None
+        ):
+            self._checkpoint_directive = SaveCheckpoint(
+                self.params.workpath / "checkpoints",
+                irls_directive=self.update_irls_directive,
+                resume_from=self.params.directives.resume_from,
+            )
+
+        return self._checkpoint_directive
+
     @property
     def directive_list(self):
         """List of directives to be used in inversion."""
         if self._directive_list is None:
             if not self.params.forward_only:
-                self._directive_list = self.inversion_directives + self.save_directives
+                if self.async_save_directive is not None:
+                    save_directives = self.async_save_directive.save_directives
+                    self._directive_list = self.inversion_directives + [
+                        self.async_save_directive
+                    ]
+                else:
+                    save_directives = self.save_directives
+                    self._directive_list = self.inversion_directives + save_directives
+
+                # Last, to capture the state after all other updates
+                if self.checkpoint_directive is not None:
+                    self._directive_list.append(self.checkpoint_directive)
             else:
-                self._directive_list = self.save_directives
+                save_directives = self._directive_list = self.save_directives
 
-            self.configure_save_directives(self._directive_list)
+            self.configure_save_directives(save_directives)
 
         return self._directive_list
 
@@ -116,6 +163,11 @@ class DirectivesFactory:
 
         self._directive_list = value
 
+    def close(self):
+        """Write the pending asynchronous writes and stop the writer thread."""
+        if self._async_save_directive is not None:
+            self._async_save_directive.close()
+
     @property
     def inversion_directives(self):
         """List of directives that control the inverse."""
@@ -127,11 +179,30 @@ class DirectivesFactory:
             "beta_estimate_by_eigenvalues_directive",
             "update_preconditioner_directive",
             "scale_misfits",
+            "rebalance_misfits_directive",
         ]:
             if getattr(self, directive) is not None:
                 directives_list.append(getattr(self, directive))
         return directives_list
 
+    @property
+    def rebalance_misfits_directive(self):
+        """Directive moving the misfits between workers after the first iteration."""
+        if (
+            self._rebalance_misfits_directive is None
+            and self.params.compute.rebalance_misfits
+            and getattr(self.driver, "misfit_futures", None) is not None
+        ):
+            self._rebalance_misfits_directive = RebalanceMisfits(
+                self.driver.client,
+                self.driver.misfit_futures,
+                self.driver.misfit_placement,
+                self.driver.workers,
+                reorder=self.driver.reorder_misfits,
+            )
+
+        return self._rebalance_misfits_directive
+
     @property
     def save_directives(self):
         """List of directives to save iteration data and models."""
@@ -11,6 +11,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -19,25 +21,49 @@ from simpeg.simulation import BaseSimulation
 
 from simpeg_drivers.components.factories.simpeg_factory import SimPEGFactory
 from simpeg_drivers.utils.nested import create_misfit
+from simpeg_drivers.utils.tile_cache import TileCache
 
 
 if TYPE_CHECKING:
+    from dask.distributed import Client
     from geoapps_utils.driver.params import BaseParams
 
     from simpeg_drivers.options import BaseOptions
 
 
+_WORKER_SIMULATION: BaseSimulation | None = None
+
+
+def _set_worker_simulation(simulation: BaseSimulation):
+    """Store the global simulation once per worker process."""
+    global _WORKER_SIMULATION  # pylint: disable=global-statement
+    _WORKER_SIMULATION = simulation
+
+
+def _create_worker_misfit(*args):
+    """Create the local misfits from the simulation stored on the worker process."""
+    return create_misfit(_WORKER_SIMULATION, *args)
+
+
 class MisfitFactory(SimPEGFactory):
     """Build SimPEG global misfit function."""
 
-    def __init__(self, params: BaseParams | BaseOptions, simulation: BaseSimulation):
+    def __init__(
+        self,
+        params: BaseParams | BaseOptions,
+        simulation: BaseSimulation,
+        client: Client | bool | None = None,
+    ):
         """
         :param params: Options object containing SimPEG object parameters.
+        :param simulation: Global simulation to be tiled.
+        :param client: Dask client used to build the tiles, if available.
         """
         super().__init__(params)
         self.simpeg_object = self.concrete_object()
         self.factory_type = self.params.inversion_type
         self.simulation = simulation
+        self.client = client
 
     def concrete_object(self):
         return objective_function.ComboObjectiveFunction
@@ -60,9 +86,12 @@ class MisfitFactory(SimPEGFactory):
         else:
             channels = [None]
 
-        futures = []
-        # TODO bring back on GEOPY-2182
-        # with ProcessPoolExecutor() as executor:
+        cache = (
+            TileCache(self.params.workpath / "tiles")
+            if self.params.compute.tile_cache
+            else None
+        )
+        tasks = []
         count = 0
         for channel in channels:
             tile_count = 0
@@ -71,10 +100,8 @@ class MisfitFactory(SimPEGFactory):
                     continue
 
                 n_split = split_list[count]
-                futures.append(
-                    # executor.submit(
-                    create_misfit(
-                        self.simulation,
+                tasks.append(
+                    (
                         local_indices,
                         channel,
                         tile_count,
@@ -82,6 +109,7 @@ class MisfitFactory(SimPEGFactory):
                         self.params.padding_cells,
                         self.params.inversion_type,
                         self.params.forward_only,
+                        cache,
                     )
                 )
                 tile_count += np.sum(n_split)
@@ -89,14 +117,50 @@ class MisfitFactory(SimPEGFactory):
 
         local_misfits = []
         local_orderings = []
-        for future in futures:  # as_completed(futures):
-            misfits, orderings = future  # future.result()
+        for misfits, orderings in self.create_misfits(tasks):
             local_misfits += misfits
             local_orderings += orderings
 
         self.simulation.survey.ordering = np.vstack(local_orderings)
         return [local_misfits]
 
+    def create_misfits(self, tasks: list[tuple]) -> list[tuple[list, list]]:
+        """
+        Build the local misfits for all tiles, in parallel if requested.
+
+        Tiles are distributed over the active dask client if available,
+        otherwise over a pool of spawned processes, such that the workers do not
+        inherit the threads and locks of the parent process. Results are always
+        returned in the order of the tasks, regardless of the order of completion.
+
+        :param tasks: List of arguments passed to
+            :func:`simpeg_drivers.utils.nested.create_misfit`, minus the
+            global simulation.
+
+        :return: List of local misfits and data slices for every task.
+        """
+        n_workers = min(self.params.compute.n_tile_workers, len(tasks))
+
+        if n_workers <= 1:
+            return [create_misfit(self.simulation, *task) for task in tasks]
+
+        if self.client:
+            simulation = self.client.scatter(self.simulation, broadcast=True)
+            futures = [
+                self.client.submit(create_misfit, simulation, *task, pure=False)
+                for task in tasks
+            ]
+            return self.client.gather(futures)
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=get_context("spawn"),
+            initializer=_set_worker_simulation,
+            initargs=(self.simulation,),
+        ) as executor:
+            futures = [executor.submit(_create_worker_misfit, *task) for task in tasks]
+            return [future.result() for future in futures]
+
     def assemble_keyword_arguments(self, **_):
         """Implementation of abstract method from SimPEGFactory."""
         return {}
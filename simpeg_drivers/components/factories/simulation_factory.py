@@ -28,6 +28,8 @@ import numpy as np
 from simpeg import maps
 
 from simpeg_drivers.components.factories.simpeg_factory import SimPEGFactory
+from simpeg_drivers.utils.nested import ComputePolicy
+from simpeg_drivers.utils.thread_budget import ThreadBudget
 
 
 class SimulationFactory(SimPEGFactory):
@@ -38,6 +40,7 @@ class SimulationFactory(SimPEGFactory):
         """
         super().__init__(params)
         self.simpeg_object = self.concrete_object()
+        self._compute_policy: ComputePolicy | None = None
 
         self.solver = None
         if self.factory_type in [
@@ -56,6 +59,44 @@ class SimulationFactory(SimPEGFactory):
 
             self.solver = getattr(solver_module, params.compute.solver_type)
 
+    @property
+    def compute_policy(self) -> ComputePolicy:
+        """
+        Compute settings of the global simulation, passed on to the local simulations.
+        """
+        if self._compute_policy is None:
+            potential_fields = self.factory_type in [
+                "magnetic scalar",
+                "magnetic vector",
+                "gravity",
+            ]
+            self._compute_policy = ComputePolicy(
+                max_chunk_size=self.params.compute.max_chunk_size,
+                store_sensitivities=(
+                    "forward_only"
+                    if self.params.forward_only
+                    else self.params.store_sensitivities
+                ),
+                sensitivity_dtype=(
+                    self.params.compute.sensitivity_dtype if potential_fields else None
+                ),
+                solver=self.solver,
+                n_threads=ThreadBudget.from_compute(
+                    self.params.compute.n_cpu,
+                    n_workers=self.params.compute.n_workers,
+                    n_threads=self.params.compute.n_threads,
+                ).library_threads,
+                sensitivity_path=self._get_sensitivity_path(None),
+            )
+
+        return self._compute_policy
+
+    def build(self, **kwargs):
+        simulation = super().build(**kwargs)
+        simulation.compute_policy = self.compute_policy
+
+        return simulation
+
     def concrete_object(self):
         if self.factory_type in ["magnetic scalar", "magnetic vector"]:
             from simpeg.potential_fields.magnetics import simulation
@@ -134,15 +175,8 @@ class SimulationFactory(SimPEGFactory):
         mesh=None,
         models=None,
     ):
-        kwargs = {}
+        kwargs = self.compute_policy.simulation_kwargs()
         kwargs["survey"] = survey
-        kwargs["max_chunk_size"] = self.params.compute.max_chunk_size
-        kwargs["store_sensitivities"] = (
-            "forward_only"
-            if self.params.forward_only
-            else self.params.store_sensitivities
-        )
-        kwargs["solver"] = self.solver
         active_cells = models.active_cells
         if self.factory_type == "magnetic vector":
             kwargs["active_cells"] = active_cells
@@ -157,6 +191,9 @@ class SimulationFactory(SimPEGFactory):
             kwargs["active_cells"] = active_cells
             kwargs["rhoMap"] = maps.IdentityMap(nP=int(active_cells.sum()))
 
+        if self.compute_policy.sensitivity_path is not None:
+            kwargs["sensitivity_path"] = str(self.compute_policy.sensitivity_path)
+
         if "induced polarization" in self.factory_type:
             etamap = maps.InjectActiveCells(
                 mesh, active_cells=active_cells, value_inactive=0
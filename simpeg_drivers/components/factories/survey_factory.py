@@ -130,18 +130,24 @@ class SurveyFactory(SimPEGFactory):
         return survey
 
     def _add_data(self, survey, data):
-        # Stack the data by [channel, component, receiver]
-        data_stack = np.dstack(
-            [np.vstack(list(k.values())) for k in data.observed.values()]
-        ).transpose((0, 2, 1))
-        uncert_stack = np.dstack(
-            [np.vstack(list(k.values())) for k in data.uncertainties.values()]
-        ).transpose((0, 2, 1))
-
-        uncert_stack[np.isnan(data_stack)] = np.inf
-        data_stack[np.isnan(data_stack)] = (
-            self.dummy
-        )  # Nan's handled by inf uncertainties
+        # Stack the data by [channel, component, receiver] in a single allocation
+        components = list(data.observed)
+        channels = list(data.observed[components[0]])
+        n_receivers = np.ravel(data.observed[components[0]][channels[0]]).shape[0]
+        shape = (len(channels), len(components), n_receivers)
+        data_stack = np.empty(shape)
+        uncert_stack = np.empty(shape)
+
+        for ind, component in enumerate(components):
+            observed = data.observed[component]
+            uncertainties = data.uncertainties[component]
+            for count, channel in enumerate(observed):
+                data_stack[count, ind] = np.ravel(observed[channel])
+                uncert_stack[count, ind] = np.ravel(uncertainties[channel])
+
+        nan_data = np.isnan(data_stack)
+        uncert_stack[nan_data] = np.inf
+        data_stack[nan_data] = self.dummy  # Nan's handled by inf uncertainties
         survey.dobs = data_stack
         survey.std = uncert_stack
 
@@ -297,49 +303,39 @@ class SurveyFactory(SimPEGFactory):
         frequencies = np.array(
             [int(frequencies.value_map[f]) for f in frequencies.values]
         )
+        n_rx = rx_locs.shape[0]
+        n_comp = len(data.components)
 
-        sources = []
+        # Resolve the receiver and source classes and arguments once, then
+        # instantiate the objects directly for all stations.
         rx_factory = ReceiversFactory(self.params)
-        tx_factory = SourcesFactory(self.params)
-        receiver_groups = []
-        block_ordering = []
-        for rx_id, locs in enumerate(rx_locs):
-            receivers = []
-            for comp_id, component in enumerate(data.components):
-                receiver = rx_factory.build(
-                    locations=locs,
-                    data=data,
-                    component=component,
-                )
-                block_ordering.append([comp_id, rx_id])
-                receivers.append(receiver)
-
-            receiver_groups.append(receivers)
+        rx_arguments = [
+            rx_factory.assemble_keyword_arguments(data=data, component=component)
+            for component in data.components
+        ]
+        receiver_groups = [
+            [rx_factory.simpeg_object(locs, **kwargs) for kwargs in rx_arguments]
+            for locs in rx_locs
+        ]
 
-        block_ordering = np.vstack(block_ordering)
-        ordering = []
-        for freq_id, frequency in enumerate(channels):
+        tx_factory = SourcesFactory(self.params)
+        sources = []
+        for frequency in channels:
+            kwargs = tx_factory.assemble_keyword_arguments(frequency=frequency)
+            locations = tx_locs[frequency == frequencies, :]
             for rx_id, receivers in enumerate(receiver_groups):
-                locs = tx_locs[frequency == frequencies, :][rx_id, :]
-                tx = tx_factory.build(
-                    receivers,
-                    locations=locs,
-                    frequency=frequency,
-                )
+                kwargs["location"] = locations[rx_id, :]
+                tx = tx_factory.simpeg_object(receivers, frequency, **kwargs)
                 tx.rx_ids = np.r_[rx_id]
                 sources.append(tx)
 
-            ordering.append(
-                np.hstack(
-                    [
-                        np.ones((block_ordering.shape[0], 1)) * freq_id,
-                        block_ordering,
-                    ]
-                )
-            )
-
-        self.ordering = np.vstack(ordering).astype(int)
-        self.sorting = np.arange(rx_locs.shape[0], dtype=int)
+        # Ordering by [channel, component, receiver]
+        self.ordering = np.c_[
+            np.repeat(np.arange(len(channels)), n_rx * n_comp),
+            np.tile(np.arange(n_comp), n_rx * len(channels)),
+            np.tile(np.repeat(np.arange(n_rx), n_comp), len(channels)),
+        ].astype(int)
+        self.sorting = np.arange(n_rx, dtype=int)
         return [sources]
 
     def _naturalsource_arguments(self, data=None):
@@ -26,7 +26,7 @@ from scipy.sparse import csr_matrix, identity
 
 from simpeg_drivers.options import BaseForwardOptions, BaseInversionOptions
 from simpeg_drivers.utils.meshes import auto_mesh_parameters
-from simpeg_drivers.utils.utils import drape_2_tensor
+from simpeg_drivers.utils.utils import DrapeGeometry
 
 
 logger = getLogger(__name__)
@@ -80,15 +80,21 @@ class InversionMesh:
         workspace: Workspace,
         params: BaseForwardOptions | BaseInversionOptions,
         entity: Octree | DrapeModel | None = None,
+        drape_geometry: DrapeGeometry | None = None,
     ) -> None:
         """
         :param workspace: Workspace object containing mesh data.
         :param params: Options object containing mesh parameters.
+        :param entity: Mesh entity, copied from the parameters if not provided.
+        :param drape_geometry: Geometry of the drape model, if already computed.
         """
         self.workspace = workspace
         self.params = params
         self.entity = entity or self.get_entity()
-        self.mesh, self._permutation = self.to_discretize(self.entity)
+        self._drape_geometry = drape_geometry
+        self.mesh, self._permutation = self.to_discretize(
+            self.entity, drape_geometry=self.drape_geometry
+        )
 
     def get_entity(self) -> Octree | DrapeModel:
         """
@@ -127,11 +133,13 @@ class InversionMesh:
     def to_discretize(
         cls,
         entity: Octree | DrapeModel,
+        drape_geometry: DrapeGeometry | None = None,
     ) -> tuple[TreeMesh | TensorMesh, np.ndarray]:
         """
         Converts mesh entity to its discretize equivalent.
 
         :param entity: Octree or DrapeModel object containing mesh data.
+        :param drape_geometry: Geometry of the drape model, if already computed.
 
         :return: Tuple containing mesh object and permutation vector.
         """
@@ -140,7 +148,8 @@ class InversionMesh:
             mesh = cls.to_treemesh(entity)
             permutation = identity(entity.n_cells).tocsr()
         elif isinstance(entity, DrapeModel):
-            mesh, indices = drape_2_tensor(entity, return_sorting=True)
+            drape_geometry = drape_geometry or DrapeGeometry(entity)
+            mesh, indices = drape_geometry.mesh, drape_geometry.sorting
             permutation = csr_matrix(
                 (np.ones_like(indices), (np.arange(len(indices)), indices)),
                 shape=(mesh.n_cells, entity.n_cells),
@@ -155,7 +164,9 @@ class InversionMesh:
         """TreeMesh or TensorMesh object containing mesh data."""
         # In case the _mesh was reset by the driver.
         if self._mesh is None:
-            self.mesh, self._permutation = self.to_discretize(self.entity)
+            self.mesh, self._permutation = self.to_discretize(
+                self.entity, drape_geometry=self.drape_geometry
+            )
 
         return self._mesh
 
@@ -166,6 +177,14 @@ class InversionMesh:
 
         self._mesh = value
 
+    @property
+    def drape_geometry(self) -> DrapeGeometry | None:
+        """Geometry of the drape model, computed once and shared with the data."""
+        if self._drape_geometry is None and isinstance(self.entity, DrapeModel):
+            self._drape_geometry = DrapeGeometry(self.entity)
+
+        return self._drape_geometry
+
     @property
     def n_cells(self) -> int:
         """Number of cells in the mesh."""
@@ -32,6 +32,7 @@ from geoh5py.shared import Entity
 from simpeg_drivers.components.data import InversionData
 from simpeg_drivers.components.locations import InversionLocations
 from simpeg_drivers.components.models import InversionModel
+from simpeg_drivers.utils.topography import TopographyInterpolator
 from simpeg_drivers.utils.utils import (
     active_from_xyz,
     floating_active,
@@ -70,12 +71,23 @@ class InversionTopography(InversionLocations):
         """
         super().__init__(workspace, params)
         self.locations: np.ndarray | None = None
+        self._interpolator: TopographyInterpolator | None = None
 
         if self.params.active_cells.topography_object is not None:
             self.locations = self.get_locations(
                 self.params.active_cells.topography_object
             )
 
+    @property
+    def interpolator(self) -> TopographyInterpolator:
+        """
+        Interpolator of the topography, shared by all elevation queries.
+        """
+        if self._interpolator is None:
+            self._interpolator = TopographyInterpolator(self.locations)
+
+        return self._interpolator
+
     def active_cells(self, mesh: InversionMesh, data: InversionData) -> np.ndarray:
         """
         Return mask that restricts models to set of earth cells.
@@ -99,7 +111,7 @@ class InversionTopography(InversionLocations):
         else:
             active_cells = active_from_xyz(
                 mesh.entity,
-                self.locations,
+                self.interpolator,
                 grid_reference="bottom" if forced_to_surface else "center",
             )
 
@@ -16,7 +16,6 @@ from __future__ import annotations
 import cProfile
 import pstats
 
-import multiprocessing
 import contextlib
 from copy import deepcopy
 import sys
@@ -29,7 +28,7 @@ from time import time
 import numpy as np
 from dask import config as dconf
 
-from dask.distributed import get_client, Client, LocalCluster, performance_report
+from dask.distributed import get_client, Client, performance_report
 
 from geoapps_utils.base import Driver
 from geoapps_utils.utils.importing import GeoAppsError
@@ -57,6 +56,7 @@ from simpeg.regularization import (
     Sparse,
     SparseSmoothness,
 )
+from simpeg.utils import Counter
 
 from simpeg_drivers import DRIVER_MAP, __version__
 from simpeg_drivers.components import (
@@ -76,8 +76,20 @@ from simpeg_drivers.options import (
     BaseInversionOptions,
 )
 from simpeg_drivers.joint.options import BaseJointOptions
+from simpeg_drivers.utils.memory_planner import MemoryPlanner
 from simpeg_drivers.utils.nested import tile_locations
+from simpeg_drivers.utils.placement import (
+    misfit_cost,
+    misfit_rows,
+    place_misfits,
+    round_order,
+    scatter_misfits,
+    worker_loads,
+)
 from simpeg_drivers.utils.regularization import cell_neighbors, set_rotated_operators
+from simpeg_drivers.utils.scheduler import connect_scheduler, dask_client
+from simpeg_drivers.utils.thread_budget import ThreadBudget
+from simpeg_drivers.utils.topography import TopographyInterpolator
 
 mlogger = logging.getLogger("distributed")
 mlogger.setLevel(logging.WARNING)
@@ -111,7 +123,12 @@ class InversionDriver(Driver):
         self._mappings: list[maps.IdentityMap] | None = None
         self._window = None
         self._client: Client | None = None
+        self._owns_client = False
         self._workers: list[str] | None = None
+        self.misfit_futures: list | None = None
+        self._thread_budget: ThreadBudget | None = None
+        self.misfit_placement: list[str] | None = None
+        self.misfit_sizes: list[int] | None = None
 
     @property
     def client(self):
@@ -120,16 +137,29 @@ class InversionDriver(Driver):
                 self._client = get_client()
                 # self._workers = [worker.worker_address for worker in self.client.cluster.workers.values()]
             except ValueError:
-                self._client = False
+                compute = getattr(self.params, "compute", None)
+                self._client = (
+                    connect_scheduler(getattr(compute, "distributed_workers", None))
+                    or False
+                )
+                self._owns_client = bool(self._client)
 
         return self._client
 
+    def close_client(self):
+        """Close the client to the scheduler, if created by the driver."""
+        if self._owns_client:
+            self._client.close()
+            self._client = None
+            self._workers = None
+            self._owns_client = False
+
     @property
     def workers(self):
         """List of workers"""
         if self._workers is None:
             if self.client:
-                self._workers = list(self.client.cluster.workers.values())
+                self._workers = list(self.client.scheduler_info()["workers"])
             else:
                 self._workers = []
         return self._workers
@@ -164,12 +194,16 @@ class InversionDriver(Driver):
         """The Simpeg.data_misfit class"""
         if getattr(self, "_data_misfit", None) is None:
             with fetch_active_workspace(self.workspace, mode="r+"):
+                self.plan_memory()
+
                 # Tile locations
                 tiles = self.get_tiles()
 
                 self.logger.write(f"Setting up {len(tiles)} tile(s) . . .\n")
                 # Build tiled misfits and combine to form global misfit
-                self._data_misfit = MisfitFactory(self.params, self.simulation).build(
+                self._data_misfit = MisfitFactory(
+                    self.params, self.simulation, client=self.client
+                ).build(
                     tiles,
                     self.split_list,
                 )
@@ -198,14 +232,50 @@ class InversionDriver(Driver):
     def distributed_misfits(self):
         """
         Method to convert MetaSimulations to DaskMetaSimulations with futures.
+
+        Misfits are bin-packed onto the workers by their number of sensitivity
+        values, then re-ordered such that DaskComboMisfits evaluates them on
+        their assigned worker, before being scattered.
         """
+        misfits = self.data_misfit.objfcts
+        for misfit in misfits:
+            misfit.counter = Counter()
+
+        costs = [misfit_cost(misfit) for misfit in misfits]
+        placement = place_misfits(costs, self.workers)
+        order = round_order(placement, self.workers)
+        self.misfit_sizes = [int(misfit.nD) for misfit in misfits]
+        self.reorder_misfits(order)
+
+        self.misfit_placement = [placement[ind] for ind in order]
+        self.misfit_futures = scatter_misfits(
+            self.client, [misfits[ind] for ind in order], self.misfit_placement
+        )
+        loads = worker_loads(costs, placement)
+        self.logger.write(
+            f"Placed {len(misfits)} misfits with a load ratio (max/min) of "
+            f"{max(loads.values()) / max(min(loads.values()), 1.0):.2f} "
+            "between workers.\n"
+        )
+
         distributed_misfits = dask.objective_function.DaskComboMisfits(
-            self.data_misfit.objfcts,
-            multipliers=self.data_misfit.multipliers,
+            self.misfit_futures,
+            multipliers=np.asarray(self.data_misfit.multipliers)[order],
             client=self.client,
+            workers=[(worker,) for worker in self.workers],
         )
         self._data_misfit = distributed_misfits
 
+    def reorder_misfits(self, order: np.ndarray):
+        """
+        Re-order the data of the survey along with the misfits.
+
+        :param order: Indices of the misfits in their new order.
+        """
+        ordering = self.inversion_data.survey.ordering
+        ordering[:] = ordering[misfit_rows(self.misfit_sizes, order)]
+        self.misfit_sizes = [self.misfit_sizes[ind] for ind in order]
+
     @property
     def inverse_problem(self):
         if getattr(self, "_inverse_problem", None) is None:
@@ -424,30 +494,33 @@ class InversionDriver(Driver):
         self.logger.start()
         self.configure_dask()
 
-        simpeg_inversion = self.inversion
+        with self.thread_budget.limits():
+            self.logger.write(f"Thread layout: {self.thread_budget.layout()}\n")
 
-        if Path(self.params.input_file.path_name).is_file():
-            with fetch_active_workspace(self.workspace, mode="r+"):
-                self.out_group.add_file(self.params.input_file.path_name)
+            simpeg_inversion = self.inversion
 
-        predicted = None
-        try:
-            if self.params.forward_only:
-                self.logger.write("Running the forward simulation ...\n")
-                predicted = simpeg_inversion.invProb.get_dpred(
-                    self.models.starting_model, None
-                )
-            else:
-                # Run the inversion
-                self.start_inversion_message()
-                simpeg_inversion.run(self.models.starting_model)
+            if Path(self.params.input_file.path_name).is_file():
+                with fetch_active_workspace(self.workspace, mode="r+"):
+                    self.out_group.add_file(self.params.input_file.path_name)
 
-        except np.core._exceptions._ArrayMemoryError as error:  # pylint: disable=protected-access
-            raise GeoAppsError(
-                "Memory Error: Sensitivities too large for system. \n"
-                "Try reducing the number of data, reducing the number of cells in the mesh\n"
-                "or increase the number of tiles."
-            ) from error
+            predicted = None
+            try:
+                if self.params.forward_only:
+                    self.logger.write("Running the forward simulation ...\n")
+                    predicted = simpeg_inversion.invProb.get_dpred(
+                        self.models.starting_model, None
+                    )
+                else:
+                    # Run the inversion
+                    self.start_inversion_message()
+                    simpeg_inversion.run(self.models.starting_model)
+
+            except np.core._exceptions._ArrayMemoryError as error:  # pylint: disable=protected-access
+                raise GeoAppsError(
+                    "Memory Error: Sensitivities too large for system. \n"
+                    "Try reducing the number of data, reducing the number of cells in the mesh\n"
+                    "or increase the number of tiles."
+                ) from error
 
         self.logger.end()
         sys.stdout = self.logger.terminal
@@ -473,6 +546,9 @@ class InversionDriver(Driver):
             if isinstance(directive, directives.SaveLogFilesGeoH5):
                 directive.write(1)
 
+        TopographyInterpolator.clear_cache()
+        self.close_client()
+
     def start_inversion_message(self):
         # SimPEG reports half phi_d, so we scale to match
         has_chi_start = self.params.irls.starting_chi_factor is not None
@@ -622,18 +698,79 @@ class InversionDriver(Driver):
 
         return objective_function.ComboObjectiveFunction(objfcts=reg_funcs)
 
+    def plan_memory(self):
+        """
+        Adjust the tiling, the storage of sensitivities and the number of tile
+        workers for the data misfit to fit within 'max_ram' of the compute options.
+        """
+        compute = self.params.compute
+        if compute.max_ram is None or any(
+            dim in self.params.inversion_type for dim in ["1d", "2d"]
+        ):
+            return
+
+        n_cells = int(self.models.active_cells.sum())
+        if self.params.inversion_type == "magnetic vector":
+            n_cells *= 3
+
+        factorization = not isinstance(self.simulation, BasePFSimulation)
+        itemsize = 8
+        if not factorization:
+            itemsize = np.dtype(self.simulation.sensitivity_dtype).itemsize
+
+        plan = MemoryPlanner(
+            n_data=int(self.simulation.survey.nD),
+            n_cells=n_cells,
+            max_ram=compute.max_ram,
+            tile_spatial=compute.tile_spatial,
+            store_sensitivities=getattr(self.params, "store_sensitivities", "ram"),
+            n_tile_workers=compute.n_tile_workers,
+            n_mesh_cells=self.inversion_mesh.mesh.n_cells,
+            itemsize=itemsize,
+            max_chunk_size=compute.max_chunk_size,
+            factorization=factorization,
+            forward_only=self.params.forward_only,
+            allow_disk=not factorization,
+        ).plan()
+
+        compute.tile_spatial = plan.tile_spatial
+        compute.n_tile_workers = plan.n_tile_workers
+        if not self.params.forward_only and hasattr(self.params, "store_sensitivities"):
+            self.params.store_sensitivities = plan.store_sensitivities
+            if hasattr(self.simulation, "store_sensitivities"):
+                self.simulation.store_sensitivities = plan.store_sensitivities
+            if getattr(self.simulation, "compute_policy", None) is not None:
+                self.simulation.compute_policy.store_sensitivities = (
+                    plan.store_sensitivities
+                )
+
+        self.logger.write(
+            f"Memory plan for max_ram={compute.max_ram:.2f} Gb: "
+            f"{plan.tile_spatial} tile(s), sensitivities in "
+            f"{plan.store_sensitivities}, {plan.n_tile_workers} tile worker(s), "
+            f"estimated peak memory of {plan.peak_memory:.2f} Gb.\n"
+        )
+
     def get_tiles(self):
         if "2d" in self.params.inversion_type:
             return [np.arange(self.inversion_data.mask.sum())]
 
         if "1d" in self.params.inversion_type:
-            return np.arange(self.inversion_data.mask.sum()).reshape((-1, 1))
+            n_soundings = self.inversion_data.mask.sum()
+            n_batches = int(
+                np.ceil(n_soundings / max(self.params.compute.sounding_batch_size, 1))
+            )
+            return np.array_split(np.arange(n_soundings), n_batches)
 
+        cell_size = float(np.min(self.inversion_mesh.mesh.h[0]))
         return tile_locations(
             self.inversion_data.locations,
             self.params.compute.tile_spatial,
             labels=self.inversion_data.parts,
             sorting=self.simulation.survey.sorting,
+            method=self.params.compute.tile_method,
+            padding_cells=self.params.padding_cells,
+            cell_size=cell_size,
         )
 
     def configure_dask(self):
@@ -642,11 +779,30 @@ class InversionDriver(Driver):
         if self.client:
             dconf.set(scheduler=self.client)
         else:
-            n_cpu = self.params.compute.n_cpu
-            if n_cpu is None:
-                n_cpu = int(multiprocessing.cpu_count())
+            dconf.set(
+                scheduler="threads", pool=ThreadPool(self.thread_budget.n_threads)
+            )
 
-            dconf.set(scheduler="threads", pool=ThreadPool(n_cpu))
+    @property
+    def thread_budget(self) -> ThreadBudget:
+        """
+        Split of the CPUs between the dask threads and the BLAS/OpenMP threads.
+        """
+        if self._thread_budget is None:
+            compute = self.params.compute
+            if self.client:
+                n_threads = self.client.nthreads()
+                self._thread_budget = ThreadBudget.from_compute(
+                    compute.n_cpu,
+                    n_workers=len(n_threads),
+                    n_threads=max(n_threads.values(), default=1),
+                )
+            else:
+                self._thread_budget = ThreadBudget.from_compute(
+                    compute.n_cpu, n_threads=compute.n_threads
+                )
+
+        return self._thread_budget
 
     @classmethod
     def start(
@@ -731,6 +887,10 @@ class InversionLogger:
         )
 
     def end(self):
+        directives_factory = getattr(self.driver, "_directives", None)
+        if directives_factory is not None:
+            directives_factory.close()
+
         elapsed_time = timedelta(seconds=time() - self.initial_time).seconds
         days, hours, minutes, seconds = self.format_seconds(elapsed_time)
         self.write(
@@ -766,23 +926,15 @@ class InversionLogger:
 if __name__ == "__main__":
     file = Path(sys.argv[1]).resolve()
     input_file = InputFile.read_ui_json(file)
-    n_workers = input_file.data.get("n_workers", None)
-    n_threads = input_file.data.get("n_threads", None)
     save_report = input_file.data.get("performance_report", False)
-
-    cluster = (
-        LocalCluster(processes=True, n_workers=n_workers, threads_per_worker=n_threads)
-        if ((n_workers is not None and n_workers > 1) or n_threads is not None)
-        else None
-    )
     profiler = cProfile.Profile()
     profiler.enable()
 
-    with (
-        cluster.get_client()
-        if cluster is not None
-        else contextlib.nullcontext() as client
-    ):
+    with dask_client(
+        address=input_file.data.get("distributed_workers", None),
+        n_workers=input_file.data.get("n_workers", None),
+        n_threads=input_file.data.get("n_threads", None),
+    ) as client:
         # Full run
         with (
             performance_report(filename=file.parent / "dask_profile.html")
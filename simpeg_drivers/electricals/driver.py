@@ -43,15 +43,34 @@ from simpeg_drivers.utils.utils import get_drape_model
 class Base2DDriver(InversionDriver):
     """Base class for 2D DC and IP forward and inversion drivers."""
 
+    @property
+    def inversion_data(self) -> InversionData:
+        """Inversion data, sharing the drape geometry of the inversion mesh."""
+        if getattr(self, "_inversion_data", None) is None:
+            with fetch_active_workspace(self.workspace, mode="r+"):
+                self._inversion_data = InversionData(self.workspace, self.params)
+
+            if getattr(self, "_inversion_mesh", None) is not None:
+                self._inversion_data.drape_geometry = (
+                    self._inversion_mesh.drape_geometry
+                )
+
+        return self._inversion_data
+
     @property
     def inversion_mesh(self) -> InversionMesh:
-        """Inversion mesh"""
+        """Inversion mesh, sharing the drape geometry of the inversion data."""
         if getattr(self, "_inversion_mesh", None) is None:
             with fetch_active_workspace(self.workspace, mode="r+"):
                 if self.params.mesh is None:
                     self.params.mesh = self.create_drape_mesh()
 
-                self._inversion_mesh = InversionMesh(self.workspace, self.params)
+                data = getattr(self, "_inversion_data", None)
+                self._inversion_mesh = InversionMesh(
+                    self.workspace,
+                    self.params,
+                    drape_geometry=getattr(data, "drape_geometry", None),
+                )
         return self._inversion_mesh
 
     def create_drape_mesh(self) -> DrapeModel:
@@ -180,7 +199,7 @@ class BaseBatch2DDriver(LineSweepDriver):
                         continue
 
                     receiver_entity = extract_dcip_survey(
-                        iter_workspace, self.inversion_data.entity, cell_mask
+                        iter_workspace, self.inversion_data.data_entity, cell_mask
                     )
                     current_entity = receiver_entity.current_electrodes
                     receiver_locs = np.vstack(
@@ -41,7 +41,7 @@ class Base1DDriver(InversionDriver):
         self.layers_mesh: TensorMesh = self.get_1d_mesh()
         self.topo_z_drape = topo_drape_elevation(
             self.params.data_object.vertices,
-            self.inversion_topography.locations,
+            self.inversion_topography.interpolator,
         )
 
     @property
@@ -106,8 +106,7 @@ class Base1DDriver(InversionDriver):
     @property
     def split_list(self):
         """
-        Split the list of data into chunks for parallel processing.
+        Number of soundings in each batch, used to index the soundings of
+        the batched misfits.
         """
-        n_misfits = self.inversion_data.mask.sum()
-
-        return [1] * n_misfits
+        return [len(tile) for tile in self.get_tiles()]
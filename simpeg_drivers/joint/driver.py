@@ -37,6 +37,7 @@ from simpeg_drivers.components.factories import (
 )
 from simpeg_drivers.driver import InversionDriver
 from simpeg_drivers.joint.options import BaseJointOptions
+from simpeg_drivers.utils.topography import TopographyInterpolator
 from simpeg_drivers.utils.utils import simpeg_group_to_driver
 
 
@@ -48,6 +49,7 @@ class BaseJointDriver(InversionDriver):
         self._directives = None
         self._drivers = None
         self._wires = None
+        self.misfit_positions: np.ndarray | None = None
 
         super().__init__(params)
 
@@ -217,6 +219,23 @@ class BaseJointDriver(InversionDriver):
 
         return self._n_values
 
+    def reorder_misfits(self, order: np.ndarray):
+        """
+        Re-map the misfits of every driver to their position after re-ordering.
+
+        :param order: Indices of the misfits in their new order.
+        """
+        positions = np.argsort(order)
+        if self.misfit_positions is None:
+            self.misfit_positions = np.arange(len(order))
+
+        self.misfit_positions = positions[self.misfit_positions]
+        for directive in getattr(self._directives, "_directive_list", None) or []:
+            if getattr(directive, "joint_index", None) is not None:
+                directive.joint_index = [
+                    int(positions[ind]) for ind in directive.joint_index
+                ]
+
     def run(self):
         """Run inversion from params"""
         sys.stdout = self.logger
@@ -249,6 +268,8 @@ class BaseJointDriver(InversionDriver):
         sys.stdout = self.logger.terminal
         self.logger.log.close()
         self._update_log()
+        TopographyInterpolator.clear_cache()
+        self.close_client()
 
     def validate_create_mesh(self):
         """Function to validate and create the inversion mesh."""
@@ -397,7 +418,10 @@ class BaseJointDriver(InversionDriver):
             ]:
                 directive = getattr(driver_directives, name)
                 if directive is not None:
-                    directive.joint_index = [count + ii for ii in range(n_tiles)]
+                    index = [count + ii for ii in range(n_tiles)]
+                    if self.misfit_positions is not None:
+                        index = [int(self.misfit_positions[ind]) for ind in index]
+                    directive.joint_index = index
                     directives_list.append(directive)
 
             count += n_tiles
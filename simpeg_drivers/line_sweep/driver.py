@@ -12,10 +12,16 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed as as_completed_futures
+from logging import getLogger
 from pathlib import Path
 
 import numpy as np
+from dask.distributed import as_completed as as_completed_dask
+from dask.distributed import worker_client
 from geoapps_utils.param_sweeps.driver import SweepDriver, SweepParams
 from geoapps_utils.param_sweeps.generate import generate
 from geoh5py.data import FilenameData
@@ -24,11 +30,49 @@ from geoh5py.objects import DrapeModel, PotentialElectrode
 from geoh5py.shared.utils import fetch_active_workspace
 from geoh5py.ui_json import InputFile
 from geoh5py.workspace import Workspace
+from threadpoolctl import threadpool_limits
 
 from simpeg_drivers.driver import InversionDriver
 from simpeg_drivers.utils.utils import active_from_xyz, drape_to_octree
 
 
+logger = getLogger(__name__)
+
+
+def run_line(filepath: str | Path, n_threads: int) -> str | Path:
+    """
+    Run the 2D simulation or inversion of a single line.
+
+    :param filepath: Path to the ui.json file of the line.
+    :param n_threads: Number of threads available to the line.
+
+    :return: Path to the ui.json file of the completed line.
+    """
+    ifile = InputFile.read_ui_json(filepath)
+    ifile.data["n_cpu"] = n_threads
+
+    with threadpool_limits(limits=n_threads):
+        InversionDriver.start(ifile)
+
+    return filepath
+
+
+def run_line_task(filepath: str | Path, n_threads: int) -> str | Path:
+    """
+    Run a single line from a dask task.
+
+    The task leaves the thread pool of its worker while the line submits and
+    waits on its own tasks, such that the lines never hold every worker thread.
+
+    :param filepath: Path to the ui.json file of the line.
+    :param n_threads: Number of threads available to the line.
+
+    :return: Path to the ui.json file of the completed line.
+    """
+    with worker_client():
+        return run_line(filepath, n_threads)
+
+
 class LineSweepDriver(SweepDriver, InversionDriver):
     """Line Sweep driver for batch 2D forward and inversion drivers."""
 
@@ -70,12 +114,74 @@ class LineSweepDriver(SweepDriver, InversionDriver):
         return self._out_group
 
     def run(self):  # pylint: disable=W0221
-        super().run()  # pylint: disable=W0221
-        with fetch_active_workspace(self.workspace, mode="r+"):
-            self.collect_results()
+        if self.batch2d_params.compute.n_line_workers > 1:
+            self.run_lines()
+        else:
+            super().run()  # pylint: disable=W0221
+            with fetch_active_workspace(self.workspace, mode="r+"):
+                self.collect_results()
+
         if self.cleanup:
             self.file_cleanup()
 
+    def run_lines(self):
+        """
+        Run the lines concurrently and merge their results as they complete.
+
+        Lines are distributed over the active dask client if available,
+        otherwise over a pool of processes. The CPUs are split evenly between
+        the concurrent lines.
+        """
+        path = Path(self.workspace.h5file).parent
+        files = LineSweepDriver.line_files(str(path))
+        lines = {
+            path / f"{name}.ui.json": line
+            for line, name in files.items()
+            if (path / f"{name}.ui.geoh5").is_file()
+        }
+        n_workers = min(self.batch2d_params.compute.n_line_workers, len(lines))
+        n_cpu = self.batch2d_params.compute.n_cpu or multiprocessing.cpu_count()
+        n_threads = max(n_cpu // max(n_workers, 1), 1)
+        results = {"data": {}, "drape_models": [], "out_lines": [], "log_lines": []}
+
+        if self.client:
+            futures = [
+                self.client.submit(run_line_task, filepath, n_threads, pure=False)
+                for filepath in lines
+            ]
+            completed = (future.result() for future in as_completed_dask(futures))
+            self.collect_completed_lines(completed, lines, files, results)
+            return
+
+        # Spawn the workers to not inherit the geoh5 handles and threads
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(run_line, filepath, n_threads) for filepath in lines
+            ]
+            completed = (future.result() for future in as_completed_futures(futures))
+            self.collect_completed_lines(completed, lines, files, results)
+
+    def collect_completed_lines(
+        self, completed, lines: dict, files: dict, results: dict
+    ):
+        """
+        Merge the results of the lines in their order of completion.
+
+        :param completed: Iterable of ui.json paths of the completed lines.
+        :param lines: Line identifiers keyed by ui.json path.
+        :param files: Line identifiers and their file name.
+        :param results: Data values, drape models and log lines collected so far.
+        """
+        with fetch_active_workspace(self.workspace, mode="r+"):
+            for filepath in completed:
+                line = lines[filepath]
+                self.collect_line_results(line, files, results)
+                logger.info("Collected results of line %s.", line)
+
+            self.merge_results(results)
+
     def setup_params(self):
         h5_file_path = Path(self.workspace.h5file).resolve()
         ui_json_path = h5_file_path.parent / (
@@ -124,128 +230,148 @@ class LineSweepDriver(SweepDriver, InversionDriver):
         return line_files
 
     def collect_results(self):
+        """Merge the results of all lines into the parent workspace."""
         path = Path(self.workspace.h5file).parent
         files = LineSweepDriver.line_files(str(path))
         line_ids = self.batch2d_params.line_selection.line_object.values
-        data = {}
-        drape_models = []
+        results = {"data": {}, "drape_models": [], "out_lines": [], "log_lines": []}
 
-        out_lines = []
-        log_lines = []
         for line in np.unique(line_ids):
-            with Workspace(f"{path / files[line]}.ui.geoh5") as ws:
-                out_group = next(
-                    group for group in ws.groups if isinstance(group, SimPEGGroup)
-                )
-                survey = next(
-                    child
-                    for child in out_group.children
-                    if isinstance(child, PotentialElectrode)
-                )
-                line_data = survey.get_entity(
-                    self.batch2d_params.line_selection.line_object.name
-                )
+            self.collect_line_results(line, files, results)
 
-                if not line_data:
-                    raise ValueError(f"Line {line} not found in {survey.name}")
+        self.merge_results(results)
 
-                line_indices = line_ids == line
-                data = self.collect_line_data(survey, line_indices, data)
-                mesh = next(
-                    child
-                    for child in out_group.children
-                    if isinstance(child, DrapeModel)
-                )
+    def collect_line_results(self, line: int, files: dict, results: dict):
+        """
+        Copy the results of a single line into the parent workspace.
 
-                local_simpeg_group = mesh.parent.copy(
-                    name=f"Line {line}",
-                    parent=self.batch2d_params.out_group,
-                    copy_children=False,
-                )
-                local_simpeg_group.options = mesh.parent.options
-                filedata = [
-                    k for k in out_group.children if isinstance(k, FilenameData)
-                ]
-                for fdat in filedata:
-                    if ".out" in fdat.name:
-                        out_lines += [f"Line {line} from file {files[line]}\n"]
-                        out_lines += fdat.file_bytes.decode(encoding="utf8").split(
-                            sep="\n"
-                        )
-                        out_lines += ["\n"]
-
-                    if ".log" in fdat.name:
-                        log_lines += fdat.file_bytes.decode(encoding="utf8").split(
-                            sep="\n"
-                        )
-                        log_lines += ["\n"]
-
-                    fdat.copy(parent=out_group)
-
-                sub_mesh = mesh.copy(parent=local_simpeg_group)
-                drape_models.append(sub_mesh)
+        :param line: Line identifier.
+        :param files: Line identifiers and their file name.
+        :param results: Data values, drape models and log lines collected so far.
+        """
+        path = Path(self.workspace.h5file).parent
+        line_ids = self.batch2d_params.line_selection.line_object.values
+
+        with Workspace(f"{path / files[line]}.ui.geoh5") as ws:
+            out_group = next(
+                group for group in ws.groups if isinstance(group, SimPEGGroup)
+            )
+            survey = next(
+                child
+                for child in out_group.children
+                if isinstance(child, PotentialElectrode)
+            )
+            line_data = survey.get_entity(
+                self.batch2d_params.line_selection.line_object.name
+            )
+
+            if not line_data:
+                raise ValueError(f"Line {line} not found in {survey.name}")
+
+            line_indices = line_ids == line
+            results["data"] = self.collect_line_data(
+                survey, line_indices, results["data"]
+            )
+            mesh = next(
+                child for child in out_group.children if isinstance(child, DrapeModel)
+            )
+
+            local_simpeg_group = mesh.parent.copy(
+                name=f"Line {line}",
+                parent=self.batch2d_params.out_group,
+                copy_children=False,
+            )
+            local_simpeg_group.options = mesh.parent.options
+            for fdat in out_group.children:
+                if not isinstance(fdat, FilenameData):
+                    continue
+
+                if ".out" in fdat.name:
+                    results["out_lines"].append(
+                        f"Line {line} from file {files[line]}\n"
+                        f"{fdat.file_bytes.decode(encoding='utf8')}\n"
+                    )
+
+                if ".log" in fdat.name:
+                    results["log_lines"].append(
+                        f"{fdat.file_bytes.decode(encoding='utf8')}\n"
+                    )
+
+            sub_mesh = mesh.copy(parent=local_simpeg_group)
+            results["drape_models"].append(sub_mesh)
+
+    def merge_results(self, results: dict):
+        """
+        Write the merged logs and data, and interpolate the drape models on the octree.
+
+        :param results: Data values, drape models and log lines of all lines.
+        """
+        path = Path(self.workspace.h5file).parent
+        drape_models = results["drape_models"]
 
         # Write new log files to disk
-        with open(ws.h5file.parent / "SimPEG.out", "w", encoding="utf8") as f:
-            f.write("".join(out_lines))
+        with open(path / "SimPEG.out", "w", encoding="utf8") as f:
+            f.write("".join(results["out_lines"]))
 
-        with open(ws.h5file.parent / "SimPEG.log", "w", encoding="utf8") as f:
-            f.write("".join(log_lines))
+        with open(path / "SimPEG.log", "w", encoding="utf8") as f:
+            f.write("".join(results["log_lines"]))
 
-        self.batch2d_params.data_object.add_data(data)
+        self.batch2d_params.data_object.add_data(results["data"])
 
         if self.batch2d_params.mesh is None:
             return
 
-        # interpolate drape model children common to all drape models into octree
+        # interpolate drape model children common to all drape models, and the
+        # last iteration of each drape model, into octree in a single pass
         active = active_from_xyz(
-            self.batch2d_params.mesh, self.inversion_topography.locations
-        )
-        common_children = set.intersection(
-            *[{c.name for c in d.children} for d in drape_models]
+            self.batch2d_params.mesh, self.inversion_topography.interpolator
         )
-        children = {n: [n] * len(drape_models) for n in common_children}
-        octree_model = drape_to_octree(
-            self.batch2d_params.mesh, drape_models, children, active, method="nearest"
+        children = self.octree_children(drape_models)
+        octree = self.batch2d_params.mesh.copy(
+            parent=self.batch2d_params.out_group, copy_children=False
         )
+        drape_to_octree(octree, drape_models, children, active, method="nearest")
+
+    @staticmethod
+    def octree_children(drape_models: list[DrapeModel]) -> dict[str, list[str]]:
+        """
+        Names of the drape model children to transfer on the octree.
+
+        :param drape_models: Drape models of all lines.
+
+        :return: Labels on the octree and the associated child name of each drape model.
+        """
+        names = [[child.name for child in model.children] for model in drape_models]
+        common_children = set.intersection(*[set(name) for name in names])
+        children = {name: [name] * len(drape_models) for name in common_children}
 
-        # interpolate last iterations for each drape model into octree
         iter_children = [
-            [c.name for c in m.children if "iteration" in c.name.lower()]
-            for m in drape_models
+            [name for name in model if "iteration" in name.lower()] for model in names
         ]
         if any(iter_children):
-            iter_numbers = [
-                [int(re.findall(r"\d+", n)[0]) for n in k] for k in iter_children
+            last_iterations = [
+                k[int(np.argmax([int(re.findall(r"\d+", n)[0]) for n in k]))]
+                for k in iter_children
             ]
-            last_iterations = [np.where(k == np.max(k))[0][0] for k in iter_numbers]
             label = iter_children[0][0].replace(
                 re.findall(r"\d+", iter_children[0][0])[0], "final"
             )
-            children = {
-                label: [c[last_iterations[i]] for i, c in enumerate(iter_children)]
-            }
-            octree_model = drape_to_octree(
-                self.batch2d_params.mesh,
-                drape_models,
-                children,
-                active,
-                method="nearest",
-            )
+            children[label] = last_iterations
 
-        octree_model.copy(parent=self.batch2d_params.out_group)
+        return children
 
     def collect_line_data(self, survey, line_indices, data):
         """
         Fill chunks of values from one line
         """
-        for child in survey.children:  # initialize data values dictionary
-            if "Iteration" in child.name and child.name not in data:
-                data[child.name] = {"values": np.zeros_like(line_indices) * np.nan}
-
         for child in survey.children:
-            if "Iteration" in child.name:
-                data[child.name]["values"][line_indices] = child.values
+            if "Iteration" not in child.name:
+                continue
+
+            if child.name not in data:
+                data[child.name] = {"values": np.full(line_indices.shape, np.nan)}
+
+            data[child.name]["values"][line_indices] = child.values
 
         return data
 
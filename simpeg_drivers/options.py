@@ -106,14 +106,29 @@ class ComputeOptions(BaseModel):
     """
     Options related to compute resources and parallelization.
 
-    :param distributed_workers: Distributed workers.
+    :param distributed_workers: Address of a running dask scheduler, e.g.
+        'tcp://127.0.0.1:8786', used instead of starting a local cluster.
     :param max_chunk_size: Maximum chunk size used for parallel operations.
-    :param max_ram: Maximum amount of RAM available
+    :param max_ram: Maximum amount of RAM available (Gb). The tiling, storage of
+        sensitivities and number of tile workers are adjusted to fit within it.
     :param n_cpu: Number of CPUs to use for parallel operations.
-    :param n_threads: Number of threads per worker
+    :param n_line_workers: Number of lines of a pseudo 3D run processed
+        concurrently.
+    :param n_threads: Number of threads per worker. The BLAS/OpenMP threads of
+        every thread are limited to its share of 'n_cpu'.
+    :param n_tile_workers: Number of processes used to build the tiles in parallel.
     :param n_workers: Number of distributed workers to use.
     :param performance_report: Generate an HTML report from dask.diagnostics
+    :param rebalance_misfits: Move the misfits between distributed workers after
+        the first iteration, based on their measured timings.
+    :param sensitivity_dtype: Precision of the sensitivities stored by the
+        potential field simulations, else the default of the simulation.
+    :param sounding_batch_size: Number of 1D soundings grouped in a single misfit.
     :param solver_type: Type of solver to use for the inversion.
+    :param tile_cache: Store the tile meshes, maps and projections on disk and
+        re-use them in later runs with the same geometry.
+    :param tile_method: Method used to tile the data, either 'kmeans' for tiles
+        with equal number of data or 'bisection' for tiles of balanced cost.
     :param tile_spatial: Number of tiles to split the data.
     """
 
@@ -121,10 +136,17 @@ class ComputeOptions(BaseModel):
     max_chunk_size: int = 128
     max_ram: float | None = None
     n_cpu: int | None = None
+    n_line_workers: int = 1
     n_threads: int | None = None
+    n_tile_workers: int = 1
     n_workers: int | None = 1
     performance_report: bool = False
+    rebalance_misfits: bool = False
+    sensitivity_dtype: Literal["float32", "float64"] | None = None
+    sounding_batch_size: int = 1
     solver_type: Literal["Pardiso", "Mumps"] = "Pardiso"
+    tile_cache: bool = False
+    tile_method: Literal["kmeans", "bisection"] = "kmeans"
     tile_spatial: int = 1
 
 
@@ -162,6 +184,9 @@ class CoreOptions(Options):
 
     :param out_group: Output group to save results.
     :param generate_sweep: Generate sweep file instead of running the app.
+    :param reuse_data: Reference the normalized data and uncertainties written by
+        a previous run with an identical data selection, instead of writing new
+        copies. Results are written on a copy of the survey geometry only.
     """
 
     # TODO: Refactor to allow frozen True.  Currently params.data_object is
@@ -186,6 +211,7 @@ class CoreOptions(Options):
     compute: ComputeOptions = ComputeOptions()
     out_group: SimPEGGroup | UIJsonGroup | None = None
     generate_sweep: bool = False
+    reuse_data: bool = False
     workspace_geoh5: Path | None = Field(
         default=None,
         exclude=True,
@@ -400,9 +426,16 @@ class DirectiveOptions(BaseModel):
     """
     Directive options for inversion.
 
+    :param async_save: Write the iteration results to geoh5 from a background
+        thread while the inversion carries on.
     :param auto_scale_misfits: Automatically scale misfits of sub objectives.
     :param beta_search: Beta search.
     :param every_iteration_bool: Update the sensitivity weights every iteration.
+    :param resume_from: Checkpoint file, or directory of checkpoints, to resume
+        the inversion from.
+    :param save_checkpoints: Save the state of the inversion at every iteration.
+    :param save_queue_size: Maximum number of iterations pending on the
+        background writer before the inversion waits.
     :param save_sensitivities: Save sensitivities to file.
     :param sens_wts_threshold: Threshold for sensitivity weights.
     """
@@ -410,8 +443,12 @@ class DirectiveOptions(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
+    async_save: bool = False
     auto_scale_misfits: bool = False
     every_iteration_bool: bool = True
+    resume_from: Path | None = None
+    save_checkpoints: bool = False
+    save_queue_size: int = Field(2, ge=1)
     save_sensitivities: bool = False
     sens_wts_threshold: float | None = 1e-0
 
@@ -27,6 +27,7 @@ from trimesh import Trimesh
 from trimesh.proximity import ProximityQuery
 
 from simpeg_drivers.plate_simulation.models.options import PlateOptions
+from simpeg_drivers.utils.topography import TopographyInterpolator
 from simpeg_drivers.utils.utils import active_from_xyz
 
 
@@ -244,4 +245,7 @@ class Boundary(Parametric):
 
         """
 
-        return active_from_xyz(mesh, self.vertical_shift(offset), reference)
+        topography = TopographyInterpolator(
+            self.vertical_shift(offset), key=self.surface.uid
+        )
+        return active_from_xyz(mesh, topography, reference)
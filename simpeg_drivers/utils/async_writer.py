@@ -0,0 +1,192 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from logging import getLogger
+from queue import Full, Queue
+from threading import Thread
+
+import numpy as np
+from simpeg.directives import (
+    InversionDirective,
+    SaveDataGeoH5,
+    SaveSensitivityGeoH5,
+)
+
+
+logger = getLogger(__name__)
+
+
+class GeoH5Writer:
+    """
+    Background thread executing write tasks in submission order.
+
+    The queue is bounded: once `queue_size` tasks are pending, `submit` blocks
+    until the writer catches up. The first error raised by a task is re-raised
+    on the next call to `submit`, `flush` or `close`.
+
+    :param queue_size: Maximum number of pending write tasks.
+    """
+
+    def __init__(self, queue_size: int = 2):
+        if queue_size < 1:
+            raise ValueError("Argument 'queue_size' must be a positive integer.")
+
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._thread: Thread | None = None
+        self._error: Exception | None = None
+
+    def start(self):
+        """Start the writer thread, if not already running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(target=self._run, name="GeoH5Writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+
+                if self._error is None:
+                    func, args = task
+                    func(*args)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to write to geoh5.")
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def raise_error(self):
+        """Re-raise the error of a failed task, if any."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, func: Callable, *args):
+        """
+        Queue a write task, blocking while the queue is full.
+
+        :param func: Function to execute on the writer thread.
+        :param args: Positional arguments passed to the function.
+        """
+        self.raise_error()
+        self.start()
+        try:
+            self._queue.put_nowait((func, args))
+        except Full:
+            logger.info("Waiting on the geoh5 writer to catch up.")
+            self._queue.put((func, args))
+
+    def flush(self):
+        """Block until all pending tasks are written."""
+        if self._thread is not None:
+            self._queue.join()
+
+        self.raise_error()
+
+    def close(self):
+        """Flush pending tasks and stop the writer thread."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+        self._thread = None
+        self.raise_error()
+
+
+class AsyncSaveGeoH5(InversionDirective):
+    """
+    Directive deferring the writes of save directives to a background thread.
+
+    The raw inputs of each directive (model, predicted data or sensitivities)
+    are copied at the end of the iteration, then transformed and written to
+    geoh5 by a single writer thread while the solver carries on. Directives
+    without values of their own (log files, property groups) read the live
+    inversion state, so they run synchronously once the pending writes are
+    done. Initialization writes are done synchronously.
+
+    :param save_directives: Save directives to run asynchronously.
+    :param queue_size: Maximum number of iterations pending on the writer.
+    """
+
+    def __init__(
+        self,
+        save_directives: list[InversionDirective],
+        queue_size: int = 2,
+        **kwargs,
+    ):
+        self.save_directives = save_directives
+        self.writer = GeoH5Writer(queue_size * max(len(save_directives), 1))
+        super().__init__(**kwargs)
+
+    def initialize(self):
+        """Initialize the save directives."""
+        for directive in self.save_directives:
+            directive.inversion = self.inversion
+            directive.initialize()
+
+    def endIter(self):
+        """Snapshot the current values and queue the writes."""
+        for directive in self.save_directives:
+            if getattr(directive, "get_values", None) is None:
+                self.flush()
+                directive.write(self.opt.iter)
+            else:
+                self.writer.submit(
+                    directive.write, self.opt.iter, self.snapshot(directive)
+                )
+
+    def finish(self):
+        """Close the writer before finishing the save directives."""
+        self.close()
+        for directive in self.save_directives:
+            directive.finish()
+
+    def flush(self):
+        """Block until all pending writes are done."""
+        self.writer.flush()
+
+    def close(self):
+        """Write the pending tasks and stop the writer thread."""
+        self.writer.close()
+
+    @staticmethod
+    def snapshot(directive: InversionDirective) -> np.ndarray | list[np.ndarray]:
+        """
+        Copy the raw inputs of a save directive from the current inversion state.
+
+        The inputs are taken before any stacking or transformation, such that
+        writing them applies the transformations of the directive once.
+
+        :param directive: Save directive exposing 'get_values'.
+
+        :return: Copy of the predicted data, the sensitivities or the model.
+        """
+        if isinstance(directive, SaveDataGeoH5):
+            inv_prob = directive.invProb
+            if getattr(inv_prob, "dpred", None) is None:
+                inv_prob.dpred, inv_prob.residuals = inv_prob.get_dpred(
+                    inv_prob.model, return_residuals=True
+                )
+
+            dpred = inv_prob.dpred
+            if directive.joint_index is not None:
+                dpred = [dpred[ind] for ind in directive.joint_index]
+
+            return [np.array(val, copy=True) for val in dpred]
+
+        if isinstance(directive, SaveSensitivityGeoH5):
+            return np.array(directive.get_values(None), copy=True)
+
+        return np.array(directive.invProb.model, copy=True)
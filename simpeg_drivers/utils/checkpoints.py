@@ -0,0 +1,217 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import os
+import re
+from logging import getLogger
+from pathlib import Path
+
+import numpy as np
+from simpeg.directives import InversionDirective, UpdateIRLS
+from simpeg.regularization import Sparse
+
+
+logger = getLogger(__name__)
+
+CHECKPOINT_PATTERN = re.compile(r"iteration_(\d+)\.npz$")
+
+
+def latest_checkpoint(path: str | Path) -> Path | None:
+    """
+    Find the checkpoint of the last good iteration.
+
+    :param path: Checkpoint file, or directory of checkpoint files.
+
+    :return: Path to the last readable checkpoint, or None if not found.
+    """
+    path = Path(path)
+    if path.is_file():
+        return path
+
+    if not path.is_dir():
+        return None
+
+    files = sorted(
+        (
+            file
+            for file in path.iterdir()
+            if CHECKPOINT_PATTERN.search(file.name) is not None
+        ),
+        key=lambda file: int(CHECKPOINT_PATTERN.search(file.name).group(1)),
+    )
+    for file in files[::-1]:
+        try:
+            with np.load(file) as content:
+                if "model" in content:
+                    return file
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable checkpoint %s.", file)
+
+    return None
+
+
+class SaveCheckpoint(InversionDirective):
+    """
+    Directive saving the state of the inversion at the end of every iteration,
+    and restoring it from a previous run at initialization.
+
+    The model, trade-off parameter, IRLS state, sensitivity weights and misfit
+    multipliers are stored in a compact 'iteration_###.npz' file.
+
+    :param path: Directory where the checkpoints are written.
+    :param irls_directive: Directive controlling the IRLS iterations.
+    :param resume_from: Checkpoint file or directory to resume from.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        irls_directive: UpdateIRLS | None = None,
+        resume_from: str | Path | None = None,
+        **kwargs,
+    ):
+        self.path = Path(path)
+        self.irls_directive = irls_directive
+        self.resume_from = resume_from
+        self.iteration_offset = 0
+        super().__init__(**kwargs)
+
+    def initialize(self):
+        """Restore the state from a previous checkpoint, if requested."""
+        if self.resume_from is None:
+            return
+
+        checkpoint = latest_checkpoint(self.resume_from)
+        if checkpoint is None:
+            logger.warning(
+                "No checkpoint found in %s. Starting from the starting model.",
+                self.resume_from,
+            )
+            return
+
+        logger.info("Resuming inversion from checkpoint %s.", checkpoint)
+        with np.load(checkpoint) as content:
+            self.set_state(dict(content))
+
+    def endIter(self):
+        """Write the state of the inversion to file."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        iteration = self.iteration_offset + self.opt.iter
+        file = self.path / f"iteration_{iteration:03d}.npz"
+        temp = file.with_name(f"{file.stem}.tmp.npz")
+        np.savez(temp, **self.get_state())
+        os.replace(temp, file)
+
+    @property
+    def sparse_regularizations(self) -> list[tuple[int, Sparse]]:
+        """Sparse regularizations with their index in the combo objective."""
+        return [
+            (ind, reg)
+            for ind, reg in enumerate(self.reg.objfcts)
+            if isinstance(reg, Sparse)
+        ]
+
+    def get_state(self) -> dict[str, np.ndarray]:
+        """
+        Collect the state of the inversion.
+
+        :return: Dictionary of arrays describing the state.
+        """
+        state = {
+            "model": np.asarray(self.invProb.model),
+            "beta": np.asarray(self.invProb.beta),
+            "iteration": np.asarray(self.iteration_offset + self.opt.iter),
+            "multipliers": np.asarray(self.dmisfit.multipliers, dtype=float),
+        }
+
+        if getattr(self.invProb, "l2model", None) is not None:
+            state["l2model"] = np.asarray(self.invProb.l2model)
+
+        if self.irls_directive is not None:
+            metrics = self.irls_directive.metrics
+            start = metrics.start_irls_iter
+            state["irls_iteration_count"] = np.asarray(metrics.irls_iteration_count)
+            state["start_irls_iter"] = np.asarray(
+                -1 if start is None else self.iteration_offset + start
+            )
+            state["f_old"] = np.asarray(metrics.f_old)
+            state["cooling_factor"] = np.asarray(self.irls_directive.cooling_factor)
+
+            for ind, norms in enumerate(metrics.input_norms or []):
+                for count, norm in enumerate(norms or []):
+                    state[f"input_norms_{ind}_{count}"] = np.asarray(norm)
+
+        for ind, reg in self.sparse_regularizations:
+            for count, (norm, obj) in enumerate(
+                zip(reg.norms, reg.objfcts, strict=True)
+            ):
+                state[f"norms_{ind}_{count}"] = np.asarray(norm)
+                if getattr(obj, "irls_threshold", None) is not None:
+                    state[f"irls_threshold_{ind}_{count}"] = np.asarray(
+                        obj.irls_threshold
+                    )
+                if "sensitivity" in obj.weights_keys:
+                    state[f"sensitivity_{ind}_{count}"] = obj.get_weights("sensitivity")
+
+        return state
+
+    def set_state(self, state: dict[str, np.ndarray]):
+        """
+        Restore the state of the inversion.
+
+        :param state: Dictionary of arrays describing the state.
+        """
+        iteration = int(state["iteration"])
+        self.iteration_offset = iteration
+        self.opt.maxIter = max(self.opt.maxIter - iteration, 1)
+
+        self.invProb.model = state["model"]
+        self.invProb.beta = float(state["beta"])
+        self.dmisfit.multipliers = state["multipliers"]
+
+        if "l2model" in state:
+            self.invProb.l2model = state["l2model"]
+
+        if self.irls_directive is not None and "irls_iteration_count" in state:
+            metrics = self.irls_directive.metrics
+            metrics.irls_iteration_count = int(state["irls_iteration_count"])
+            metrics.f_old = float(state["f_old"])
+            self.irls_directive.cooling_factor = float(state["cooling_factor"])
+
+            # Iterations are counted from zero again by the optimization
+            start = int(state["start_irls_iter"])
+            metrics.start_irls_iter = None if start < 0 else start - iteration
+
+            for ind, reg in self.sparse_regularizations:
+                if f"input_norms_{ind}_0" in state:
+                    norms = [
+                        state[f"input_norms_{ind}_{count}"]
+                        for count in range(len(reg.objfcts))
+                    ]
+                    metrics.input_norms[ind] = [
+                        norm if norm.ndim else float(norm) for norm in norms
+                    ]
+
+        for ind, reg in self.sparse_regularizations:
+            norms = [state[f"norms_{ind}_{count}"] for count in range(len(reg.objfcts))]
+            reg.norms = [norm if norm.ndim else float(norm) for norm in norms]
+            for count, obj in enumerate(reg.objfcts):
+                if f"irls_threshold_{ind}_{count}" in state:
+                    obj.irls_threshold = float(state[f"irls_threshold_{ind}_{count}"])
+                if f"sensitivity_{ind}_{count}" in state:
+                    obj.set_weights(sensitivity=state[f"sensitivity_{ind}_{count}"])
+
+        if (
+            self.irls_directive is not None
+            and self.irls_directive.metrics.start_irls_iter is not None
+        ):
+            self.invProb.phi_m_last = self.reg(self.invProb.model)
@@ -0,0 +1,194 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from logging import getLogger
+
+import numpy as np
+from pydantic import BaseModel
+
+
+logger = getLogger(__name__)
+
+# Bytes per non-zero of a sparse factorization (value and index)
+FACTOR_BYTES = 16
+# Smallest number of data worth a tile of its own
+MIN_TILE_DATA = 100
+
+
+class MemoryPlan(BaseModel):
+    """
+    Execution plan of the data misfit fitting within the memory budget.
+
+    :param tile_spatial: Number of tiles.
+    :param store_sensitivities: Storage of the sensitivities, 'ram' or 'disk'.
+    :param n_tile_workers: Number of tiles built concurrently.
+    :param sensitivity_memory: Sensitivity size of the largest tile (Gb).
+    :param factor_memory: Factorization size of the largest tile (Gb).
+    :param peak_memory: Expected peak memory over all tiles (Gb).
+    :param fits: Whether the peak memory fits within the budget.
+    """
+
+    tile_spatial: int
+    store_sensitivities: str
+    n_tile_workers: int
+    sensitivity_memory: float
+    factor_memory: float
+    peak_memory: float
+    fits: bool
+
+
+class MemoryPlanner:
+    """
+    Estimate the memory of the tiled data misfit before it is built, and find
+    the least intrusive execution plan fitting within the memory budget.
+
+    The local meshes of nested simulations cover the whole domain with coarse
+    cells away from their tile, so the number of cells per tile is assumed to
+    decrease with the square root of the number of tiles. Factorizations of
+    PDE simulations grow as the 4/3 power of the number of cells (nested
+    dissection of 3D meshes).
+
+    Remedies are tried in order: more tiles, sensitivities stored on disk,
+    then tiles built one at a time.
+
+    :param n_data: Total number of data.
+    :param n_cells: Number of active cells of the global mesh.
+    :param max_ram: Memory budget (Gb).
+    :param tile_spatial: Requested number of tiles.
+    :param store_sensitivities: Requested storage of the sensitivities.
+    :param n_tile_workers: Requested number of tiles built concurrently.
+    :param n_mesh_cells: Total number of cells of the global mesh, defaults to
+        the number of active cells.
+    :param itemsize: Number of bytes per sensitivity value.
+    :param max_chunk_size: Size of the sensitivity blocks processed at once (Mb).
+    :param factorization: Whether the simulations factorize a system matrix.
+    :param forward_only: Whether the sensitivities are stored at all.
+    :param allow_disk: Whether the sensitivities may be moved to disk.
+    """
+
+    def __init__(
+        self,
+        n_data: int,
+        n_cells: int,
+        max_ram: float,
+        tile_spatial: int = 1,
+        store_sensitivities: str = "ram",
+        n_tile_workers: int = 1,
+        n_mesh_cells: int | None = None,
+        itemsize: int = 8,
+        max_chunk_size: float = 128,
+        factorization: bool = False,
+        forward_only: bool = False,
+        allow_disk: bool = True,
+    ):
+        self.n_data = n_data
+        self.n_cells = n_cells
+        self.max_ram = max_ram
+        self.tile_spatial = max(tile_spatial, 1)
+        self.store_sensitivities = store_sensitivities
+        self.n_tile_workers = max(n_tile_workers, 1)
+        self.n_mesh_cells = n_cells if n_mesh_cells is None else n_mesh_cells
+        self.itemsize = itemsize
+        self.max_chunk_size = max_chunk_size
+        self.factorization = factorization
+        self.forward_only = forward_only
+        self.allow_disk = allow_disk
+
+    @property
+    def tile_counts(self) -> list[int]:
+        """
+        Candidate numbers of tiles, doubling from the requested count.
+        """
+        max_tiles = max(self.n_data // MIN_TILE_DATA, self.tile_spatial)
+        counts = [self.tile_spatial]
+        while counts[-1] * 2 <= max_tiles:
+            counts.append(counts[-1] * 2)
+
+        return counts
+
+    def estimate(
+        self, tile_spatial: int, store_sensitivities: str, n_tile_workers: int
+    ) -> MemoryPlan:
+        """
+        Estimate the peak memory of an execution plan.
+
+        Every tile holds its stored sensitivities and factorization, while the
+        tiles being built hold an extra copy in flight.
+
+        :param tile_spatial: Number of tiles.
+        :param store_sensitivities: Storage of the sensitivities.
+        :param n_tile_workers: Number of tiles built concurrently.
+
+        :return: Execution plan with its memory estimates.
+        """
+        n_data = np.ceil(self.n_data / tile_spatial)
+        n_cells = self.n_cells / tile_spatial**0.5
+        sensitivity = n_data * n_cells * self.itemsize * 1e-9
+
+        factor = 0.0
+        if self.factorization:
+            n_mesh_cells = self.n_mesh_cells / tile_spatial**0.5
+            factor = n_mesh_cells ** (4.0 / 3.0) * FACTOR_BYTES * 1e-9
+
+        if self.forward_only or store_sensitivities == "disk":
+            stored = 0.0
+            in_flight = min(sensitivity, self.max_chunk_size * 1e-3)
+        else:
+            stored = sensitivity
+            in_flight = sensitivity
+
+        peak = tile_spatial * (stored + factor) + n_tile_workers * (in_flight + factor)
+
+        return MemoryPlan(
+            tile_spatial=tile_spatial,
+            store_sensitivities=store_sensitivities,
+            n_tile_workers=n_tile_workers,
+            sensitivity_memory=float(sensitivity),
+            factor_memory=float(factor),
+            peak_memory=float(peak),
+            fits=bool(peak <= self.max_ram),
+        )
+
+    def plan(self) -> MemoryPlan:
+        """
+        Find the first execution plan fitting within the memory budget.
+
+        :return: The fitting plan, or the most conservative one if none fits.
+        """
+        storages = [self.store_sensitivities]
+        if (
+            self.store_sensitivities == "ram"
+            and self.allow_disk
+            and not self.forward_only
+        ):
+            storages.append("disk")
+
+        workers = [self.n_tile_workers]
+        if self.n_tile_workers > 1:
+            workers.append(1)
+
+        plan = None
+        for n_tile_workers in workers:
+            for storage in storages:
+                for count in self.tile_counts:
+                    plan = self.estimate(count, storage, n_tile_workers)
+                    if plan.fits:
+                        return plan
+
+        logger.warning(
+            "No execution plan fits within max_ram=%.2f Gb. "
+            "Using %i tile(s) with an estimated peak memory of %.2f Gb.",
+            self.max_ram,
+            plan.tile_spatial,
+            plan.peak_memory,
+        )
+        return plan
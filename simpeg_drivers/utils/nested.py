@@ -15,6 +15,8 @@ from pathlib import Path
 
 import numpy as np
 from discretize import TensorMesh, TreeMesh
+from pydantic import BaseModel
+from pymatsolver.direct import Pardiso
 from scipy.optimize import linear_sum_assignment
 from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
@@ -36,12 +38,94 @@ from simpeg.electromagnetics.time_domain.sources import LineCurrent as TEMLineCu
 from simpeg.simulation import BaseSimulation
 from simpeg.survey import BaseSurvey
 
+from simpeg_drivers.utils.sensitivity_store import validate_sensitivity_store
 from simpeg_drivers.utils.surveys import (
     compute_dc_projections,
     compute_em_projections,
     get_intersecting_cells,
     get_unique_locations,
 )
+from simpeg_drivers.utils.tile_cache import TileCache, hash_arrays
+
+
+class ComputePolicy(BaseModel):
+    """
+    Compute settings shared by the global simulation and all its local simulations.
+
+    :param max_chunk_size: Maximum chunk size used for parallel operations.
+    :param store_sensitivities: Storage of the sensitivities, either 'ram', 'disk'
+        or 'forward_only'.
+    :param sensitivity_dtype: Precision of the stored sensitivities, if supported
+        by the simulation.
+    :param solver: Direct solver class of PDE simulations.
+    :param n_threads: Number of threads used by the solver.
+    :param sensitivity_path: Path to the on-disk sensitivities of the global
+        simulation, if supported by the simulation.
+    """
+
+    max_chunk_size: int | None = None
+    store_sensitivities: str | None = None
+    sensitivity_dtype: str | None = None
+    solver: type | None = None
+    n_threads: int | None = None
+    sensitivity_path: Path | None = None
+
+    @classmethod
+    def from_simulation(cls, simulation: BaseSimulation) -> ComputePolicy:
+        """
+        Policy of a simulation, or read from its attributes if it has none.
+
+        :param simulation: SimPEG simulation.
+        """
+        policy = getattr(simulation, "compute_policy", None)
+        if isinstance(policy, cls):
+            return policy
+
+        dtype = getattr(simulation, "sensitivity_dtype", None)
+        path = getattr(simulation, "sensitivity_path", None)
+        return cls(
+            max_chunk_size=getattr(simulation, "max_chunk_size", None),
+            store_sensitivities=getattr(simulation, "store_sensitivities", None),
+            sensitivity_dtype=None if dtype is None else np.dtype(dtype).name,
+            solver=getattr(simulation, "solver", None),
+            sensitivity_path=None if path is None else Path(path),
+        )
+
+    def simulation_kwargs(self) -> dict:
+        """
+        Keyword arguments of a simulation following the policy.
+        """
+        kwargs = {
+            "max_chunk_size": self.max_chunk_size,
+            "store_sensitivities": self.store_sensitivities,
+            "solver": self.solver,
+        }
+        if self.sensitivity_dtype is not None:
+            kwargs["sensitivity_dtype"] = np.dtype(self.sensitivity_dtype).type
+
+        if self.solver is not None and self.n_threads is not None:
+            if issubclass(self.solver, Pardiso):
+                kwargs["solver_opts"] = {"n_threads": self.n_threads}
+
+        return {key: value for key, value in kwargs.items() if value is not None}
+
+    def tile_sensitivity_path(self, tile_id: int | None) -> Path:
+        """
+        Path to the on-disk sensitivities of a tile, next to the global ones.
+
+        The precision of the sensitivities is recorded in the name, if defined, so
+        that stores of different precisions are never mixed.
+
+        :param tile_id: Tile id of the local simulation.
+        """
+        if self.sensitivity_path is None:
+            raise ValueError("The policy has no path to on-disk sensitivities.")
+
+        name = f"Tile{tile_id}"
+        if self.sensitivity_dtype is not None:
+            name += f"_{self.sensitivity_dtype}"
+
+        return self.sensitivity_path.parent / f"{name}.zarr"
 
 
 def create_mesh(
@@ -73,14 +157,6 @@ def create_mesh(
         x0=base_mesh.x0,
         diagonal_balance=False,
     )
-    base_level = base_mesh.max_level - minimum_level
-    base_refinement = base_mesh.cell_levels_by_index(np.arange(base_mesh.nC))
-    base_refinement[base_refinement > base_level] = base_level
-    nested_mesh.insert_cells(
-        base_mesh.gridCC,
-        base_refinement,
-        finalize=False,
-    )
     base_cell = np.min([base_mesh.h[0][0], base_mesh.h[1][0]])
     tx_loops = []
     for source in survey.source_list:
@@ -91,19 +167,29 @@ def create_mesh(
     if tx_loops:
         locations = np.vstack([locations, *tx_loops])
 
+    # Outer radius of each concentric shell of padding cells
+    pad_distances = padding_distances(base_cell, padding_cells, minimum_level)
+
+    # Only query the cells within reach of the survey
+    cell_centers = base_mesh.cell_centers
+    in_box = np.all(
+        (cell_centers[:, :2] > locations[:, :2].min(axis=0) - pad_distances[-1])
+        & (cell_centers[:, :2] < locations[:, :2].max(axis=0) + pad_distances[-1]),
+        axis=1,
+    )
+    rad = np.full(base_mesh.n_cells, np.inf)
     tree = cKDTree(locations[:, :2])
-    rad, _ = tree.query(base_mesh.gridCC[:, :2])
-    pad_distance = 0.0
-    for ii in range(minimum_level):
-        pad_distance += base_cell * 2**ii * padding_cells
-        indices = np.where(rad < pad_distance)[0]
-        levels = base_mesh.cell_levels_by_index(indices)
-        levels[levels > (base_mesh.max_level - ii)] = base_mesh.max_level - ii
-        nested_mesh.insert_cells(
-            base_mesh.gridCC[indices, :],
-            levels,
-            finalize=False,
-        )
+    rad[in_box], _ = tree.query(
+        cell_centers[in_box, :2], distance_upper_bound=pad_distances[-1]
+    )
+
+    # Finest level allowed per cell, based on the first shell it falls in
+    shell = np.searchsorted(pad_distances, rad, side="right")
+    levels = np.minimum(
+        base_mesh.cell_levels_by_index(np.arange(base_mesh.n_cells)),
+        base_mesh.max_level - shell,
+    )
+    nested_mesh.insert_cells(cell_centers, levels, finalize=False)
 
     if finalize:
         nested_mesh.finalize()
@@ -120,6 +206,7 @@ def create_misfit(
     padding_cells,
     inversion_type,
     forward_only,
+    cache: TileCache | None = None,
 ):
     """
     Create a list of local misfits based on the local indices.
@@ -136,9 +223,20 @@ def create_misfit(
     :param padding_cells: Number of padding cells around the local survey.
     :param inversion_type: Type of inversion, used to name the misfit (joint inversion).
     :param forward_only: If False, data is transferred to the local simulation.
+    :param cache: Cache of tile meshes, maps and projections, if used.
 
     :return: List of local misfits and data slices.
     """
+    if isinstance(simulation, BaseEM1DSimulation):
+        return create_sounding_misfit(
+            simulation,
+            local_indices,
+            channel,
+            tile_count,
+            inversion_type,
+            forward_only,
+        )
+
     local_sim, _, _ = create_simulation(
         simulation,
         None,
@@ -146,6 +244,7 @@ def create_misfit(
         channel=channel,
         tile_id=tile_count,
         padding_cells=padding_cells,
+        cache=cache,
     )
 
     local_mesh = getattr(local_sim, "mesh", None)
@@ -159,7 +258,13 @@ def create_misfit(
             channel=channel,
             tile_id=tile_count,
             padding_cells=padding_cells,
+            cache=cache,
         )
+        if getattr(local_sim, "store_sensitivities", None) == "disk" and hasattr(
+            local_sim, "sensitivity_dtype"
+        ):
+            validate_sensitivity_store(local_sim)
+
         meta_simulation = meta.MetaSimulation(
             simulations=[local_sim], mappings=[mapping]
         )
@@ -184,6 +289,64 @@ def create_misfit(
     return local_misfits, data_slices
 
 
+def create_sounding_misfit(
+    simulation: BaseEM1DSimulation,
+    local_indices: np.ndarray,
+    channel: float | None,
+    tile_count: int,
+    inversion_type: str,
+    forward_only: bool,
+):
+    """
+    Create a single misfit for a batch of 1D soundings.
+
+    Each sounding keeps its own 1D simulation and model projection, but all of
+    them are wrapped in one MetaSimulation with a block-diagonal Jacobian, such
+    that the number of misfit objects scales with the number of batches
+    instead of the number of soundings.
+
+    :param simulation: Global 1D SimPEG simulation.
+    :param local_indices: Indices of the soundings belonging to the batch.
+    :param channel: Channel of the simulation, for frequency systems only.
+    :param tile_count: Index of the first sounding of the batch.
+    :param inversion_type: Type of inversion, used to name the misfit.
+    :param forward_only: If False, data is transferred to the local simulation.
+
+    :return: List of one local misfit and the data slice of the batch.
+    """
+    simulations, mappings, data_slices = [], [], []
+    for offset, index in enumerate(local_indices):
+        local_sim, mapping, data_slice = create_simulation(
+            simulation,
+            simulation.layers_mesh,
+            np.r_[index],
+            channel=channel,
+            tile_id=tile_count + offset,
+        )
+        simulations.append(local_sim)
+        mappings.append(mapping)
+        data_slices.append(data_slice)
+
+    meta_simulation = meta.MetaSimulation(simulations=simulations, mappings=mappings)
+    local_data = data.Data(meta_simulation.survey)
+    lmisfit = data_misfit.L2DataMisfit(local_data, meta_simulation)
+
+    if not forward_only:
+        local_data.dobs = np.hstack([sim.survey.dobs for sim in simulations])
+        local_data.standard_deviation = np.hstack(
+            [sim.survey.std for sim in simulations]
+        )
+        name = f"{inversion_type}: Tile {tile_count + 1}"
+        if len(local_indices) > 1:
+            name += f"-{tile_count + len(local_indices)}"
+        if channel is not None:
+            name += f": Channel {channel}"
+
+        lmisfit.name = name
+
+    return [lmisfit], [np.vstack(data_slices)]
+
+
 def create_simulation(
     simulation: BaseSimulation,
     local_mesh: TreeMesh | None,
@@ -192,6 +355,7 @@ def create_simulation(
     channel: int | None = None,
     tile_id: int | None = None,
     padding_cells=100,
+    cache: TileCache | None = None,
 ):
     """
     Generate a survey, mesh and simulation based on indices.
@@ -202,20 +366,23 @@ def create_simulation(
     :param channel: Channel of the simulation, for frequency simulations only.
     :param tile_id: Tile id stored on the simulation.
     :param padding_cells: Number of padding cells around the local survey.
+    :param cache: Cache of tile meshes, maps and projections from previous runs.
 
     :return: Local simulation, mapping and local ordering.
     """
     local_survey, local_ordering = create_survey(
         simulation.survey, indices=indices, channel=channel
     )
-    kwargs = {"survey": local_survey}
+    policy = ComputePolicy.from_simulation(simulation)
+    kwargs = {"survey": local_survey, **policy.simulation_kwargs()}
 
     if local_mesh is None:
-        local_mesh = create_mesh(
+        local_mesh = create_cached_mesh(
             local_survey,
             simulation.mesh,
-            minimum_level=3,
+            indices,
             padding_cells=padding_cells,
+            cache=cache,
         )
 
     args = (local_mesh,)
@@ -230,13 +397,7 @@ def create_simulation(
         args = ()
 
     elif isinstance(local_mesh, TreeMesh):
-        mapping = maps.TileMap(
-            simulation.mesh,
-            simulation.active_cells,
-            local_mesh,
-            enforce_active=True,
-            components=3 if getattr(simulation, "model_type", None) == "vector" else 1,
-        )
+        mapping = create_tile_map(simulation, local_mesh, cache=cache)
         actives = mapping.local_active
     # For DCIP-2D
     else:
@@ -252,16 +413,10 @@ def create_simulation(
             kwargs["chiMap"] = maps.IdentityMap(nP=n_actives)
 
         kwargs["active_cells"] = actives
-        kwargs["sensitivity_path"] = (
-            Path(simulation.sensitivity_path).parent / f"Tile{tile_id}.zarr"
-        )
 
     if getattr(simulation, "_rhoMap", None) is not None:
         kwargs["rhoMap"] = maps.IdentityMap(nP=n_actives)
         kwargs["active_cells"] = actives
-        kwargs["sensitivity_path"] = (
-            Path(simulation.sensitivity_path).parent / f"Tile{tile_id}.zarr"
-        )
 
     if getattr(simulation, "_sigmaMap", None) is not None:
         kwargs["sigmaMap"] = maps.ExpMap(local_mesh) * maps.InjectActiveCells(
@@ -277,27 +432,212 @@ def create_simulation(
         )
         kwargs["sigma"] = proj * mapping * simulation.sigma[simulation.active_cells]
 
-    for key in [
-        "max_chunk_sizestore_sensitivities",
-        "solver",
-        "t0",
-        "time_steps",
-        "thicknesses",
-    ]:
+    for key in ["t0", "time_steps", "thicknesses"]:
         if hasattr(simulation, key):
             kwargs[key] = getattr(simulation, key)
 
+    # Every tile writes its sensitivities to its own store
+    if policy.sensitivity_path is not None:
+        kwargs["sensitivity_path"] = str(policy.tile_sensitivity_path(tile_id))
+
     local_sim = type(simulation)(*args, **kwargs)
+    local_sim.compute_policy = policy
+    compute_projections(simulation, local_sim, indices, channel=channel, cache=cache)
+
+    return local_sim, mapping, local_ordering
+
+
+def get_sensitivity_path(simulation: BaseSimulation, tile_id: int | None) -> Path:
+    """
+    Path to the on-disk sensitivities of a tile, next to the global ones.
+
+    The precision of the sensitivities is recorded in the name, if defined, so that
+    stores of different precisions are never mixed.
+
+    :param simulation: Global SimPEG simulation.
+    :param tile_id: Tile id of the local simulation.
+
+    :return: Path to the zarr store of the tile.
+    """
+    return ComputePolicy.from_simulation(simulation).tile_sensitivity_path(tile_id)
+
+
+def source_locations(survey: BaseSurvey) -> list[np.ndarray]:
+    """
+    Locations of the sources of a survey, including the paths of line currents.
+
+    :param survey: SimPEG survey object.
+
+    :return: List of arrays of source locations.
+    """
+    return [
+        np.asarray(source.location, dtype=float)
+        for source in survey.source_list
+        if getattr(source, "location", None) is not None
+    ]
+
+
+def receiver_layout(survey: BaseSurvey) -> list:
+    """
+    Type, orientation and component of the receivers of a survey, in the order
+    of their stored projections.
+
+    :param survey: SimPEG survey object.
+
+    :return: Flat list of the receiver attributes.
+    """
+    return [
+        value
+        for source in survey.source_list
+        for receiver in source.receiver_list
+        for value in (
+            type(receiver).__name__,
+            getattr(receiver, "orientation", None),
+            getattr(receiver, "component", None),
+        )
+    ]
+
+
+def create_cached_mesh(
+    survey: BaseSurvey,
+    base_mesh: TreeMesh | TensorMesh,
+    indices: np.ndarray,
+    padding_cells: int = 8,
+    minimum_level: int = 3,
+    cache: TileCache | None = None,
+) -> TreeMesh | TensorMesh:
+    """
+    Load the nested mesh of a tile from the cache, or create and store it.
+
+    :param survey: Local SimPEG survey object.
+    :param base_mesh: Input global mesh.
+    :param indices: Indices of receivers belonging to the tile.
+    :param padding_cells: Number of cells in each concentric shell.
+    :param minimum_level: Minimum octree level to preserve outside the local survey.
+    :param cache: Cache of tile meshes, if used.
+
+    :return: A finalized nested mesh.
+    """
+    if cache is None or not isinstance(base_mesh, TreeMesh):
+        return create_mesh(
+            survey,
+            base_mesh,
+            minimum_level=minimum_level,
+            padding_cells=padding_cells,
+        )
+
+    key = hash_arrays(
+        cache.mesh_hash(base_mesh),
+        indices,
+        get_unique_locations(survey),
+        *source_locations(survey),
+        padding_cells,
+        minimum_level,
+    )
+    local_mesh = cache.load_mesh(key, base_mesh)
+
+    if local_mesh is None:
+        local_mesh = create_mesh(
+            survey,
+            base_mesh,
+            minimum_level=minimum_level,
+            padding_cells=padding_cells,
+        )
+        cache.save_mesh(key, local_mesh)
+
+    return local_mesh
+
+
+def create_tile_map(
+    simulation: BaseSimulation,
+    local_mesh: TreeMesh,
+    cache: TileCache | None = None,
+) -> maps.TileMap:
+    """
+    Load the TileMap between the global and local meshes from the cache,
+    or create and store it.
+
+    :param simulation: Global SimPEG simulation.
+    :param local_mesh: Local TreeMesh of the tile.
+    :param cache: Cache of tile maps, if used.
+
+    :return: TileMap from the global to the local active cells.
+    """
+    kwargs = {
+        "enforce_active": True,
+        "components": 3 if getattr(simulation, "model_type", None) == "vector" else 1,
+    }
+
+    if cache is None:
+        return maps.TileMap(
+            simulation.mesh, simulation.active_cells, local_mesh, **kwargs
+        )
+
+    key = hash_arrays(
+        cache.mesh_hash(simulation.mesh),
+        simulation.active_cells,
+        cache.mesh_hash(local_mesh),
+        kwargs["components"],
+    )
+    mapping = cache.load_tile_map(
+        key, simulation.mesh, simulation.active_cells, local_mesh, **kwargs
+    )
+
+    if mapping is None:
+        mapping = maps.TileMap(
+            simulation.mesh, simulation.active_cells, local_mesh, **kwargs
+        )
+        cache.save_tile_map(key, mapping)
+
+    return mapping
+
 
+def compute_projections(
+    simulation: BaseSimulation,
+    local_sim: BaseSimulation,
+    indices: np.ndarray,
+    channel: int | None = None,
+    cache: TileCache | None = None,
+):
+    """
+    Assign pre-computed receiver projections of EM and DC simulations, from the
+    cache if available.
+
+    :param simulation: Global SimPEG simulation.
+    :param local_sim: Local SimPEG simulation of the tile.
+    :param indices: Indices of receivers belonging to the tile.
+    :param channel: Channel of the simulation, for frequency simulations only.
+    :param cache: Cache of receiver projections, if used.
+    """
     if isinstance(
         simulation, BaseFDEMSimulation | BaseTDEMSimulation
     ) and not isinstance(simulation, Simulation3DPrimarySecondary):
-        compute_em_projections(simulation.survey.locations, local_sim)
+        cells = None
     elif isinstance(simulation, Simulation3DRes | Simulation3DIP):
-        compute_dc_projections(
-            simulation.survey.locations, simulation.survey.cells, local_sim
+        cells = simulation.survey.cells
+    else:
+        return
+
+    key = None
+    if cache is not None:
+        key = hash_arrays(
+            cache.mesh_hash(local_sim.mesh),
+            indices,
+            channel,
+            simulation.survey.locations,
+            cells,
+            *receiver_layout(local_sim.survey),
         )
-    return local_sim, mapping, local_ordering
+        if cache.load_projections(key, local_sim.survey):
+            return
+
+    if cells is None:
+        compute_em_projections(simulation.survey.locations, local_sim)
+    else:
+        compute_dc_projections(simulation.survey.locations, cells, local_sim)
+
+    if cache is not None:
+        cache.save_projections(key, local_sim.survey)
 
 
 def create_survey(survey, indices, channel=None):
@@ -370,29 +710,65 @@ def tile_locations(
     n_tiles: int,
     labels: np.ndarray | None = None,
     sorting: np.ndarray | None = None,
+    method: str = "kmeans",
+    padding_cells: int = 0,
+    cell_size: float = 1.0,
+    minimum_level: int = 3,
 ) -> list[np.ndarray]:
     """
     Function to tile a survey points into smaller square subsets of points using
-    a k-means clustering approach.
+    a k-means clustering approach, or a recursive bisection balancing the cost
+    of the tiles.
 
     If labels are provided and the number of unique labels is less than or equal to
     the number of tiles, the function will return an even split of the unique labels.
+    With fewer labels than tiles, the bisection keeps the points of a label
+    together and bisects within every label.
 
     :param locations: Array of locations.
     :param n_tiles: Number of tiles (for 'cluster')
     :param labels: Array of values to append to the locations
     :param sorting: Array of indices to sort the locations before clustering.
+    :param method: Tiling method, either 'kmeans' for tiles with equal number of
+        points or 'bisection' for tiles of balanced cost.
+    :param padding_cells: Number of cells in each concentric shell of the local
+        meshes, for 'bisection' only.
+    :param cell_size: Horizontal size of the smallest cells, for 'bisection' only.
+    :param minimum_level: Minimum octree level of the local meshes, for
+        'bisection' only.
 
     :return: List of arrays containing the indices of the points in each tile.
     """
     grid_locs = locations[:, :2].copy()
 
-    if labels is not None:
-        if len(labels) != grid_locs.shape[0]:
-            raise ValueError(
-                "Labels array must have the same length as the locations array."
-            )
+    if labels is not None and len(labels) != grid_locs.shape[0]:
+        raise ValueError(
+            "Labels array must have the same length as the locations array."
+        )
+
+    if method == "bisection":
+        if labels is not None and len(np.unique(labels)) >= n_tiles:
+            return tile_locations(locations, n_tiles, labels=labels, sorting=sorting)
+
+        if sorting is not None:
+            grid_locs = grid_locs[sorting, :]
+            labels = None if labels is None else np.asarray(labels)[sorting]
+
+        return bisect_locations(
+            grid_locs,
+            n_tiles,
+            labels=labels,
+            padding_cells=padding_cells,
+            cell_size=cell_size,
+            minimum_level=minimum_level,
+        )
+
+    if method != "kmeans":
+        raise ValueError(
+            f"Tiling method must be 'kmeans' or 'bisection', not {method}."
+        )
 
+    if labels is not None:
         if len(np.unique(labels)) >= n_tiles:
             label_groups = np.array_split(np.unique(labels), n_tiles)
             return [np.where(np.isin(labels, group))[0] for group in label_groups]
@@ -434,3 +810,127 @@ def tile_locations(
         tiles += [np.where(cluster_id == tid)[0]]
 
     return tiles
+
+
+def padding_distances(
+    cell_size: float, padding_cells: int, minimum_level: int
+) -> np.ndarray:
+    """
+    Outer radius of each concentric shell of padding cells of a nested mesh.
+
+    The cells of shell 'i' are 2**i times the size of the smallest cells.
+
+    :param cell_size: Horizontal size of the smallest cells.
+    :param padding_cells: Number of cells in each concentric shell.
+    :param minimum_level: Number of shells, down to the minimum octree level.
+
+    :return: Array of distances from the survey, one per shell.
+    """
+    widths = cell_size * 2 ** np.arange(minimum_level) * padding_cells
+    return np.cumsum(widths).astype(float)
+
+
+def tile_costs(
+    locations: np.ndarray,
+    padding_cells: int = 0,
+    cell_size: float = 1.0,
+    minimum_level: int = 3,
+) -> np.ndarray:
+    """
+    Estimated cost of the tiles formed by all prefixes of an array of locations.
+
+    The cost is the number of data times the number of cells of the local mesh,
+    approximated by the footprint of the locations padded by the concentric
+    shells of coarsening cells of :func:`create_mesh`.
+
+    :param locations: Array of horizontal locations, in order.
+    :param padding_cells: Number of cells in each concentric shell.
+    :param cell_size: Horizontal size of the smallest cells.
+    :param minimum_level: Number of shells, down to the minimum octree level.
+
+    :return: Cost of the tile made of the first n locations, for every n.
+    """
+    extent = np.maximum.accumulate(locations, axis=0) - np.minimum.accumulate(
+        locations, axis=0
+    )
+    n_cells = 1.0 + np.prod(extent / cell_size, axis=1)
+    inner = np.prod(extent, axis=1)
+    for level, distance in enumerate(
+        padding_distances(cell_size, padding_cells, minimum_level)
+    ):
+        outer = np.prod(extent + 2.0 * distance, axis=1)
+        n_cells += (outer - inner) / (cell_size * 2**level) ** 2
+        inner = outer
+
+    return np.arange(1, locations.shape[0] + 1) * n_cells
+
+
+def bisect_locations(
+    locations: np.ndarray,
+    n_tiles: int,
+    labels: np.ndarray | None = None,
+    padding_cells: int = 0,
+    cell_size: float = 1.0,
+    minimum_level: int = 3,
+) -> list[np.ndarray]:
+    """
+    Tile locations by recursive bisection, balancing the estimated cost of the tiles.
+
+    Each group is split across its longest horizontal axis, at the position
+    minimizing the largest cost per tile on either side. The cost of all
+    candidate splits is computed from cumulative extents, for an overall
+    O(n log n) complexity.
+
+    With labels, the tiles are first allotted to the labels by their cost, and
+    every label is bisected on its own, such that no tile spans two labels.
+
+    :param locations: Array of horizontal locations.
+    :param n_tiles: Number of tiles.
+    :param labels: Label of every location, with fewer unique labels than tiles.
+    :param padding_cells: Number of cells in each concentric shell.
+    :param cell_size: Horizontal size of the smallest cells.
+    :param minimum_level: Number of shells, down to the minimum octree level.
+
+    :return: List of arrays containing the indices of the points in each tile.
+    """
+    padding = {
+        "padding_cells": padding_cells,
+        "cell_size": cell_size,
+        "minimum_level": minimum_level,
+    }
+    if labels is None:
+        groups = [(np.arange(locations.shape[0]), n_tiles)]
+    else:
+        indices = [np.where(labels == label)[0] for label in np.unique(labels)]
+        costs = np.array([tile_costs(locations[ind], **padding)[-1] for ind in indices])
+        counts = np.ones(len(indices), dtype=int)
+        for _ in range(n_tiles - len(indices)):
+            counts[np.argmax(costs / counts)] += 1
+
+        groups = list(zip(indices, counts, strict=True))[::-1]
+
+    tiles = []
+    while groups:
+        indices, count = groups.pop()
+        if count == 1 or len(indices) <= count:
+            tiles += np.array_split(indices, min(count, len(indices)))
+            continue
+
+        group_locs = locations[indices]
+        axis = np.argmax(np.ptp(group_locs, axis=0))
+        order = np.argsort(group_locs[:, axis], kind="stable")
+        group_locs = group_locs[order]
+
+        n_left = count // 2
+        n_right = count - n_left
+        left_costs = tile_costs(group_locs, **padding)[:-1] / n_left
+        right_costs = tile_costs(group_locs[::-1], **padding)[::-1][1:] / n_right
+        costs = np.maximum(left_costs, right_costs)
+
+        # Leave at least one point per tile on each side
+        split = n_left + int(np.argmin(costs[n_left - 1 : len(indices) - n_right]))
+
+        groups.append((indices[order[split:]], n_right))
+        groups.append((indices[order[:split]], n_left))
+
+    return tiles
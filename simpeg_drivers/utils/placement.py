@@ -0,0 +1,262 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import heapq
+from itertools import zip_longest
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+import numpy as np
+from dask.distributed import wait
+from simpeg.directives import InversionDirective
+from simpeg.meta import MetaSimulation
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from dask.distributed import Client, Future
+    from simpeg.objective_function import BaseObjectiveFunction
+
+
+logger = getLogger(__name__)
+
+
+def misfit_cost(misfit: BaseObjectiveFunction) -> float:
+    """
+    Estimated cost of a misfit, as the number of sensitivity values of its
+    local simulations.
+
+    :param misfit: Local data misfit.
+
+    :return: Number of data times number of local active cells.
+    """
+    simulation = misfit.simulation
+    if isinstance(simulation, MetaSimulation):
+        return float(
+            sum(
+                sim.survey.nD * mapping.shape[0]
+                for sim, mapping in zip(
+                    simulation.simulations, simulation.mappings, strict=True
+                )
+            )
+        )
+
+    return float(misfit.nD * misfit.nP)
+
+
+def place_misfits(costs: list[float] | np.ndarray, workers: list[str]) -> list[str]:
+    """
+    Bin-pack misfits onto workers, assigning the most expensive misfits first to
+    the least loaded worker.
+
+    Every worker receives the same number of misfits as with a round-robin
+    placement, as DaskComboMisfits evaluates the misfits in rounds of one misfit
+    per worker. Leftover misfits go to the first workers, in a last short round.
+
+    :param costs: Cost of every misfit.
+    :param workers: Addresses of the workers.
+
+    :return: Address of the worker assigned to every misfit.
+    """
+    n_rounds, n_left = divmod(len(costs), len(workers))
+    capacities = [n_rounds + int(ind < n_left) for ind in range(len(workers))]
+    counts = [0] * len(workers)
+    loads = [(0.0, ind) for ind, capacity in enumerate(capacities) if capacity > 0]
+    placement = [""] * len(costs)
+    for ind in np.argsort(costs, kind="stable")[::-1]:
+        load, worker = heapq.heappop(loads)
+        placement[ind] = workers[worker]
+        counts[worker] += 1
+        if counts[worker] < capacities[worker]:
+            heapq.heappush(loads, (load + float(costs[ind]), worker))
+
+    return placement
+
+
+def round_order(placement: list[str], workers: list[str]) -> np.ndarray:
+    """
+    Order in which DaskComboMisfits evaluates the misfits, one misfit per worker
+    and per round. Workers holding fewer misfits are skipped in the last rounds.
+
+    :param placement: Address of the worker assigned to every misfit.
+    :param workers: Addresses of the workers, in their order within a round.
+
+    :return: Indices of the misfits, round after round. With the counts of
+        :func:`place_misfits`, the misfit at position 'i' is placed on worker
+        'i % len(workers)'.
+    """
+    queues = [
+        [ind for ind, address in enumerate(placement) if address == worker]
+        for worker in workers
+    ]
+    return np.asarray(
+        [
+            ind
+            for misfits in zip_longest(*queues, fillvalue=None)
+            for ind in misfits
+            if ind is not None
+        ],
+        dtype=int,
+    )
+
+
+def misfit_rows(sizes: list[int], order: np.ndarray) -> np.ndarray:
+    """
+    Rows of the stacked data of the misfits, re-ordered along with the misfits.
+
+    :param sizes: Number of data of every misfit.
+    :param order: New order of the misfits.
+    """
+    offsets = np.r_[0, np.cumsum(sizes)].astype(int)
+    return np.hstack(
+        [np.arange(offsets[ind], offsets[ind + 1]) for ind in order]
+    ).astype(int)
+
+
+def worker_loads(costs: list[float] | np.ndarray, placement: list[str]) -> dict:
+    """
+    Total cost of the misfits placed on every worker.
+
+    :param costs: Cost of every misfit.
+    :param placement: Address of the worker assigned to every misfit.
+    """
+    loads: dict[str, float] = {}
+    for cost, worker in zip(costs, placement, strict=True):
+        loads[worker] = loads.get(worker, 0.0) + float(cost)
+
+    return loads
+
+
+def scatter_misfits(
+    client: Client, misfits: list[BaseObjectiveFunction], placement: list[str]
+) -> list[Future]:
+    """
+    Send every misfit to its assigned worker.
+
+    :param client: Dask client.
+    :param misfits: Local data misfits.
+    :param placement: Address of the worker assigned to every misfit.
+
+    :return: Futures of the misfits.
+    """
+    return [
+        client.scatter(misfit, workers=[worker], hash=False)
+        for misfit, worker in zip(misfits, placement, strict=True)
+    ]
+
+
+def misfit_time(misfit: BaseObjectiveFunction) -> float:
+    """
+    Wall-time spent by a misfit in its evaluations, derivatives and Hessian
+    products, as recorded by its SimPEG counter.
+
+    :param misfit: Local data misfit.
+    """
+    counter = getattr(misfit, "counter", None)
+    if counter is None:
+        return 0.0
+
+    timings = counter._timeList.values()  # pylint: disable=protected-access
+    return float(sum(np.sum(times) for times in timings))
+
+
+def _identity(value):
+    return value
+
+
+class RebalanceMisfits(InversionDirective):
+    """
+    Compare the time spent on every misfit after the first iteration, and move
+    misfits between workers if it improves the balance of the measured loads.
+
+    The misfits are kept in their order of evaluation by DaskComboMisfits, so
+    the multipliers and the predicted data are re-ordered along with them, and
+    the driver is notified to re-order its data.
+
+    :param client: Dask client.
+    :param futures: Futures of the misfits, in their order of evaluation.
+    :param placement: Address of the worker assigned to every misfit.
+    :param workers: Addresses of the workers, in their order within a round.
+    :param reorder: Function called with the new order of the misfits.
+    :param tolerance: Minimum ratio of the largest load before and after
+        re-balancing to move the misfits.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        futures: list[Future],
+        placement: list[str],
+        workers: list[str],
+        reorder: Callable[[np.ndarray], None] | None = None,
+        tolerance: float = 1.2,
+        **kwargs,
+    ):
+        self.client = client
+        self.futures = futures
+        self.placement = placement
+        self.workers = workers
+        self.reorder = reorder
+        self.tolerance = tolerance
+        self.rebalanced = False
+
+        super().__init__(**kwargs)
+
+    def endIter(self):
+        if self.rebalanced or self.opt.iter < 1:
+            return
+
+        self.rebalanced = True
+        timings = self.client.gather(
+            [
+                self.client.submit(misfit_time, future, workers=[worker], pure=False)
+                for future, worker in zip(self.futures, self.placement, strict=True)
+            ]
+        )
+        placement = place_misfits(timings, self.workers)
+        before = max(worker_loads(timings, self.placement).values())
+        after = max(worker_loads(timings, placement).values())
+
+        if before < self.tolerance * after:
+            logger.info("Misfits balanced within tolerance, keeping placement.")
+            return
+
+        order = round_order(placement, self.workers)
+        futures = [
+            self.futures[ind]
+            if placement[ind] == self.placement[ind]
+            else self.client.submit(
+                _identity, self.futures[ind], workers=[placement[ind]], pure=False
+            )
+            for ind in order
+        ]
+        wait(futures)
+
+        self.dmisfit.objfcts = futures
+        self.dmisfit.multipliers = np.asarray(self.dmisfit.multipliers)[order]
+        for name in ["dpred", "residuals"]:
+            values = getattr(self.invProb, name, None)
+            if isinstance(values, list) and len(values) == len(order):
+                setattr(self.invProb, name, [values[ind] for ind in order])
+
+        if self.reorder is not None:
+            self.reorder(order)
+
+        self.futures = futures
+        self.placement = [placement[ind] for ind in order]
+        logger.info(
+            "Re-balanced misfits over %i workers, largest load from %.2es to %.2es.",
+            len(self.workers),
+            before,
+            after,
+        )
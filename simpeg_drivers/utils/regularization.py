@@ -8,6 +8,8 @@
 #                                                                                   '
 # '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
 
+from weakref import WeakValueDictionary
+
 import numpy as np
 import scipy.sparse as ssp
 from discretize import TreeMesh
@@ -18,9 +20,15 @@ from geoapps_utils.utils.transformations import (
 )
 from geoh5py.groups import PropertyGroup
 from geoh5py.groups.property_group_type import GroupTypeEnum
-from simpeg.regularization import SparseSmoothness
+from simpeg.regularization import RegularizationMesh, SparseSmoothness
 from simpeg.utils import mkvc, sdiag
 
+from simpeg_drivers.utils.tile_cache import hash_arrays, hash_mesh
+
+
+_GRADIENT_OPERATORS: WeakValueDictionary = WeakValueDictionary()
+_AVERAGING_OPERATORS: WeakValueDictionary = WeakValueDictionary()
+
 
 def cell_neighbors_along_axis(mesh: TreeMesh, axis: str) -> np.ndarray:
     """
@@ -46,6 +54,24 @@ def cell_neighbors_along_axis(mesh: TreeMesh, axis: str) -> np.ndarray:
     return np.sort(stencil_indices, axis=1)
 
 
+def unique_pairs(pairs: np.ndarray) -> np.ndarray:
+    """
+    Sorted unique pairs of cell indices, ignoring pairs with a -1 index.
+
+    Pairs are encoded as single integers, which is much cheaper than a row-wise
+    unique on the two columns.
+
+    :param pairs: Array of shape (n, 2) of cell indices.
+
+    :return: Unique pairs sorted by first, then second index.
+    """
+    pairs = pairs[(pairs[:, 0] != -1) & (pairs[:, 1] != -1)].astype(np.int64)
+    n_cells = int(pairs.max()) + 1 if len(pairs) else 1
+    keys = np.unique(pairs[:, 0] * n_cells + pairs[:, 1])
+
+    return np.c_[keys // n_cells, keys % n_cells]
+
+
 def collect_all_neighbors(
     neighbors: list[np.ndarray],
     neighbors_backwards: list[np.ndarray],
@@ -88,14 +114,8 @@ def collect_all_neighbors(
         ]
     ]
 
-    # Stack all and keep only unique pairs
-    all_neighbors = np.vstack(all_neighbors)
-    all_neighbors = np.unique(all_neighbors, axis=0)
-
-    # Remove all the -1 for TreeMesh
-    all_neighbors = all_neighbors[
-        (all_neighbors[:, 0] != -1) & (all_neighbors[:, 1] != -1), :
-    ]
+    # Stack all and keep only unique pairs, without the -1 of TreeMesh
+    all_neighbors = unique_pairs(np.vstack(all_neighbors))
 
     # Use all the neighbours on the xy plane to find neighbours in z
     if len(neighbors) == 3:
@@ -118,14 +138,9 @@ def collect_all_neighbors(
             np.c_[all_neighbors[:, 1], adjacent_backwards[2][all_neighbors[:, 0]]]
         ]
 
-        # Stack all and keep only unique pairs
-        all_neighbors = np.vstack([all_neighbors, np.vstack(all_neighbors_z)])
-        all_neighbors = np.unique(all_neighbors, axis=0)
-
-        # Remove all the -1 for TreeMesh
-        all_neighbors = all_neighbors[
-            (all_neighbors[:, 0] != -1) & (all_neighbors[:, 1] != -1), :
-        ]
+        all_neighbors = unique_pairs(
+            np.vstack([all_neighbors, np.vstack(all_neighbors_z)])
+        )
 
     return all_neighbors
 
@@ -263,16 +278,12 @@ def get_cell_corners(
     :param normals: Cell normals array.
     """
 
-    bottom_southwest = (
-        mesh.gridCC[neighbors[:, 0], :]
-        - mesh.h_gridded[neighbors[:, 0], :] / 2
-        + normals[neighbors[:, 0], :] * mesh.h_gridded[neighbors[:, 0], :]
-    )
-    top_northeast = (
-        mesh.gridCC[neighbors[:, 0], :]
-        + mesh.h_gridded[neighbors[:, 0], :] / 2
-        + normals[neighbors[:, 0], :] * mesh.h_gridded[neighbors[:, 0], :]
-    )
+    centers = mesh.cell_centers[neighbors[:, 0], :]
+    h_cells = mesh.h_gridded[neighbors[:, 0], :]
+    shift = normals[neighbors[:, 0], :] * h_cells
+
+    bottom_southwest = centers - h_cells / 2 + shift
+    top_northeast = centers + h_cells / 2 + shift
 
     return [bottom_southwest, top_northeast]
 
@@ -285,16 +296,10 @@ def get_neighbor_corners(mesh: TreeMesh, neighbors: np.ndarray):
     :param neighbors: Cell neighbors array.
     """
 
-    bottom_southwest = (
-        mesh.gridCC[neighbors[:, 1], :] - mesh.h_gridded[neighbors[:, 1], :] / 2
-    )
-    top_northeast = (
-        mesh.gridCC[neighbors[:, 1], :] + mesh.h_gridded[neighbors[:, 1], :] / 2
-    )
-
-    corners = [bottom_southwest, top_northeast]
+    centers = mesh.cell_centers[neighbors[:, 1], :]
+    h_cells = mesh.h_gridded[neighbors[:, 1], :]
 
-    return corners
+    return [centers - h_cells / 2, centers + h_cells / 2]
 
 
 def partial_volumes(
@@ -312,13 +317,11 @@ def partial_volumes(
 
     volumes = np.ones(neighbors.shape[0])
     for i in range(mesh.dim):
-        volumes *= np.max(
-            [
-                np.min([neighbor_corners[1][:, i], cell_corners[1][:, i]], axis=0)
-                - np.max([neighbor_corners[0][:, i], cell_corners[0][:, i]], axis=0),
-                np.zeros(neighbors.shape[0]),
-            ],
-            axis=0,
+        volumes *= np.clip(
+            np.minimum(neighbor_corners[1][:, i], cell_corners[1][:, i])
+            - np.maximum(neighbor_corners[0][:, i], cell_corners[0][:, i]),
+            0.0,
+            None,
         )
 
     # Remove all rows of zero
@@ -339,22 +342,62 @@ def gradient_operator(
     :param volumes: Partial volume array.
     :param n_cells: Number of cells in mesh.
     """
-    grad = ssp.csr_matrix(
-        (volumes, (neighbors[:, 0], neighbors[:, 1])), shape=(n_cells, n_cells)
-    )
+    rows, cols = neighbors[:, 0], neighbors[:, 1]
 
-    # Normalize rows
-    vol = mkvc(grad.sum(axis=1))
+    # Normalize rows and add the diagonal of connected cells
+    vol = np.bincount(rows, weights=volumes, minlength=n_cells)
     vol[vol > 0] = 1.0 / vol[vol > 0]
-    grad = -sdiag(vol) * grad
+    diagonal = np.flatnonzero(vol)
 
-    diag = np.ones(n_cells)
-    diag[vol == 0] = 0
-    grad = sdiag(diag) + grad
+    grad = ssp.csr_matrix(
+        (
+            np.r_[np.ones(len(diagonal)), -(vol[rows] * volumes)],
+            (np.r_[diagonal, rows], np.r_[diagonal, cols]),
+        ),
+        shape=(n_cells, n_cells),
+    )
+    grad.sort_indices()
 
     return grad
 
 
+def rotate_normals(
+    mesh: TreeMesh, axis: str, dip: np.ndarray, direction: np.ndarray
+) -> np.ndarray:
+    """
+    Rotate the outward cell normals along an axis by the dip and direction.
+
+    The last result is kept on the mesh, such that the forward and backward
+    operators of an axis share the same rotation and are released with the mesh.
+
+    :param mesh: Input TreeMesh.
+    :param axis: Regularization axis.
+    :param dip: Angle in radians for rotation from the horizon.
+    :param direction: Angle in radians for rotation about the z-axis.
+
+    :return: Array of rotated normals of shape (n_cells, dim).
+    """
+    key = (axis, hash_arrays(dip, direction))
+    cached = getattr(mesh, "_rotated_normals", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    n_cells = mesh.n_cells
+    dim = mesh.dim
+    normals = get_cell_normals(n_cells, axis, True, dim)
+    if dim == 3:
+        Rx = rotate_yz_3d(mesh, dip)
+        Rz = rotate_xy_3d(mesh, direction)
+        rotated_normals = (Rz * (Rx * normals.T)).reshape(n_cells, dim)
+    else:
+        Ry = rotate_xz_2d(mesh, dip)
+        rotated_normals = (Ry * normals.T).reshape(n_cells, dim)
+
+    mesh._rotated_normals = (key, rotated_normals)  # pylint: disable=protected-access
+
+    return rotated_normals
+
+
 def rotated_gradient(
     mesh: TreeMesh,
     neighbors: np.ndarray,
@@ -376,26 +419,21 @@ def rotated_gradient(
     """
 
     n_cells = mesh.n_cells
-    dim = mesh.dim
     if any(len(k) != n_cells for k in [dip, direction]):
         raise ValueError(
             "Input angle arrays are not the same size as the number of "
             "cells in the mesh."
         )
 
-    normals = get_cell_normals(n_cells, axis, forward, dim)
-    if dim == 3:
-        Rx = rotate_yz_3d(mesh, dip)
-        Rz = rotate_xy_3d(mesh, direction)
-        rotated_normals = (Rz * (Rx * normals.T)).reshape(n_cells, dim)
-    elif dim == 2:
-        Ry = rotate_xz_2d(mesh, dip)
-        rotated_normals = (Ry * normals.T).reshape(n_cells, dim)
+    # Backward normals are the exact opposite of the forward normals
+    rotated_normals = rotate_normals(mesh, axis, dip, direction)
+    if not forward:
+        rotated_normals = -rotated_normals
 
     volumes, neighbors = partial_volumes(
         mesh,
         neighbors,
-        rotated_normals,  # pylint: disable=possibly-used-before-assignment
+        rotated_normals,
     )
 
     unit_grad = gradient_operator(neighbors, volumes, n_cells)
@@ -445,47 +483,87 @@ def direction_and_dip(property_group: PropertyGroup) -> list[np.ndarray]:
     return ensure_dip_direction_convention(orientations, group_type)
 
 
-def set_rotated_operators(
-    function: SparseSmoothness,
+def rotated_operators(
+    mesh: RegularizationMesh,
     neighbors: np.ndarray,
     axis: str,
     dip: np.ndarray,
     direction: np.ndarray,
     forward: bool = True,
-) -> SparseSmoothness:
+) -> tuple[ssp.csr_matrix, ssp.csr_matrix]:
     """
-    Calculated rotated gradient operator using partial volumes.
+    Assemble the rotated gradient and averaging operators on active cells.
 
-    :param function: Smoothness regularization to change operator for.
+    :param mesh: Regularization mesh.
     :param neighbors: Cell neighbors array.
     :param axis: Regularization axis.
     :param dip: Angle in radians for rotation from the horizon.
     :param direction: Angle in radians for rotation about the z-axis.
     :param forward: Whether to use forward or backward difference for
         derivative approximations.
+
+    :return: Gradient and averaging operators on the active faces.
     """
-    mesh = function.regularization_mesh
     axes = "xyz" if mesh.dim == 3 else "xz"
-
     h_cell = mesh.mesh.h_gridded[:, axes.find(axis)]
+    active = np.flatnonzero(mesh.active_cells)
 
     unit_grad_op = rotated_gradient(mesh.mesh, neighbors, axis, dip, direction, forward)
 
-    vol_avg_op = abs(unit_grad_op)
-    vol_avg_op.data = (
-        vol_avg_op.data * mesh.mesh.cell_volumes[unit_grad_op.nonzero()[1]]
-    )
+    # Restrict to active cells by slicing, instead of products with Pac
+    grad_op_active = unit_grad_op[active][:, active]
+    vol_avg_op = (abs(unit_grad_op) @ sdiag(mesh.mesh.cell_volumes))[active][:, active]
 
-    grad_op_active = mesh.Pac.T @ (unit_grad_op @ mesh.Pac)
-    vol_avg_op = mesh.Pac.T @ (vol_avg_op @ mesh.Pac)
     active_faces = np.isclose(grad_op_active @ np.ones(mesh.n_cells), 0)
     active_faces &= grad_op_active.max(axis=1).toarray().ravel() != 0
 
     vol_avg_op = vol_avg_op[active_faces, :]
     vol_avg_op = sdiag(np.asarray(vol_avg_op.sum(axis=1)).ravel() ** -1) @ vol_avg_op
-    h_op = sdiag(vol_avg_op @ (mesh.Pac.T @ h_cell**-1.0))
+    h_op = sdiag(vol_avg_op @ h_cell[active] ** -1.0)
     grad_op = h_op @ grad_op_active[active_faces, :]
 
+    return grad_op, vol_avg_op
+
+
+def set_rotated_operators(
+    function: SparseSmoothness,
+    neighbors: np.ndarray,
+    axis: str,
+    dip: np.ndarray,
+    direction: np.ndarray,
+    forward: bool = True,
+) -> SparseSmoothness:
+    """
+    Calculated rotated gradient operator using partial volumes.
+
+    :param function: Smoothness regularization to change operator for.
+    :param neighbors: Cell neighbors array.
+    :param axis: Regularization axis.
+    :param dip: Angle in radians for rotation from the horizon.
+    :param direction: Angle in radians for rotation about the z-axis.
+    :param forward: Whether to use forward or backward difference for
+        derivative approximations.
+
+    Operators are cached for the mesh, active cells and orientation field, and
+    re-used for as long as a regularization holds on to them.
+    """
+    mesh = function.regularization_mesh
+    key = (
+        hash_mesh(mesh.mesh),
+        hash_arrays(mesh.active_cells, dip, direction),
+        axis,
+        forward,
+    )
+    grad_op = _GRADIENT_OPERATORS.get(key)
+    vol_avg_op = _AVERAGING_OPERATORS.get(key)
+
+    if grad_op is None or vol_avg_op is None:
+        grad_op, vol_avg_op = rotated_operators(
+            mesh, neighbors, axis, dip, direction, forward
+        )
+        _GRADIENT_OPERATORS[key] = grad_op
+        _AVERAGING_OPERATORS[key] = vol_avg_op
+
     setattr(
         mesh,
         f"_cell_gradient_{function.orientation}",
@@ -0,0 +1,127 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator
+from logging import getLogger
+
+import dask
+from dask.distributed import Client, LocalCluster
+
+from simpeg_drivers.utils.thread_budget import ThreadBudget
+
+
+logger = getLogger(__name__)
+
+# Seconds to wait for an existing scheduler before falling back
+SCHEDULER_TIMEOUT = 10
+
+
+def connect_scheduler(
+    address: str | None, timeout: float = SCHEDULER_TIMEOUT
+) -> Client | None:
+    """
+    Connect to a running dask scheduler.
+
+    :param address: Address of the scheduler, e.g. 'tcp://127.0.0.1:8786'.
+    :param timeout: Seconds to wait for the scheduler.
+
+    :return: Client connected to the scheduler, or None if not reachable.
+    """
+    if not address:
+        return None
+
+    try:
+        return Client(address, timeout=timeout)
+    except (OSError, TimeoutError) as error:
+        logger.warning(
+            "Could not connect to the dask scheduler at '%s': %s", address, error
+        )
+
+    return None
+
+
+def job_annotations(client: Client, n_threads: int | None = None) -> dict:
+    """
+    Resources requested by the tasks of a job, limited to the resources
+    advertised by the workers of the scheduler.
+
+    The memory of the job is not requested, as it is shared by all of its
+    tasks rather than used by every task.
+
+    :param client: Client connected to the scheduler.
+    :param n_threads: Number of threads used by each task, as 'CPU' resource.
+
+    :return: Annotations of the tasks submitted by the job.
+    """
+    requested = {}
+    if n_threads is not None:
+        requested["CPU"] = n_threads
+
+    workers = client.scheduler_info().get("workers", {}).values()
+    advertised = set().union(*[worker.get("resources", {}) for worker in workers])
+    resources = {key: val for key, val in requested.items() if key in advertised}
+
+    if not resources:
+        return {}
+
+    return {"resources": resources}
+
+
+@contextlib.contextmanager
+def dask_client(
+    address: str | None = None,
+    n_workers: int | None = None,
+    n_threads: int | None = None,
+    timeout: float = SCHEDULER_TIMEOUT,
+) -> Iterator[Client | None]:
+    """
+    Client of a long-lived scheduler if reachable, else of a local cluster
+    started for the job, or None if the job runs without dask distributed.
+
+    Tasks submitted within the context are annotated with the resources of
+    the job. Closing the context never shuts down a long-lived scheduler. The
+    BLAS/OpenMP threads of the local workers are limited to their share of CPUs.
+
+    :param address: Address of a running scheduler.
+    :param n_workers: Number of workers of the local cluster.
+    :param n_threads: Number of threads per worker.
+    :param timeout: Seconds to wait for the scheduler.
+    """
+    client = connect_scheduler(address, timeout=timeout)
+
+    if client is not None:
+        logger.info("Connected to the dask scheduler at '%s'.", address)
+        annotations = job_annotations(client, n_threads=n_threads)
+        with client, dask.annotate(**annotations):
+            yield client
+        return
+
+    if address:
+        logger.warning("Falling back to a local cluster.")
+
+    if (n_workers is not None and n_workers > 1) or n_threads is not None:
+        budget = ThreadBudget.from_compute(n_workers=n_workers, n_threads=n_threads)
+        logger.info("Starting a local cluster with %s.", budget.layout())
+        with (
+            LocalCluster(
+                processes=True,
+                n_workers=n_workers,
+                threads_per_worker=n_threads,
+                env=budget.environment(),
+            ) as cluster,
+            cluster.get_client() as client,
+        ):
+            yield client
+        return
+
+    yield None
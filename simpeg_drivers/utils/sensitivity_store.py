@@ -0,0 +1,145 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+import shutil
+from logging import getLogger
+from pathlib import Path
+
+import numpy as np
+from simpeg.simulation import BaseSimulation
+
+from simpeg_drivers.utils.tile_cache import hash_arrays, hash_mesh
+
+
+logger = getLogger(__name__)
+
+
+def sensitivity_hash(simulation: BaseSimulation) -> str:
+    """
+    Hash of all inputs defining the sensitivities of a potential field simulation.
+
+    :param simulation: Local SimPEG simulation.
+
+    :return: Hexadecimal digest.
+    """
+    survey = simulation.survey
+    source = getattr(survey, "source_field", None)
+
+    return hash_arrays(
+        hash_mesh(simulation.mesh),
+        simulation.active_cells,
+        survey.receiver_locations,
+        sorted(survey.components),
+        getattr(source, "b0", None),
+        getattr(simulation, "model_type", None),
+        np.dtype(getattr(simulation, "sensitivity_dtype", np.float64)).name,
+    )
+
+
+def sensitivity_shape(simulation: BaseSimulation) -> tuple[int, int]:
+    """
+    Expected shape of the sensitivity matrix of a potential field simulation.
+
+    :param simulation: Local SimPEG simulation.
+
+    :return: Number of data and number of model parameters.
+    """
+    n_cells = int(simulation.nC)
+    if getattr(simulation, "model_type", None) == "vector":
+        n_cells *= 3
+
+    return int(simulation.survey.nD), n_cells
+
+
+def store_is_complete(path: Path, shape: tuple[int, int]) -> bool:
+    """
+    Check that a sensitivity store on disk has the expected shape and that all
+    of its blocks were written.
+
+    Both zarr directory stores and 'sensitivity.npy' files are supported.
+
+    :param path: Path to the sensitivity store.
+    :param shape: Expected shape of the sensitivity matrix.
+
+    :return: True if the store can be re-used.
+    """
+    metadata = path / ".zarray"
+    if metadata.exists():
+        content = json.loads(metadata.read_text(encoding="utf-8"))
+        if tuple(content["shape"]) != tuple(shape):
+            return False
+
+        n_chunks = np.prod(
+            np.ceil(np.asarray(content["shape"]) / np.asarray(content["chunks"]))
+        )
+        n_written = len(
+            [file for file in path.iterdir() if not file.name.startswith(".")]
+        )
+        return n_written >= n_chunks
+
+    kernel = path / "sensitivity.npy"
+    if kernel.exists():
+        try:
+            return np.load(kernel, mmap_mode="r").shape == tuple(shape)
+        except (OSError, ValueError):
+            return False
+
+    return False
+
+
+def validate_sensitivity_store(simulation: BaseSimulation) -> bool:
+    """
+    Check if the on-disk sensitivities of a simulation can be re-used.
+
+    A manifest storing the hash of the mesh, active cells, receivers and
+    components is written next to each store. Stores that are incomplete or
+    do not match the hash of the simulation are removed, so that they get
+    re-computed by the simulation.
+
+    :param simulation: Local SimPEG simulation storing sensitivities on disk.
+
+    :return: True if a valid store was found and will be re-used.
+    """
+    path = Path(simulation.sensitivity_path)
+    manifest = path.with_name(f"{path.name}.json")
+    key = sensitivity_hash(simulation)
+    shape = sensitivity_shape(simulation)
+
+    if path.exists():
+        recorded = None
+        if manifest.exists():
+            try:
+                recorded = json.loads(manifest.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                recorded = None
+
+        if (
+            isinstance(recorded, dict)
+            and recorded.get("hash") == key
+            and store_is_complete(path, shape)
+        ):
+            logger.info("Re-using sensitivities stored in %s.", path)
+            return True
+
+        logger.info("Removing stale sensitivities stored in %s.", path)
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(
+        json.dumps({"hash": key, "shape": list(shape)}, indent=4), encoding="utf-8"
+    )
+
+    return False
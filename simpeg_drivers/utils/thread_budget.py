@@ -0,0 +1,116 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import multiprocessing
+
+from pydantic import BaseModel, Field
+from threadpoolctl import threadpool_info, threadpool_limits
+
+
+# Environment variables read by BLAS and OpenMP libraries at import
+THREAD_VARIABLES = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+]
+
+
+class ThreadBudget(BaseModel):
+    """
+    Split of the CPUs between dask workers, dask threads and the thread pools of
+    the BLAS, OpenMP and MKL libraries (including the direct solvers), such that
+    their product never exceeds the number of CPUs.
+
+    :param n_cpu: Number of CPUs available to the job.
+    :param n_workers: Number of dask workers sharing the CPUs.
+    :param n_threads: Number of dask threads per worker.
+    :param concurrent: Whether the dask threads run library calls concurrently.
+        If not, the library thread pools are left to use the CPUs of the worker.
+    """
+
+    n_cpu: int = Field(ge=1)
+    n_workers: int = Field(1, ge=1)
+    n_threads: int = Field(1, ge=1)
+    concurrent: bool = True
+
+    @classmethod
+    def from_compute(
+        cls,
+        n_cpu: int | None = None,
+        n_workers: int | None = None,
+        n_threads: int | None = None,
+    ) -> ThreadBudget:
+        """
+        Budget from the compute options, defaulting to all CPUs of the machine.
+
+        Without a number of dask threads or workers, the dask threads only run
+        array tasks while the factorizations and BLAS calls of the simulations
+        run on the main thread, so the library thread pools are not limited.
+
+        :param n_cpu: Number of CPUs available to the job.
+        :param n_workers: Number of dask workers.
+        :param n_threads: Number of dask threads per worker.
+        """
+        n_cpu = n_cpu or multiprocessing.cpu_count()
+        n_workers = max(n_workers or 1, 1)
+        concurrent = n_threads is not None or n_workers > 1
+        if n_threads is None:
+            n_threads = max(n_cpu // n_workers, 1)
+
+        return cls(
+            n_cpu=n_cpu,
+            n_workers=n_workers,
+            n_threads=n_threads,
+            concurrent=concurrent,
+        )
+
+    @property
+    def library_threads(self) -> int:
+        """
+        Number of BLAS/OpenMP threads of every dask thread.
+        """
+        if not self.concurrent:
+            return max(self.n_cpu // self.n_workers, 1)
+
+        return max(self.n_cpu // (self.n_workers * self.n_threads), 1)
+
+    def environment(self) -> dict[str, str]:
+        """
+        Environment variables limiting the libraries of new worker processes.
+        """
+        return {name: str(self.library_threads) for name in THREAD_VARIABLES}
+
+    def limits(self) -> threadpool_limits:
+        """
+        Context limiting the thread pools of the libraries loaded in this process.
+
+        Without concurrent dask threads, the thread pools are left unchanged.
+        """
+        if not self.concurrent:
+            return threadpool_limits(limits=None)
+
+        return threadpool_limits(limits=self.library_threads)
+
+    def layout(self) -> str:
+        """
+        Description of the effective thread layout, including the loaded libraries.
+        """
+        libraries = ", ".join(
+            f"{info['internal_api']}={info['num_threads']}"
+            for info in threadpool_info()
+        )
+        return (
+            f"{self.n_cpu} CPU(s): {self.n_workers} worker(s) x "
+            f"{self.n_threads} dask thread(s) x {self.library_threads} "
+            f"BLAS/OpenMP thread(s) [{libraries or 'no thread pool loaded'}]"
+        )
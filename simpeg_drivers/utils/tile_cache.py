@@ -0,0 +1,274 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import hashlib
+import os
+from logging import getLogger
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from discretize import TreeMesh
+from simpeg import maps
+from simpeg.survey import BaseSurvey
+
+
+logger = getLogger(__name__)
+
+
+def hash_arrays(*values) -> str:
+    """
+    Compute a content hash from a sequence of arrays and scalars.
+
+    :param values: Arrays, scalars or None values to be hashed, in order.
+
+    :return: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    for value in values:
+        if value is None:
+            digest.update(b"None")
+            continue
+
+        array = np.ascontiguousarray(np.asarray(value))
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
+def hash_mesh(mesh: TreeMesh) -> str:
+    """
+    Compute a content hash of a TreeMesh from its cell state.
+
+    :param mesh: TreeMesh to be hashed.
+
+    :return: Hexadecimal digest.
+    """
+    if not isinstance(mesh, TreeMesh):
+        return hash_arrays(mesh.origin, *mesh.h)
+
+    state = mesh.cell_state
+    return hash_arrays(mesh.origin, *mesh.h, state["indexes"], state["levels"])
+
+
+class CachedTileMap(maps.TileMap):
+    """
+    TileMap restored from a pre-computed projection and local active cells.
+
+    :param local_active: Active cells of the local mesh.
+    :param projection: Projection matrix from global to local active cells.
+    """
+
+    def __init__(
+        self,
+        global_mesh: TreeMesh,
+        global_active: np.ndarray,
+        local_mesh: TreeMesh,
+        *,
+        local_active: np.ndarray,
+        projection: sp.csr_matrix,
+        **kwargs,
+    ):
+        self._projection = projection
+        super().__init__(global_mesh, global_active, local_mesh, **kwargs)
+        self._local_active = local_active
+
+
+class TileCache:
+    """
+    Content-addressed cache of tile meshes, tile maps and receiver projections.
+
+    Entries are stored as numpy archives named after the hash of their
+    inputs, so that later runs with the same geometry can skip the setup.
+
+    :param path: Directory where the cache files are stored.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._mesh_hashes: dict[int, tuple[TreeMesh, str]] = {}
+
+    def mesh_hash(self, mesh: TreeMesh) -> str:
+        """
+        Hash of a mesh, computed once per mesh object.
+
+        :param mesh: Mesh to be hashed.
+
+        :return: Hexadecimal digest.
+        """
+        if id(mesh) not in self._mesh_hashes:
+            self._mesh_hashes[id(mesh)] = (mesh, hash_mesh(mesh))
+
+        return self._mesh_hashes[id(mesh)][1]
+
+    def _file(self, key: str, kind: str) -> Path:
+        return self.path / f"{kind}_{key}.npz"
+
+    def _load(self, key: str, kind: str) -> dict | None:
+        file = self._file(key, kind)
+        if not file.exists():
+            return None
+
+        try:
+            with np.load(file) as content:
+                return dict(content)
+        except (OSError, ValueError) as error:
+            logger.warning("Ignoring corrupted tile cache file %s: %s", file, error)
+            return None
+
+    def _save(self, key: str, kind: str, **arrays):
+        """Write to a temporary file first to avoid partial entries."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = self._file(key, kind)
+        temp = file.with_name(f"{file.stem}.{os.getpid()}.tmp.npz")
+        np.savez(temp, **arrays)
+        os.replace(temp, file)
+
+    def load_mesh(self, key: str, base_mesh: TreeMesh) -> TreeMesh | None:
+        """
+        Load a local TreeMesh sharing the base cell sizes of the global mesh.
+
+        :param key: Hash of the inputs used to create the mesh.
+        :param base_mesh: Global mesh.
+
+        :return: Finalized TreeMesh, or None if not cached.
+        """
+        content = self._load(key, "mesh")
+        if content is None:
+            return None
+
+        return TreeMesh(
+            base_mesh.h,
+            origin=base_mesh.origin,
+            diagonal_balance=False,
+            cell_indexes=content["indexes"],
+            cell_levels=content["levels"],
+        )
+
+    def save_mesh(self, key: str, mesh: TreeMesh):
+        """
+        Store the cell state of a local TreeMesh.
+
+        :param key: Hash of the inputs used to create the mesh.
+        :param mesh: Finalized TreeMesh.
+        """
+        state = mesh.cell_state
+        self._save(key, "mesh", indexes=state["indexes"], levels=state["levels"])
+
+    def load_tile_map(
+        self,
+        key: str,
+        global_mesh: TreeMesh,
+        global_active: np.ndarray,
+        local_mesh: TreeMesh,
+        **kwargs,
+    ) -> maps.TileMap | None:
+        """
+        Restore a TileMap from its stored projection.
+
+        :param key: Hash of the inputs used to create the TileMap.
+        :param global_mesh: Global mesh.
+        :param global_active: Active cells of the global mesh.
+        :param local_mesh: Local mesh.
+        :param kwargs: Additional keyword arguments passed to the TileMap.
+
+        :return: TileMap, or None if not cached.
+        """
+        content = self._load(key, "tile_map")
+        if content is None:
+            return None
+
+        projection = sp.csr_matrix(
+            (content["data"], content["indices"], content["indptr"]),
+            shape=tuple(content["shape"]),
+        )
+        return CachedTileMap(
+            global_mesh,
+            global_active,
+            local_mesh,
+            local_active=content["local_active"],
+            projection=projection,
+            **kwargs,
+        )
+
+    def save_tile_map(self, key: str, mapping: maps.TileMap):
+        """
+        Store the projection and local active cells of a TileMap.
+
+        :param key: Hash of the inputs used to create the TileMap.
+        :param mapping: TileMap to store.
+        """
+        projection = sp.csr_matrix(mapping.projection)
+        self._save(
+            key,
+            "tile_map",
+            data=projection.data,
+            indices=projection.indices,
+            indptr=projection.indptr,
+            shape=np.asarray(projection.shape),
+            local_active=mapping.local_active,
+        )
+
+    def load_projections(self, key: str, survey: BaseSurvey) -> bool:
+        """
+        Assign stored spatial projections to the receivers of a survey.
+
+        :param key: Hash of the inputs used to compute the projections.
+        :param survey: Local survey with receivers in the same order as stored.
+
+        :return: True if the projections were found and assigned.
+        """
+        content = self._load(key, "projections")
+        if content is None:
+            return False
+
+        receivers = [rx for src in survey.source_list for rx in src.receiver_list]
+        offsets = content["offsets"]
+
+        if len(offsets) != len(receivers) + 1:
+            return False
+
+        projections = sp.csr_matrix(
+            (content["data"], content["indices"], content["indptr"]),
+            shape=tuple(content["shape"]),
+        )
+        for receiver, start, end in zip(
+            receivers, offsets[:-1], offsets[1:], strict=True
+        ):
+            receiver.spatialP = projections[start:end, :]
+
+        return True
+
+    def save_projections(self, key: str, survey: BaseSurvey):
+        """
+        Store the spatial projections of all receivers of a survey.
+
+        :param key: Hash of the inputs used to compute the projections.
+        :param survey: Local survey with pre-computed receiver projections.
+        """
+        projections = [
+            sp.csr_matrix(rx.spatialP)
+            for src in survey.source_list
+            for rx in src.receiver_list
+        ]
+        offsets = np.r_[0, np.cumsum([proj.shape[0] for proj in projections])]
+        stacked = sp.vstack(projections, format="csr")
+        self._save(
+            key,
+            "projections",
+            data=stacked.data,
+            indices=stacked.indices,
+            indptr=stacked.indptr,
+            shape=np.asarray(stacked.shape),
+            offsets=offsets,
+        )
@@ -21,8 +21,11 @@
 #
 # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
 import logging
+import multiprocessing
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from time import perf_counter
 from typing import ClassVar
 
 import matplotlib.pyplot as plt
@@ -31,6 +34,7 @@ from discretize import TreeMesh
 from geoapps_utils.base import Driver, Options
 from geoapps_utils.utils.numerical import fibonacci_series, fit_circle
 from geoh5py.groups import SimPEGGroup, UIJsonGroup
+from pydantic import BaseModel
 from scipy.interpolate import interp1d
 from tqdm import tqdm
 
@@ -60,15 +64,36 @@ class TileParameters(Options):
     out_group: UIJsonGroup | None = None
 
 
+class TileEstimate(BaseModel):
+    """
+    Estimated resources for a given number of tiles.
+
+    :param count: Number of tiles.
+    :param n_data: Number of data in the largest tile.
+    :param n_cells: Number of active cells in the largest tile.
+    :param total_size: Total size of the sensitivities over all tiles (Gb).
+    :param peak_memory: Expected peak memory of the sensitivities per worker (Gb).
+    :param time_per_jvec: Expected wall-time of a J·v product (s).
+    """
+
+    count: int
+    n_data: int
+    n_cells: int
+    total_size: float
+    peak_memory: float
+    time_per_jvec: float
+
+
 class TileEstimator(Driver):
     """
     Class to estimate the optimal number of tiles for a given mesh and receiver locations.
 
     The driver loops over a range of tile counts and estimates the total problem size
-    for each count. The optimal number of tiles is estimated from the point
-    of maximum curvature using a circle fit. This assumes a point of
-    diminishing returns in terms of problem size and the overall cost of
-    creating more tiles.
+    for each count, based on the largest tile. The optimal number of tiles is
+    estimated from the point of maximum curvature using a circle fit. This
+    assumes a point of diminishing returns in terms of problem size and the
+    overall cost of creating more tiles. The smallest number of tiles fitting
+    within the 'max_ram' of the compute options is used as lower bound.
     """
 
     _params_class = TileParameters
@@ -78,6 +103,8 @@ class TileEstimator(Driver):
         self._mesh: TreeMesh | None = None
         self._data: np.ndarray | None = None
         self._active_cells: np.ndarray | None = None
+        self._jvec_rate: float | None = None
+        self.estimates: dict[int, TileEstimate] = {}
 
         super().__init__(params)
 
@@ -85,33 +112,172 @@ class TileEstimator(Driver):
         """
         Run the tile estimator over a Fibonacci series up to
         the maximum number of tiles.
+
+        :param max_tiles: Maximum number of tiles.
+
+        :return: Dictionary of tile counts and total sensitivity sizes (Gb).
+        """
+        self.estimates = self.get_estimates(max_tiles)
+        return {count: est.total_size for count, est in self.estimates.items()}
+
+    def get_estimates(self, max_tiles: int = 13) -> dict[int, TileEstimate]:
+        """
+        Estimate the resources over a Fibonacci series of tile counts, sampling
+        the tiles of every count in parallel.
+
+        :param max_tiles: Maximum number of tiles.
+
+        :return: Dictionary of tile counts and estimates.
         """
-        results = {}
         counts = fibonacci_series(max_tiles)[2:].tolist()
 
         if counts[-1] < max_tiles:
             counts.append(max_tiles)
 
-        for count in tqdm(counts, desc="Estimating tiles:"):
-            if count > len(self.data.locations):
-                break
-
-            tiles = tile_locations(self.data.locations, count, labels=self.data.parts)
-            # Get the median tile
-            ind = int(np.argsort([len(tile) for tile in tiles])[int(count / 2)])
-            self.driver.params.compute.tile_spatial = int(count)
-            sim, mapping, _ = create_simulation(
-                self.driver.simulation,
-                None,
-                tiles[ind],
-                tile_id=ind,
-                padding_cells=self.driver.params.padding_cells,
+        counts = [int(count) for count in counts if count <= len(self.data.locations)]
+
+        # Padding depends on the number of tiles
+        paddings = []
+        for count in counts:
+            self.driver.params.compute.tile_spatial = count
+            paddings.append(self.driver.params.padding_cells)
+
+        n_threads = self.driver.params.compute.n_cpu or multiprocessing.cpu_count()
+        with ThreadPoolExecutor(max_workers=min(n_threads, len(counts))) as executor:
+            samples = list(
+                tqdm(
+                    executor.map(self.sample_largest_tile, counts, paddings),
+                    total=len(counts),
+                    desc="Estimating tiles:",
+                )
+            )
+
+        return {
+            count: self.estimate_resources(count, n_data, n_cells)
+            for count, (n_data, n_cells) in zip(counts, samples, strict=True)
+        }
+
+    def sample_largest_tile(self, count: int, padding_cells: int) -> tuple[int, int]:
+        """
+        Create the simulation of the largest tile for a given number of tiles.
+
+        :param count: Number of tiles.
+        :param padding_cells: Number of padding cells around the tile.
+
+        :return: Number of data and number of model parameters of the largest tile.
+        """
+        cell_size = float(np.min(self.mesh.h[0]))
+        tiles = tile_locations(
+            self.data.locations,
+            count,
+            labels=self.data.parts,
+            method=self.driver.params.compute.tile_method,
+            padding_cells=padding_cells,
+            cell_size=cell_size,
+        )
+        ind = int(np.argmax([len(tile) for tile in tiles]))
+        sim, mapping, _ = create_simulation(
+            self.driver.simulation,
+            None,
+            tiles[ind],
+            tile_id=ind,
+            padding_cells=padding_cells,
+        )
+
+        return int(sim.survey.nD), int(mapping.shape[0])
+
+    def estimate_resources(self, count: int, n_data: int, n_cells: int) -> TileEstimate:
+        """
+        Estimate the memory and wall-time for a number of tiles, assuming that all
+        tiles are as large as the largest one.
+
+        :param count: Number of tiles.
+        :param n_data: Number of data in the largest tile.
+        :param n_cells: Number of model parameters in the largest tile.
+
+        :return: Resource estimate.
+        """
+        compute = self.driver.params.compute
+        n_workers = max(compute.n_workers or 1, 1)
+        tiles_per_worker = int(np.ceil(count / n_workers))
+        tile_size = float(n_data) * n_cells * self.itemsize * 1e-9
+        storage = getattr(self.driver.params, "store_sensitivities", "ram")
+
+        if self.driver.params.forward_only:
+            peak_memory = 0.0
+        elif storage == "disk":
+            # Only blocks of rows are loaded at once from disk
+            peak_memory = min(
+                tile_size, compute.max_chunk_size * 1e-3 * (compute.n_threads or 1)
             )
+        else:
+            peak_memory = tile_size * tiles_per_worker
+
+        return TileEstimate(
+            count=count,
+            n_data=n_data,
+            n_cells=n_cells,
+            total_size=tile_size * count,
+            peak_memory=peak_memory,
+            time_per_jvec=float(n_data) * n_cells * tiles_per_worker / self.jvec_rate,
+        )
+
+    @property
+    def itemsize(self) -> int:
+        """
+        Number of bytes per sensitivity value.
+        """
+        dtype = getattr(self.driver.simulation, "sensitivity_dtype", np.float64)
+        return np.dtype(dtype).itemsize
 
-            # Estimate total size in Gb
-            results[count] = float(sim.survey.nD) * mapping.shape[0] * count * 8 * 1e-9
+    @property
+    def jvec_rate(self) -> float:
+        """
+        Number of sensitivity values processed per second in a J·v product,
+        calibrated from a dense matrix-vector product on this machine.
+        """
+        if self._jvec_rate is None:
+            dtype = getattr(self.driver.simulation, "sensitivity_dtype", np.float64)
+            matrix = np.ones((2000, 2000), dtype=dtype)
+            vector = np.ones(2000, dtype=dtype)
+            _ = matrix @ vector
+            start = perf_counter()
+            for _ in range(5):
+                _ = matrix @ vector
+            self._jvec_rate = 5 * matrix.size / max(perf_counter() - start, 1e-9)
+
+        return self._jvec_rate
+
+    def estimate_memory_bound(self, optimal: int) -> int:
+        """
+        Increase the number of tiles until the peak memory per worker fits
+        within the 'max_ram' of the compute options.
 
-        return results
+        :param optimal: Optimal number of tiles from the problem size alone.
+
+        :return: Recommended number of tiles.
+        """
+        max_ram = self.driver.params.compute.max_ram
+        if max_ram is None or not self.estimates:
+            return optimal
+
+        fits = [
+            count
+            for count, estimate in self.estimates.items()
+            if estimate.peak_memory <= max_ram
+        ]
+
+        if not fits:
+            largest = max(self.estimates)
+            logger.warning(
+                "No tiling in the sweep fits within max_ram=%.2f Gb. "
+                "Using the largest number of tiles tested (%i).",
+                max_ram,
+                largest,
+            )
+            return largest
+
+        return max(optimal, min(fits))
 
     def run(self) -> SimPEGGroup:
         """
@@ -124,14 +290,24 @@ class TileEstimator(Driver):
 
         logger.info(
             "Estimates:\n%s\n%s",
-            "Tiling \t Total size (Gb) ",
-            "\n".join(f"{key} \t {value:.2e}" for key, value in results.items()),
+            "Tiling \t Total size (Gb) \t Peak memory/worker (Gb) \t J·v time (s)",
+            "\n".join(
+                f"{key} \t {est.total_size:.2e} \t {est.peak_memory:.2e} "
+                f"\t {est.time_per_jvec:.2e}"
+                for key, est in self.estimates.items()
+            ),
         )
 
-        optimal = self.estimate_optimal_tile(results)
+        optimal = self.estimate_memory_bound(self.estimate_optimal_tile(results))
         out_group = self.generate_optimal_group(optimal)
 
-        logger.info("Optimal number of tile(s): %i", optimal)
+        logger.info(
+            "Optimal number of tile(s): %i, with peak memory of %.2e Gb per worker "
+            "and %.2e s per J·v.",
+            optimal,
+            self.estimates[optimal].peak_memory,
+            self.estimates[optimal].time_per_jvec,
+        )
 
         if self.params.out_group is not None:
             out_group = self.params.out_group
@@ -0,0 +1,171 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from logging import getLogger
+
+import numpy as np
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import Delaunay, cKDTree
+
+
+logger = getLogger(__name__)
+
+
+def decimate_points(points: np.ndarray, resolution: float) -> np.ndarray:
+    """
+    Keep a single point per horizontal cell of a regular grid.
+
+    :param points: n x 3 array of points.
+    :param resolution: Horizontal size of the grid cells.
+
+    :return: Decimated array of points.
+    """
+    cells = np.floor(points[:, :-1] / resolution).astype(np.int64)
+    _, indices = np.unique(cells, axis=0, return_index=True)
+
+    return points[np.sort(indices)]
+
+
+class TopographyInterpolator:
+    """
+    Interpolator of elevations on a topography surface.
+
+    The triangulation, or nearest neighbour tree, of the horizontal coordinates
+    is built once per interpolator, such that repeated queries only cost the
+    interpolation. Interpolators given the same key, e.g. the uid of the
+    topography entity, share the horizontal index, such that surfaces shifted
+    vertically re-use the same triangulation until the cache is cleared.
+
+    :param topo: n x 3 array of topography points.
+    :param method: Type of topography interpolation, either 'linear' or 'nearest'.
+    :param resolution: Horizontal resolution used to decimate the topography
+        points, if provided.
+    :param key: Identifier of the horizontal coordinates of the surface, used to
+        share the spatial indices between interpolators.
+    """
+
+    max_cached = 4
+    _indices: OrderedDict[tuple, Delaunay | cKDTree] = OrderedDict()
+
+    def __init__(
+        self,
+        topo: np.ndarray,
+        method: str = "linear",
+        resolution: float | None = None,
+        key: Hashable | None = None,
+    ):
+        if method not in ["linear", "nearest"]:
+            raise ValueError("Method must be 'linear', or 'nearest'")
+
+        if resolution is not None:
+            topo = decimate_points(topo, resolution)
+
+        self.topo = np.asarray(topo, dtype=float)
+        self.method = method
+        self.key = None if key is None else (key, resolution)
+        self._index: Delaunay | cKDTree | None = None
+        self._interpolator: LinearNDInterpolator | None = None
+        self._tree: cKDTree | None = None
+
+    @classmethod
+    def get_index(
+        cls, points: np.ndarray, kind: str, key: Hashable | None = None
+    ) -> Delaunay | cKDTree:
+        """
+        Get a spatial index of points from the cache, or build it.
+
+        :param points: Array of points to index.
+        :param kind: Type of index, either 'delaunay' or 'tree'.
+        :param key: Identifier of the points in the cache. The index is not
+            cached if not provided.
+
+        :return: Spatial index of the points.
+        """
+        if key is not None and (kind, key) in cls._indices:
+            cls._indices.move_to_end((kind, key))
+            return cls._indices[(kind, key)]
+
+        logger.debug("Building %s index of %i topography points.", kind, len(points))
+        index = Delaunay(points) if kind == "delaunay" else cKDTree(points)
+
+        if key is not None:
+            cls._indices[(kind, key)] = index
+            while len(cls._indices) > cls.max_cached:
+                cls._indices.popitem(last=False)
+
+        return index
+
+    @classmethod
+    def clear_cache(cls):
+        """Release all cached spatial indices."""
+        cls._indices.clear()
+
+    @property
+    def index(self) -> Delaunay | cKDTree:
+        """Spatial index of the horizontal coordinates of the topography."""
+        if self._index is None:
+            kind = "tree" if self.method == "nearest" else "delaunay"
+            self._index = self.get_index(self.topo[:, :-1], kind, key=self.key)
+
+        return self._index
+
+    @property
+    def tree(self) -> cKDTree:
+        """Three-dimensional tree of the topography, used for extrapolation."""
+        if self._tree is None:
+            self._tree = cKDTree(self.topo)
+
+        return self._tree
+
+    def interpolate(self, locations: np.ndarray) -> np.ndarray:
+        """
+        Interpolate elevations at horizontal locations.
+
+        :param locations: n x 2 array of horizontal locations.
+
+        :return: Array of elevations, NaN outside of the convex hull for
+            the 'linear' method.
+        """
+        if self.method == "nearest":
+            _, ind = self.index.query(locations)
+            return self.topo[ind, -1]
+
+        if self._interpolator is None:
+            self._interpolator = LinearNDInterpolator(self.index, self.topo[:, -1])
+
+        return self._interpolator(locations)
+
+    def __call__(self, locations: np.ndarray) -> np.ndarray:
+        """
+        Get draped elevation at locations.
+
+        Values are extrapolated to nearest neighbour if requested outside the
+        convex hull of the topography points.
+
+        :param locations: n x 3 array of locations.
+
+        :return: An array of z elevations for every input locations.
+        """
+        unique_locs, inds = np.unique(
+            locations[:, :-1].round(), axis=0, return_inverse=True
+        )
+        z_locations = self.interpolate(unique_locs)[inds.ravel()]
+
+        # Apply nearest neighbour if in extrapolation
+        ind_nan = np.isnan(z_locations)
+        if any(ind_nan):
+            _, ind = self.tree.query(locations[ind_nan, :])
+            z_locations[ind_nan] = self.topo[ind, -1]
+
+        return np.c_[locations[:, :-1], z_locations]
@@ -28,13 +28,15 @@ from geoh5py.objects.surveys.electromagnetics.base import LargeLoopGroundEMSurve
 from geoh5py.shared import INTEGER_NDV
 from geoh5py.ui_json import InputFile
 from grid_apps.utils import octree_2_treemesh
-from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator, interp1d
+from scipy import sparse
+from scipy.interpolate import interp1d
 from scipy.spatial import ConvexHull, Delaunay, cKDTree
 
 from simpeg_drivers import DRIVER_MAP
 from simpeg_drivers.utils.surveys import (
     compute_alongline_distance,
 )
+from simpeg_drivers.utils.topography import TopographyInterpolator
 
 
 if TYPE_CHECKING:
@@ -171,41 +173,54 @@ def drape_to_octree(
         _, lookup_inds = tree.query(octree.centroids)
     else:
         mesh = octree_2_treemesh(octree)
+        lookup_inds = [mesh.get_containing_cells(d.centroids) for d in drape_model]
+
+    model_data = []
+    for model in drape_model:
+        named_data = {}
+        for child in model.children:
+            named_data.setdefault(child.name, []).append(child)
+        model_data.append(named_data)
 
     # perform interpolation using nearest neighbor or lookup method
+    octree_models = {}
     for label, names in children.items():
-        octree_model = (
-            [] if method == "nearest" else np.array([np.nan] * octree.n_cells)
-        )
-        for ind, model in enumerate(drape_model):
-            datum = [k for k in model.children if k.name == names[ind]]
+        values = {}
+        for ind, named_data in enumerate(model_data):
+            datum = named_data.get(names[ind], [])
             if len(datum) > 1:
                 raise ValueError(
                     f"Found more than one data set with name {names[ind]} in"
-                    f"model {model.name}."
+                    f"model {drape_model[ind].name}."
                 )
 
-            if not isinstance(datum[0], NumericData):
-                continue
-
-            if method == "nearest":
-                octree_model.append(datum[0].values)
-            else:
-                lookup_inds = mesh.get_containing_cells(model.centroids)
-                octree_model[lookup_inds] = datum[0].values
+            if datum and isinstance(datum[0], NumericData):
+                values[ind] = datum[0].values
 
-        if len(octree_model) == 0:
+        if len(values) == 0:
             continue
 
         if method == "nearest":
-            octree_model = np.hstack(octree_model)[lookup_inds]
+            octree_model = np.hstack(
+                [
+                    values[ind] if ind in values else np.full(model.n_cells, np.nan)
+                    for ind, model in enumerate(drape_model)
+                ]
+            )[lookup_inds]
+        else:
+            octree_model = np.full(octree.n_cells, np.nan)
+            for ind, val in values.items():
+                octree_model[lookup_inds[ind]] = val
 
         if np.issubdtype(octree_model.dtype, np.integer):
             octree_model[~active] = INTEGER_NDV
         else:
             octree_model[~active] = np.nan  # apply active cells
 
-        octree.add_data({label: {"values": octree_model}})
+        octree_models[label] = {"values": octree_model}
+
+    if octree_models:
+        octree.add_data(octree_models)
 
     return octree
 
@@ -252,20 +267,59 @@ def drape_2_tensor(drape_model: DrapeModel, return_sorting: bool = False) -> tup
         sorting = sorting.reshape(mesh.shape_cells[1], mesh.shape_cells[0], order="C")
         sorting = np.argsort(sorting[::-1].T.flatten())
 
-        # Skip indices for ghost points
-        count = -1
-        for ghost in ghosts:
-            if ghost:
-                sorting[sorting > count] += 1
-                count += 1
-            else:
-                count += n_layers
+        # Skip indices for ghost points, shifting each cell by the number of
+        # ghost prisms preceding its own prism
+        n_ghosts = np.cumsum(ghosts)[~ghosts]
+        sorting += n_ghosts[sorting // n_layers]
 
         return (mesh, sorting)
     else:
         return mesh
 
 
+class DrapeGeometry:
+    """
+    Tensor mesh, cell sorting and search tree of a drape model, computed once
+    and shared by the 2D code paths.
+
+    :param drape_model: DrapeModel object.
+    """
+
+    def __init__(self, drape_model: DrapeModel):
+        self.drape_model = drape_model
+        self.mesh, self.sorting = drape_2_tensor(drape_model, return_sorting=True)
+        self._tree: cKDTree | None = None
+
+    @property
+    def tree(self) -> cKDTree:
+        """Search tree over the horizontal locations of the prisms."""
+        if self._tree is None:
+            self._tree = cKDTree(self.drape_model.prisms[:, :2])
+
+        return self._tree
+
+    @property
+    def distances(self) -> np.ndarray:
+        """Along-line distance of the cell centers."""
+        return self.mesh.cell_centers_x
+
+    def drape_locations(self, locations: np.ndarray) -> np.ndarray:
+        """
+        Return pseudo locations along line in distance, depth.
+
+        The horizontal distance is referenced to first node of the core mesh.
+
+        :param locations: Array of xyz locations.
+        """
+        # Interpolate distance assuming always inside the mesh trace
+        rad, ind = self.tree.query(locations[:, :2], k=2)
+        weights = (rad + 1e-8) ** -1.0
+        distance_interp = (self.distances[ind] * weights).sum(axis=1)
+        distance_interp /= weights.sum(axis=1)
+
+        return np.c_[distance_interp, locations[:, 2:]]
+
+
 def floating_active(mesh: TensorMesh | TreeMesh, active: np.ndarray):
     """
     True if there are any active cells in the air
@@ -451,27 +505,34 @@ def get_containing_cells(
 
 def cell_size_z(drape_model: DrapeModel) -> np.ndarray:
     """Compute z cell sizes of drape model."""
-    hz = []
-    for prism in drape_model.prisms:
-        top_z, top_layer, n_layers = prism[2:]
-        bottoms = drape_model.layers[
-            range(int(top_layer), int(top_layer + n_layers)), 2
-        ]
-        z = np.hstack([top_z, bottoms])
-        hz.append(z[:-1] - z[1:])
-    return np.hstack(hz)
+    prisms = drape_model.prisms
+    top_layers = prisms[:, 3].astype(int)
+    n_layers = prisms[:, 4].astype(int)
+
+    # Index of the first cell of each prism, and of the layer of every cell
+    first_cells = np.r_[0, np.cumsum(n_layers)[:-1]]
+    layer_ids = np.arange(n_layers.sum()) + np.repeat(
+        top_layers - first_cells, n_layers
+    )
+
+    bottoms = drape_model.layers[layer_ids, 2]
+    tops = np.empty_like(bottoms)
+    tops[1:] = bottoms[:-1]
+    tops[first_cells[n_layers > 0]] = prisms[n_layers > 0, 2]
+
+    return tops - bottoms
 
 
 def active_from_xyz(
     mesh: DrapeModel | Octree,
-    topo: np.ndarray,
+    topo: np.ndarray | TopographyInterpolator,
     grid_reference="center",
     method="linear",
 ):
     """Returns an active cell index array below a surface
 
     :param mesh: Mesh object
-    :param topo: Array of xyz locations
+    :param topo: Array of xyz locations, or a pre-built interpolator
     :param grid_reference: Cell reference. Must be "center", "top", or "bottom"
     :param method: Interpolation method. Must be "linear", or "nearest"
     """
@@ -501,7 +562,9 @@ def active_from_xyz(
     return locations[:, -1] < z_locations[:, -1]
 
 
-def topo_drape_elevation(locations, topo, method="linear") -> np.ndarray:
+def topo_drape_elevation(
+    locations, topo: np.ndarray | TopographyInterpolator, method="linear"
+) -> np.ndarray:
     """
     Get draped elevation at locations.
 
@@ -509,32 +572,15 @@ def topo_drape_elevation(locations, topo, method="linear") -> np.ndarray:
     convex hull of the input topography points.
 
     :param locations: n x 3 array of locations
-    :param topo: n x 3 array of topography points
+    :param topo: n x 3 array of topography points, or a pre-built interpolator
     :param method: Type of topography interpolation, either 'linear' or 'nearest'
 
     :return: An array of z elevations for every input locations.
     """
-    if method == "linear":
-        delaunay_2d = Delaunay(topo[:, :-1])
-        z_interpolate = LinearNDInterpolator(delaunay_2d, topo[:, -1])
-    elif method == "nearest":
-        z_interpolate = NearestNDInterpolator(topo[:, :-1], topo[:, -1])
-    else:
-        raise ValueError("Method must be 'linear', or 'nearest'")
-
-    unique_locs, inds = np.unique(
-        locations[:, :-1].round(), axis=0, return_inverse=True
-    )
-    z_locations = z_interpolate(unique_locs)[inds]
+    if not isinstance(topo, TopographyInterpolator):
+        topo = TopographyInterpolator(topo, method=method)
 
-    # Apply nearest neighbour if in extrapolation
-    ind_nan = np.isnan(z_locations)
-    if any(ind_nan):
-        tree = cKDTree(topo)
-        _, ind = tree.query(locations[ind_nan, :])
-        z_locations[ind_nan] = topo[ind, -1]
-
-    return np.c_[locations[:, :-1], z_locations]
+    return topo(locations)
 
 
 def truncate_locs_depths(locs: np.ndarray, depth_core: float) -> np.ndarray:
@@ -579,6 +625,10 @@ def get_neighbouring_cells(mesh: TreeMesh, indices: list | np.ndarray) -> tuple:
     Get the indices of neighbouring cells along a given axis for a given list of
     cell indices.
 
+    Neighbours are found in bulk from the cell-face incidence of the mesh, such
+    that cells sharing a face along an axis are neighbours. Cells without a
+    neighbour on one side are flagged with -1.
+
     :param mesh: discretize.TreeMesh object.
     :param indices: List of cell indices.
 
@@ -593,17 +643,43 @@ def get_neighbouring_cells(mesh: TreeMesh, indices: list | np.ndarray) -> tuple:
     if not isinstance(mesh, TreeMesh):
         raise TypeError("Input 'mesh' must be a discretize.TreeMesh object.")
 
-    neighbors = {ax: [[], []] for ax in range(mesh.dim)}
+    indices = np.asarray(indices, dtype=int)
+    operators = [
+        mesh.face_x_divergence,
+        mesh.face_y_divergence,
+        mesh.face_z_divergence,
+    ]
+    neighbours = []
+    for operator in operators[: mesh.dim]:
+        # Cells are on the lower side of faces with a positive divergence
+        lower = (operator > 0).astype(int).tocsr()
+        upper = (operator < 0).astype(int).tocsr()
+        neighbours.append(
+            (
+                _face_neighbours(upper[indices] @ lower.T),
+                _face_neighbours(lower[indices] @ upper.T),
+            )
+        )
 
-    for ind in indices:
-        for ax in range(mesh.dim):
-            neighbors[ax][0].append(np.r_[mesh[ind].neighbors[ax * 2]])
-            neighbors[ax][1].append(np.r_[mesh[ind].neighbors[ax * 2 + 1]])
+    return tuple(neighbours)
 
-    return tuple(
-        (np.r_[tuple(neighbors[ax][0])], np.r_[tuple(neighbors[ax][1])])
-        for ax in range(mesh.dim)
-    )
+
+def _face_neighbours(adjacency: sparse.spmatrix) -> np.ndarray:
+    """
+    Flatten a cell adjacency matrix into neighbour indices, in the order of its
+    rows. Rows without neighbours are assigned -1.
+
+    :param adjacency: Sparse matrix of shape (n_indices, n_cells).
+
+    :return: Array of neighbouring cell indices.
+    """
+    adjacency = adjacency.tocsr()
+    empty = np.flatnonzero(np.diff(adjacency.indptr) == 0)
+    adjacency = adjacency.tocoo()
+    rows = np.r_[adjacency.row, empty]
+    cols = np.r_[adjacency.col, -np.ones_like(empty)]
+
+    return cols[np.lexsort((cols, rows))].astype(int)
 
 
 def simpeg_group_to_driver(group: SimPEGGroup, workspace: Workspace) -> InversionDriver:
@@ -15,15 +15,20 @@ from pathlib import Path
 import numpy as np
 import simpeg
 from discretize.utils import mesh_builder_xyz
+from geoh5py.groups import SimPEGGroup
 from geoh5py.objects import Points
 from geoh5py.workspace import Workspace
 from grid_apps.octree_creation.driver import OctreeDriver
 from grid_apps.utils import treemesh_2_octree
 
 from simpeg_drivers.components import InversionData
+from simpeg_drivers.components.factories import SurveyFactory
 from simpeg_drivers.electricals.direct_current.three_dimensions.options import (
     DC3DForwardOptions,
 )
+from simpeg_drivers.electromagnetics.frequency_domain.options import (
+    FDEMForwardOptions,
+)
 from simpeg_drivers.options import ActiveCellsOptions
 from simpeg_drivers.potential_fields.magnetic_vector.driver import (
     MVIInversionDriver,
@@ -240,6 +245,56 @@ def test_normalize(tmp_path: Path):
         assert len(test_data) == 1
 
 
+def test_observed_in_place(tmp_path: Path):
+    params = get_mvi_params(tmp_path)
+    geoh5 = params.geoh5
+    with geoh5.open():
+        data = InversionData(geoh5, params)
+        source = params.data["tmi"][None].copy()
+        observed = data.observed["tmi"][None]
+        normalized = data.normalize(data.observed)
+
+        assert normalized["tmi"][None] is not observed
+        np.testing.assert_array_equal(params.data["tmi"][None], source)
+        np.testing.assert_array_equal(
+            observed, source[data.mask] * data.normalizations[None]["tmi"]
+        )
+
+
+def test_reuse_data(tmp_path: Path):
+    params = get_mvi_params(tmp_path, reuse_data=True)
+    geoh5 = params.geoh5
+    with geoh5.open():
+        survey, tmi_channel = params.data_object, params.tmi_channel
+        data = InversionData(geoh5, params)
+        data.entity.add_data(
+            {"Iteration_1_tmi": {"values": np.ones(data.entity.n_vertices)}}
+        )
+
+        params.data_object, params.tmi_channel = survey, tmi_channel
+        params.out_group = SimPEGGroup.create(geoh5, name="Second run")
+        reused = InversionData(geoh5, params)
+
+        # Results of each run are written on a survey of its own group
+        assert reused.entity.uid != data.entity.uid
+        assert reused.entity.parent.uid == params.out_group.uid
+        assert not reused.entity.children
+        np.testing.assert_array_equal(reused.entity.vertices, data.entity.vertices)
+
+        # Observed data are referenced on the survey of the first run
+        assert reused.data_entity.uid == data.entity.uid
+        assert params.data_object.uid == data.entity.uid
+        assert params.tmi_channel.uid == data.entity.get_data("Observed_tmi")[0].uid
+        assert len(data.entity.get_data("Observed_tmi")) == 1
+
+        tmi_channel.values = tmi_channel.values + 1.0
+        params.data_object, params.tmi_channel = survey, tmi_channel
+        modified = InversionData(geoh5, params)
+
+        assert modified.entity.uid != data.entity.uid
+        assert modified.data_entity.uid == modified.entity.uid
+
+
 def test_get_survey(tmp_path: Path):
     params = get_mvi_params(tmp_path)
     geoh5 = params.geoh5
@@ -269,3 +324,61 @@ def test_data_parts(tmp_path: Path):
         data = InversionData(geoh5, params)
 
         assert len(set(data.parts)) == n_lines
+
+
+def test_fem_survey(tmp_path: Path):
+    opts = SyntheticsComponentsOptions(
+        method="fdem",
+        survey=SurveyOptions(n_stations=3, n_lines=2, drape=10.0),
+        mesh=MeshOptions(refinement=(2,), padding_distance=400.0),
+        model=ModelOptions(background=1e-4, anomaly=0.1),
+    )
+    with Workspace.create(tmp_path / "inversion_test.ui.geoh5") as geoh5:
+        components = SyntheticsComponents(geoh5=geoh5, options=opts)
+        params = FDEMForwardOptions.build(
+            geoh5=geoh5,
+            mesh=components.mesh,
+            topography_object=components.topography,
+            data_object=components.survey,
+            starting_model=components.model,
+            z_real_channel_bool=True,
+            z_imag_channel_bool=True,
+        )
+        data = InversionData(geoh5, params)
+        factory = SurveyFactory(params)
+        survey = factory.build(data=data)
+
+        entity = params.data_object
+        channels = np.array(entity.channels)
+        n_rx, n_comp = entity.n_vertices, len(data.components)
+        frequencies = entity.transmitters.get_data("Tx frequency")[0]
+        tx_frequencies = np.array(
+            [int(frequencies.value_map[val]) for val in frequencies.values]
+        )
+
+        assert len(survey.source_list) == len(channels) * n_rx
+        for ind, src in enumerate(survey.source_list):
+            freq_id, rx_id = divmod(ind, n_rx)
+            assert src.frequency == channels[freq_id]
+            assert src.rx_ids == [rx_id]
+            np.testing.assert_allclose(
+                src.location,
+                entity.transmitters.vertices[tx_frequencies == channels[freq_id]][
+                    rx_id
+                ],
+            )
+            assert len(src.receiver_list) == n_comp
+            for rx in src.receiver_list:
+                np.testing.assert_allclose(rx.locations, entity.vertices[[rx_id]])
+
+        expected = np.vstack(
+            [
+                np.c_[
+                    np.full(n_rx * n_comp, freq_id),
+                    np.kron(np.ones(n_rx), np.arange(n_comp)),
+                    np.kron(np.arange(n_rx), np.ones(n_comp)),
+                ]
+                for freq_id in range(len(channels))
+            ]
+        )
+        np.testing.assert_array_equal(factory.ordering, expected)
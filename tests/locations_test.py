@@ -19,7 +19,7 @@ from geoh5py.objects import Curve, Grid2D, Points
 
 from simpeg_drivers.components.locations import InversionLocations
 from simpeg_drivers.potential_fields import MVIInversionOptions
-from simpeg_drivers.utils.nested import tile_locations
+from simpeg_drivers.utils.nested import tile_costs, tile_locations
 from simpeg_drivers.utils.synthetics.driver import SyntheticsComponents
 from simpeg_drivers.utils.synthetics.options import (
     MeshOptions,
@@ -188,3 +188,70 @@ def test_tile_locations_labels(tmp_path: Path):
         )  # All tiles have the same number of vertices
         with pytest.raises(ValueError, match="Labels array must have the same length"):
             tile_locations(curve.vertices, n_tiles=8, labels=curve.parts[:-1])
+
+
+def test_tile_locations_bisection():
+    rng = np.random.default_rng(0)
+    # Dense cluster of stations next to a sparse regional grid
+    grid_x, grid_y = np.meshgrid(np.arange(0, 1000, 50), np.arange(0, 1000, 50))
+    cluster = rng.uniform(0, 100, (2000, 2))
+    locations = np.r_[np.c_[grid_x.ravel(), grid_y.ravel()], cluster]
+
+    def costs(tiles):
+        return np.array(
+            [
+                tile_costs(locations[tile], padding_cells=2, cell_size=25.0)[-1]
+                for tile in tiles
+            ]
+        )
+
+    tiles = tile_locations(
+        locations, 8, method="bisection", padding_cells=2, cell_size=25.0
+    )
+    kmeans = tile_locations(locations, 8)
+
+    assert len(tiles) == 8
+    np.testing.assert_array_equal(
+        np.sort(np.hstack(tiles)), np.arange(locations.shape[0])
+    )
+    assert costs(tiles).max() < costs(kmeans).max()
+
+
+def test_tile_locations_bisection_labels():
+    rng = np.random.default_rng(0)
+    # Two lines of stations, one much longer than the other
+    locations = np.r_[
+        np.c_[rng.uniform(0, 4000, 400), np.zeros(400)],
+        np.c_[rng.uniform(0, 1000, 100), np.full(100, 500.0)],
+    ]
+    labels = np.r_[np.ones(400), np.full(100, 2)]
+    tiles = tile_locations(locations, 5, labels=labels, method="bisection")
+
+    assert len(tiles) == 5
+    np.testing.assert_array_equal(
+        np.sort(np.hstack(tiles)), np.arange(locations.shape[0])
+    )
+    assert all(len(np.unique(labels[tile])) == 1 for tile in tiles)
+    # Tiles are allotted by cost: four to the long line, one to the short line
+    assert sum(labels[tile][0] == 1 for tile in tiles) == 4
+
+
+def test_tile_costs_padding():
+    # Single point: 4x4 finest cells, then a ring of 2x2 cells out to 6 m
+    cost = tile_costs(np.zeros((1, 2)), padding_cells=2, cell_size=1.0, minimum_level=2)
+    assert cost[-1] == 1.0 + 16.0 + (144.0 - 16.0) / 4.0
+
+    assert tile_costs(np.zeros((1, 2)))[-1] == 1.0
+
+
+def test_tile_locations_bisection_degenerate():
+    locations = np.c_[np.arange(10.0), np.zeros(10)]
+    tiles = tile_locations(locations, 4, method="bisection")
+
+    assert [len(tile) for tile in tiles] == [2, 3, 2, 3]
+
+    tiles = tile_locations(locations[:3], 4, method="bisection")
+    assert len(tiles) == 3
+
+    with pytest.raises(ValueError, match="Tiling method"):
+        tile_locations(locations, 4, method="abc")
@@ -166,6 +166,77 @@ def test_airborne_tem_1d_run(tmp_path: Path, max_iterations=1, pytest=True):
             assert np.all(nan_ind == inactive_ind)
 
 
+def setup_sounding_driver(
+    tmp_path: Path, sounding_batch_size: int
+) -> TDEM1DInversionDriver:
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    opts = SyntheticsComponentsOptions(
+        method="airborne tdem 1d",
+        survey=SurveyOptions(n_stations=3, n_lines=2, drape=10.0),
+        mesh=MeshOptions(
+            cell_size=(20.0, 20.0, 20.0), refinement=(2,), padding_distance=400.0
+        ),
+        model=ModelOptions(background=0.1),
+    )
+    with Workspace.create(tmp_path / "inversion_test.ui.geoh5") as geoh5:
+        components = SyntheticsComponents(geoh5, options=opts)
+        survey = components.survey
+        rng = np.random.default_rng(0)
+        data, uncertainties = [], []
+        for ii, _ in enumerate(survey.channels):
+            data.append(
+                survey.add_data(
+                    {f"dBzdt_[{ii}]": {"values": rng.random(survey.n_vertices)}}
+                )
+            )
+            uncertainties.append(
+                survey.add_data(
+                    {f"uncertainty_[{ii}]": {"values": np.ones(survey.n_vertices)}}
+                )
+            )
+        survey.add_components_data(
+            {"dBzdt": data, "dBzdt uncertainties": uncertainties}
+        )
+
+        params = TDEM1DInversionOptions.build(
+            geoh5=geoh5,
+            mesh=components.mesh,
+            topography_object=components.topography,
+            data_object=survey,
+            starting_model=5e-1,
+            z_channel=survey.fetch_property_group(name="dBzdt"),
+            z_uncertainty=survey.fetch_property_group(name="dBzdt uncertainties"),
+        )
+        params.compute.sounding_batch_size = sounding_batch_size
+
+    return TDEM1DInversionDriver(params)
+
+
+def test_airborne_tem_1d_sounding_batches(tmp_path: Path):
+    results = {}
+    for batch_size in [1, 4]:
+        driver = setup_sounding_driver(tmp_path / f"batch_{batch_size}", batch_size)
+
+        with driver.workspace.open():
+            misfits = driver.data_misfit
+            model = driver.models.starting_model
+            ordering = driver.inversion_data.survey.ordering
+            dpred = np.zeros(ordering.max(axis=0) + 1)
+            dpred[ordering[:, 0], ordering[:, 1], ordering[:, 2]] = np.hstack(
+                [misfit.simulation.dpred(model) for misfit in misfits.objfcts]
+            )
+            results[batch_size] = (
+                len(misfits.objfcts),
+                dpred,
+                misfits.deriv(model),
+            )
+
+    # Fewer misfits, with the same predicted data and derivatives
+    assert results[4][0] < results[1][0]
+    np.testing.assert_allclose(results[4][1], results[1][1], rtol=1e-6)
+    np.testing.assert_allclose(results[4][2], results[1][2], rtol=1e-6)
+
+
 if __name__ == "__main__":
     # Full run
     test_airborne_tem_1d_fwr_run(
@@ -14,6 +14,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import numpy as np
 from geoh5py.groups import SimPEGGroup
 from geoh5py.workspace import Workspace
 
@@ -90,6 +91,49 @@ def test_dc_p3d_fwr_run(
     fwr_driver.run()
 
 
+def test_dc_p3d_fwr_run_concurrent(tmp_path: Path):
+    opts = SyntheticsComponentsOptions(
+        method="direct current pseudo 3d",
+        survey=SurveyOptions(n_stations=10, n_lines=3),
+        mesh=MeshOptions(refinement=(4, 6)),
+        model=ModelOptions(background=0.01, anomaly=10.0),
+    )
+    with Workspace.create(tmp_path / "inversion_test.ui.geoh5") as geoh5:
+        components = SyntheticsComponents(geoh5=geoh5, options=opts)
+        params = DCBatch2DForwardOptions.build(
+            geoh5=geoh5,
+            mesh=components.mesh,
+            drape_model=DrapeModelOptions(
+                u_cell_size=5.0,
+                v_cell_size=5.0,
+                depth_core=100.0,
+                expansion_factor=1.1,
+                horizontal_padding=1000.0,
+                vertical_padding=1000.0,
+            ),
+            topography_object=components.topography,
+            data_object=components.survey,
+            starting_model=components.model,
+            line_selection=LineSelectionOptions(
+                line_object=components.survey.get_data("line_ids")[0]
+            ),
+        )
+        params.compute.n_line_workers = 2
+
+    fwr_driver = DCBatch2DForwardDriver(params)
+    fwr_driver.run()
+
+    with Workspace(tmp_path / "inversion_test.ui.geoh5", mode="r") as geoh5:
+        potential = geoh5.get_entity("Iteration_0_potential")[0]
+        out_group = geoh5.get_entity(fwr_driver.batch2d_params.out_group.uid)[0]
+        line_groups = [
+            group for group in out_group.children if isinstance(group, SimPEGGroup)
+        ]
+
+        assert not np.any(np.isnan(potential.values))
+        assert len(line_groups) == 3
+
+
 def test_dc_p3d_run(
     tmp_path: Path,
     max_iterations=1,
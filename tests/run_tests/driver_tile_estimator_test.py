@@ -69,6 +69,15 @@ def test_tile_estimator_run(
 
     with geoh5.open():
         assert len(estimator.get_results(max_tiles=32)) == 8
+        estimates = list(estimator.estimates.values())
+        assert all(est.time_per_jvec > 0 for est in estimates)
+        assert estimates[-1].peak_memory < estimates[0].peak_memory
+
+        # Memory bound pushes the recommendation to more tiles
+        assert estimator.estimate_memory_bound(2) == 2
+        estimator.driver.params.compute.max_ram = estimator.estimates[8].peak_memory
+        assert estimator.estimate_memory_bound(2) == 8
+        estimator.driver.params.compute.max_ram = None
         simpeg_group = estimator.run()
         driver = simpeg_group_to_driver(simpeg_group, geoh5)
 
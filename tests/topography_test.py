@@ -13,7 +13,9 @@ from __future__ import annotations
 from pathlib import Path
 
 import numpy as np
+from discretize import TreeMesh
 from geoh5py import Workspace
+from scipy.interpolate import LinearNDInterpolator
 
 from simpeg_drivers.components import InversionData, InversionMesh, InversionTopography
 from simpeg_drivers.options import ActiveCellsOptions
@@ -25,6 +27,8 @@ from simpeg_drivers.utils.synthetics.options import (
     SurveyOptions,
     SyntheticsComponentsOptions,
 )
+from simpeg_drivers.utils.topography import TopographyInterpolator
+from simpeg_drivers.utils.utils import get_neighbouring_cells, topo_drape_elevation
 
 
 def test_get_locations(tmp_path: Path):
@@ -91,3 +95,57 @@ def test_get_locations(tmp_path: Path):
         params.active_cells.topography = 199.0
         locs = topo.get_locations(params.active_cells.topography_object)
         np.testing.assert_allclose(locs[:, 2], np.ones_like(locs[:, 2]) * 199.0)
+
+
+def test_get_neighbouring_cells():
+    rng = np.random.default_rng(0)
+    mesh = TreeMesh([[(5.0, 32)]] * 3, diagonal_balance=True)
+    mesh.insert_cells(rng.uniform(0, 160, (20, 3)), np.full(20, mesh.max_level))
+    mesh.insert_cells(rng.uniform(0, 160, (20, 3)), np.full(20, mesh.max_level - 2))
+    mesh.finalize()
+
+    indices = rng.choice(mesh.n_cells, 100, replace=False)
+    neighbours = get_neighbouring_cells(mesh, indices)
+
+    for ax in range(mesh.dim):
+        for side in range(2):
+            expected = np.hstack(
+                [np.r_[mesh[ind].neighbors[ax * 2 + side]] for ind in indices]
+            )
+            np.testing.assert_array_equal(neighbours[ax][side], expected)
+
+
+def test_topography_interpolator():
+    rng = np.random.default_rng(0)
+    topo = np.c_[rng.uniform(0, 100, (500, 2)), rng.uniform(0, 10, 500)]
+    locations = np.c_[rng.uniform(-10, 110, (200, 2)), np.zeros(200)]
+
+    TopographyInterpolator.clear_cache()
+    interpolator = TopographyInterpolator(topo)
+    draped = topo_drape_elevation(locations, interpolator)
+
+    expected = LinearNDInterpolator(topo[:, :-1], topo[:, -1])(
+        locations[:, :-1].round()
+    )
+    inside = ~np.isnan(expected)
+    assert np.any(~inside)
+    np.testing.assert_allclose(draped[inside, -1], expected[inside])
+    np.testing.assert_allclose(draped, topo_drape_elevation(locations, topo))
+
+    # Interpolators without a key do not fill the shared cache
+    assert len(TopographyInterpolator._indices) == 0
+
+    # Vertically shifted surfaces of the same key share the same triangulation
+    surface = TopographyInterpolator(topo, key="surface")
+    shifted = TopographyInterpolator(topo + np.r_[0, 0, 5.0], key="surface")
+    np.testing.assert_allclose(surface(locations), draped)
+    np.testing.assert_allclose(shifted(locations)[inside, -1], draped[inside, -1] + 5.0)
+    assert shifted.index is surface.index
+    assert shifted.tree is not surface.tree
+    assert len(TopographyInterpolator._indices) == 1
+
+    TopographyInterpolator.clear_cache()
+    assert len(TopographyInterpolator._indices) == 0
+
+    decimated = TopographyInterpolator(topo, resolution=20.0)
+    assert len(decimated.topo) <= 25
@@ -0,0 +1,124 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+from threading import Event
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from geoh5py import Workspace
+from geoh5py.objects import Points
+from simpeg import directives
+
+from simpeg_drivers.utils.async_writer import AsyncSaveGeoH5, GeoH5Writer
+
+
+def test_writer_order_and_flush():
+    writer = GeoH5Writer(queue_size=2)
+    written = []
+
+    for ind in range(10):
+        writer.submit(written.append, ind)
+
+    writer.flush()
+
+    assert written == list(range(10))
+
+    writer.close()
+
+
+def test_writer_back_pressure():
+    writer = GeoH5Writer(queue_size=1)
+    release = Event()
+    writer.submit(release.wait)
+    writer.submit(lambda: None)
+
+    with pytest.raises(ValueError, match="positive integer"):
+        GeoH5Writer(queue_size=0)
+
+    assert writer._queue.full()  # pylint: disable=protected-access
+
+    release.set()
+    writer.flush()
+
+    assert writer._queue.empty()  # pylint: disable=protected-access
+
+
+def test_writer_error():
+    writer = GeoH5Writer()
+
+    def fail():
+        raise OSError("Disk full")
+
+    writer.submit(fail)
+
+    with pytest.raises(OSError, match="Disk full"):
+        writer.flush()
+
+    # Error is only raised once
+    writer.flush()
+
+
+def test_async_save_matches_sync(tmp_path: Path):
+    with Workspace.create(tmp_path / f"{__name__}.geoh5") as workspace:
+        points = Points.create(workspace, vertices=np.random.randn(10, 3))
+        model = np.random.randn(10)
+        dpred = [np.random.randn(10), np.random.randn(10)]
+        inversion = SimpleNamespace(
+            invProb=SimpleNamespace(
+                model=model, dpred=dpred, opt=SimpleNamespace(iter=1)
+            )
+        )
+
+        def save_directives(label: str) -> list:
+            return [
+                directives.SaveModelGeoH5(points, label=label, transforms=[np.exp]),
+                directives.SaveDataGeoH5(
+                    points,
+                    label=label,
+                    channels=["ch1", "ch2"],
+                    components=["z"],
+                    transforms=[lambda values: values + 1.0],
+                ),
+                directives.SavePropertyGroup(
+                    points, label=label, channels=["ch1", "ch2"], components=["z"]
+                ),
+            ]
+
+        for directive in save_directives("sync"):
+            directive.inversion = inversion
+            directive.write(1)
+
+        async_save = AsyncSaveGeoH5(save_directives("async"))
+        async_save.inversion = inversion
+        async_save.initialize()
+        async_save.endIter()
+
+        # Directives without values of their own run synchronously
+        assert points.get_property_group("Iteration_1_z_async")[0] is not None
+
+        # Changes to the inversion state after the snapshot are not written
+        model *= 10.0
+        dpred[0] *= 10.0
+        async_save.finish()
+
+        # The writer thread is stopped at the end of the inversion
+        assert async_save.writer._thread is None  # pylint: disable=protected-access
+
+        synced = [child for child in points.children if child.name.endswith("_sync")]
+        assert len(synced) == 3
+        for child in synced:
+            name = child.name.replace("_sync", "_async")
+            np.testing.assert_allclose(
+                points.get_data(name)[0].values, child.values, err_msg=name
+            )
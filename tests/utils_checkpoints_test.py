@@ -0,0 +1,97 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from discretize import TensorMesh
+from simpeg import (
+    data,
+    data_misfit,
+    directives,
+    inverse_problem,
+    inversion,
+    maps,
+    optimization,
+    regularization,
+)
+from simpeg.potential_fields import gravity
+
+from simpeg_drivers.utils.checkpoints import SaveCheckpoint, latest_checkpoint
+
+
+def get_inversion(path: Path, max_iter: int, resume_from: Path | None = None):
+    mesh = TensorMesh([[(10.0, 8)], [(10.0, 8)], [(10.0, 6)]], "CCN")
+    grid = np.linspace(-30, 30, 6)
+    x, y = np.meshgrid(grid, grid)
+    locations = np.c_[x.ravel(), y.ravel(), np.ones(x.size) * 5.0]
+    receivers = gravity.receivers.Point(locations)
+    survey = gravity.survey.Survey(gravity.sources.SourceField([receivers]))
+    simulation = gravity.simulation.Simulation3DIntegral(
+        mesh, survey=survey, rhoMap=maps.IdentityMap(nP=mesh.n_cells)
+    )
+    model = np.zeros(mesh.n_cells)
+    model[(np.abs(mesh.cell_centers) < 15.0).all(axis=1)] = 0.5
+    dobs = simulation.dpred(model)
+    observed = data.Data(survey, dobs=dobs, standard_deviation=1e-3)
+
+    dmisfit = data_misfit.L2DataMisfit(data=observed, simulation=simulation)
+    reg = regularization.Sparse(mesh, norms=[0.0, 2.0, 2.0, 2.0])
+    opt = optimization.ProjectedGNCG(maxIter=max_iter, maxIterCG=10)
+    inv_prob = inverse_problem.BaseInvProblem(dmisfit, reg, opt, beta=1e-2)
+    irls = directives.UpdateIRLS(chifact_start=100.0, max_irls_iterations=10)
+    checkpoint = SaveCheckpoint(path, irls_directive=irls, resume_from=resume_from)
+    directive_list = [
+        irls,
+        directives.UpdateSensitivityWeights(),
+        directives.UpdatePreconditioner(),
+        checkpoint,
+    ]
+    return inversion.BaseInversion(inv_prob, directiveList=directive_list), checkpoint
+
+
+def test_checkpoint_resume(tmp_path: Path):
+    path = tmp_path / "checkpoints"
+    inv, _ = get_inversion(path, max_iter=4)
+    inv.run(np.zeros(inv.invProb.reg.mapping.shape[1]))
+
+    last = latest_checkpoint(path)
+    assert last is not None and last.name == "iteration_004.npz"
+
+    with np.load(last) as content:
+        state = dict(content)
+
+    assert state["start_irls_iter"] >= 0
+    assert "sensitivity_0_0" in state
+
+    # A corrupted checkpoint is skipped
+    (path / "iteration_009.npz").write_text("broken", encoding="utf-8")
+    assert latest_checkpoint(path) == last
+
+    inv, checkpoint = get_inversion(path, max_iter=6, resume_from=path)
+    inv.invProb.startup(np.zeros_like(state["model"]))
+    inv.directiveList.call("initialize")
+
+    np.testing.assert_allclose(inv.invProb.model, state["model"])
+    assert inv.invProb.beta == state["beta"]
+    assert inv.opt.maxIter == 2
+    assert checkpoint.irls_directive.metrics.start_irls_iter == (
+        state["start_irls_iter"] - 4
+    )
+    np.testing.assert_allclose(
+        inv.invProb.reg.objfcts[0].get_weights("sensitivity"),
+        state["sensitivity_0_0"],
+    )
+    assert np.all(inv.invProb.reg.objfcts[0].norm == 0.0)
+
+    inv.opt.minimize(inv.invProb.evalFunction, inv.invProb.model)
+    assert latest_checkpoint(path).name == "iteration_006.npz"
@@ -0,0 +1,177 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from discretize import TreeMesh
+from geoh5py import Workspace
+from grid_apps.utils import treemesh_2_octree
+from scipy.spatial import cKDTree
+
+from simpeg_drivers.line_sweep.driver import LineSweepDriver
+from simpeg_drivers.utils.utils import (
+    DrapeGeometry,
+    cell_size_z,
+    drape_2_tensor,
+    drape_to_octree,
+    xyz_2_drape_model,
+)
+
+
+def get_drape_model(workspace: Workspace, n_prisms: int = 20, n_layers: int = 5):
+    x = np.linspace(0.0, 100.0, n_prisms)
+    locations = np.c_[x, x * 0.5, np.ones(n_prisms) * 10.0]
+    depths = np.linspace(1.0, 5.0, n_layers)
+    return xyz_2_drape_model(workspace, locations, depths, name="drape")
+
+
+def get_ghosted_drape(n_prisms: int, n_layers: int = 6, ghost_every: int = 7):
+    """Drape model arrays with a single-layer ghost prism every few prisms."""
+    prisms, layers = [], []
+    index = 0
+    for ind in range(n_prisms):
+        count = 1 if ind % ghost_every == 0 else n_layers
+        prisms.append([ind * 2.0, 0.0, 10.0, index, count])
+        bottoms = 10.0 - np.cumsum(np.arange(1.0, count + 1.0))
+        layers += [[ind, k, bottom] for k, bottom in enumerate(bottoms)]
+        index += count
+
+    return SimpleNamespace(prisms=np.array(prisms), layers=np.array(layers))
+
+
+def cell_size_z_loop(drape_model) -> np.ndarray:
+    hz = []
+    for prism in drape_model.prisms:
+        top_z, top_layer, n_layers = prism[2:]
+        bottoms = drape_model.layers[
+            range(int(top_layer), int(top_layer + n_layers)), 2
+        ]
+        z = np.hstack([top_z, bottoms])
+        hz.append(z[:-1] - z[1:])
+    return np.hstack(hz)
+
+
+def ghost_sorting_loop(drape_model, mesh) -> np.ndarray:
+    ghosts = drape_model.prisms[:, -1] == 1
+    n_layers = mesh.shape_cells[1]
+    sorting = np.arange(mesh.n_cells)
+    sorting = sorting.reshape(mesh.shape_cells[1], mesh.shape_cells[0], order="C")
+    sorting = np.argsort(sorting[::-1].T.flatten())
+
+    count = -1
+    for ghost in ghosts:
+        if ghost:
+            sorting[sorting > count] += 1
+            count += 1
+        else:
+            count += n_layers
+
+    return sorting
+
+
+def test_cell_size_z():
+    drape_model = get_ghosted_drape(50)
+
+    np.testing.assert_allclose(cell_size_z(drape_model), cell_size_z_loop(drape_model))
+
+
+def test_drape_2_tensor_ghosts():
+    drape_model = get_ghosted_drape(50)
+    mesh, sorting = drape_2_tensor(drape_model, return_sorting=True)
+
+    np.testing.assert_array_equal(sorting, ghost_sorting_loop(drape_model, mesh))
+
+    # Sorting skips the ghost cells of the drape model
+    n_layers = drape_model.prisms[:, -1].astype(int)
+    ghost_cells = np.repeat(n_layers == 1, n_layers)
+    assert not np.any(ghost_cells[sorting])
+
+
+def test_drape_geometry(tmp_path: Path):
+    with Workspace.create(tmp_path / f"{__name__}.geoh5") as workspace:
+        model = get_drape_model(workspace)
+        geometry = DrapeGeometry(model)
+        mesh, sorting = drape_2_tensor(model, return_sorting=True)
+
+        assert geometry.mesh.n_cells == mesh.n_cells
+        np.testing.assert_array_equal(geometry.sorting, sorting)
+        assert geometry.tree is geometry.tree
+
+        locations = np.c_[
+            np.linspace(5.0, 95.0, 7),
+            np.linspace(5.0, 95.0, 7) * 0.5,
+            np.ones(7) * 10.0,
+        ]
+        rad, ind = cKDTree(model.prisms[:, :2]).query(locations[:, :2], k=2)
+        weights = 1.0 / (rad + 1e-8)
+        expected = (mesh.cell_centers_x[ind] * weights).sum(axis=1) / weights.sum(
+            axis=1
+        )
+
+        np.testing.assert_allclose(geometry.drape_locations(locations)[:, 0], expected)
+        np.testing.assert_array_equal(
+            geometry.drape_locations(locations)[:, 1], locations[:, 2]
+        )
+
+
+def test_drape_to_octree(tmp_path: Path):
+    with Workspace.create(tmp_path / f"{__name__}.geoh5") as workspace:
+        x = np.linspace(0.0, 100.0, 11)
+        depths = np.linspace(1.0, 5.0, 5)
+        children = [
+            {"density": 1.0, "Iteration_1_model": 1.0, "Iteration_2_model": 2.0},
+            {"density": 2.0, "Iteration_1_model": 10.0, "Iteration_3_model": 30.0},
+        ]
+        drape_models = []
+        for ind, values in enumerate(children):
+            locations = np.c_[x, np.full(11, 100.0 * ind), np.full(11, 10.0)]
+            model = xyz_2_drape_model(workspace, locations, depths, name=f"line_{ind}")
+            model.add_data(
+                {
+                    name: {"values": np.full(model.n_cells, value)}
+                    for name, value in values.items()
+                }
+            )
+            drape_models.append(model)
+
+        # Only on the first line
+        drape_models[0].add_data(
+            {"extra": {"values": np.ones(drape_models[0].n_cells)}}
+        )
+
+        labels = LineSweepDriver.octree_children(drape_models)
+        assert labels == {
+            "indices": ["indices", "indices"],
+            "density": ["density", "density"],
+            "Iteration_1_model": ["Iteration_1_model", "Iteration_1_model"],
+            "Iteration_final_model": ["Iteration_2_model", "Iteration_3_model"],
+        }
+
+        mesh = TreeMesh([[10.0] * 16, [10.0] * 16, [10.0] * 4], origin=[-30.0] * 3)
+        mesh.refine(mesh.max_level)
+        octree = treemesh_2_octree(workspace, mesh)
+        active = octree.centroids[:, 2] < 0.0
+        drape_to_octree(octree, drape_models, labels, active, method="nearest")
+
+        first_line = octree.centroids[:, 1] < 50.0
+        assert octree.get_data("extra") == []
+        for label, (first, second) in {
+            "density": (1.0, 2.0),
+            "Iteration_1_model": (1.0, 10.0),
+            "Iteration_final_model": (2.0, 30.0),
+        }.items():
+            values = octree.get_data(label)[0].values
+            assert np.all(np.isnan(values[~active]))
+            np.testing.assert_array_equal(values[active & first_line], first)
+            np.testing.assert_array_equal(values[active & ~first_line], second)
@@ -0,0 +1,67 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from simpeg_drivers.utils.memory_planner import MemoryPlanner
+
+
+def get_planner(max_ram: float, **kwargs) -> MemoryPlanner:
+    return MemoryPlanner(n_data=10_000, n_cells=100_000, max_ram=max_ram, **kwargs)
+
+
+def test_plan_fits():
+    plan = get_planner(100.0, tile_spatial=2).plan()
+
+    assert plan.fits
+    assert plan.tile_spatial == 2
+    assert plan.store_sensitivities == "ram"
+
+
+def test_plan_raises_tiles():
+    planner = get_planner(8.0)
+    plan = planner.plan()
+
+    assert plan.fits
+    assert plan.tile_spatial > 1
+    assert plan.store_sensitivities == "ram"
+    assert plan.peak_memory <= 8.0
+    assert planner.estimate(1, "ram", 1).peak_memory > 8.0
+
+
+def test_plan_switches_to_disk():
+    plan = get_planner(0.5).plan()
+
+    assert plan.fits
+    assert plan.store_sensitivities == "disk"
+
+
+def test_plan_keeps_ram():
+    plan = get_planner(0.5, allow_disk=False).plan()
+
+    assert not plan.fits
+    assert plan.store_sensitivities == "ram"
+
+
+def test_plan_reduces_concurrency():
+    plan = get_planner(0.3, factorization=True, n_tile_workers=8).plan()
+
+    assert plan.fits
+    assert plan.n_tile_workers == 1
+
+
+def test_plan_no_fit(caplog):
+    plan = get_planner(1e-6, n_tile_workers=4).plan()
+
+    assert not plan.fits
+    assert plan.store_sensitivities == "disk"
+    assert plan.n_tile_workers == 1
+    assert plan.tile_spatial == max(get_planner(1e-6).tile_counts)
+    assert "No execution plan fits" in caplog.text
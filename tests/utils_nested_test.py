@@ -0,0 +1,351 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from discretize import TreeMesh
+from geoh5py import Workspace
+from pymatsolver.direct import Mumps, Pardiso
+from scipy.spatial import cKDTree
+from simpeg.electromagnetics import frequency_domain as fdem
+from simpeg.electromagnetics.static import resistivity
+from simpeg.potential_fields import gravity
+
+from simpeg_drivers.components.factories import MisfitFactory
+from simpeg_drivers.electricals.direct_current.three_dimensions.driver import (
+    DC3DInversionDriver,
+)
+from simpeg_drivers.electricals.direct_current.three_dimensions.options import (
+    DC3DInversionOptions,
+)
+from simpeg_drivers.potential_fields import MagneticInversionOptions
+from simpeg_drivers.potential_fields.magnetic_scalar.driver import (
+    MagneticInversionDriver,
+)
+from simpeg_drivers.utils.nested import (
+    ComputePolicy,
+    compute_projections,
+    create_cached_mesh,
+    create_mesh,
+)
+from simpeg_drivers.utils.synthetics.driver import SyntheticsComponents
+from simpeg_drivers.utils.synthetics.options import (
+    MeshOptions,
+    ModelOptions,
+    SurveyOptions,
+    SyntheticsComponentsOptions,
+)
+from simpeg_drivers.utils.tile_cache import CachedTileMap, TileCache
+
+
+def create_mesh_loop(survey, base_mesh, padding_cells=8, minimum_level=4):
+    """Reference implementation refining the nested mesh one shell at a time."""
+    locations = survey.receiver_locations
+    nested_mesh = TreeMesh(base_mesh.h, x0=base_mesh.x0, diagonal_balance=False)
+    base_level = base_mesh.max_level - minimum_level
+    base_refinement = base_mesh.cell_levels_by_index(np.arange(base_mesh.nC))
+    base_refinement[base_refinement > base_level] = base_level
+    nested_mesh.insert_cells(base_mesh.gridCC, base_refinement, finalize=False)
+    base_cell = np.min([base_mesh.h[0][0], base_mesh.h[1][0]])
+    tree = cKDTree(locations[:, :2])
+    rad, _ = tree.query(base_mesh.gridCC[:, :2])
+    pad_distance = 0.0
+    for ii in range(minimum_level):
+        pad_distance += base_cell * 2**ii * padding_cells
+        indices = np.where(rad < pad_distance)[0]
+        levels = base_mesh.cell_levels_by_index(indices)
+        levels[levels > (base_mesh.max_level - ii)] = base_mesh.max_level - ii
+        nested_mesh.insert_cells(base_mesh.gridCC[indices, :], levels, finalize=False)
+
+    nested_mesh.finalize()
+    return nested_mesh
+
+
+def setup_gravity_survey(n_stations: int = 20, n_base: int = 64):
+    grid = np.linspace(-2.0 * n_base, 2.0 * n_base, n_stations)
+    x, y = np.meshgrid(grid, grid)
+    locations = np.c_[x.ravel(), y.ravel(), np.ones(x.size)]
+    base_mesh = TreeMesh(
+        [[(5.0, n_base)], [(5.0, n_base)], [(5.0, n_base)]],
+        origin="CCN",
+        diagonal_balance=False,
+    )
+    base_mesh.refine_surface(locations, padding_cells_by_level=[4, 4, 4], finalize=True)
+    tile = np.all(locations[:, :2] < 0.0, axis=1)
+    receivers = gravity.receivers.Point(locations[tile])
+    survey = gravity.survey.Survey(gravity.sources.SourceField([receivers]))
+
+    return survey, base_mesh
+
+
+def test_create_mesh_matches_loop():
+    survey, base_mesh = setup_gravity_survey()
+
+    for padding_cells, minimum_level in [(2, 3), (4, 4), (8, 2)]:
+        nested = create_mesh(
+            survey, base_mesh, padding_cells=padding_cells, minimum_level=minimum_level
+        )
+        reference = create_mesh_loop(
+            survey, base_mesh, padding_cells=padding_cells, minimum_level=minimum_level
+        )
+
+        assert nested.n_cells < base_mesh.n_cells
+        np.testing.assert_array_equal(
+            nested.cell_state["indexes"], reference.cell_state["indexes"]
+        )
+        np.testing.assert_array_equal(
+            nested.cell_state["levels"], reference.cell_state["levels"]
+        )
+
+
+def setup_magnetic_driver(tmp_path: Path, tile_spatial: int = 4):
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    opts = SyntheticsComponentsOptions(
+        method="magnetic_scalar",
+        survey=SurveyOptions(n_stations=8, n_lines=8),
+        mesh=MeshOptions(refinement=(2,)),
+        model=ModelOptions(anomaly=0.05),
+    )
+    with Workspace.create(tmp_path / "inversion_test.ui.geoh5") as geoh5:
+        components = SyntheticsComponents(geoh5, options=opts)
+        tmi_channel = components.survey.add_data(
+            {
+                "tmi": {"values": np.random.rand(components.survey.n_vertices)},
+            }
+        )
+        params = MagneticInversionOptions.build(
+            geoh5=geoh5,
+            mesh=components.mesh,
+            topography_object=components.topography,
+            inducing_field_strength=50000.0,
+            inducing_field_inclination=90.0,
+            inducing_field_declination=0.0,
+            data_object=components.survey,
+            tmi_channel=tmi_channel,
+            tmi_uncertainty=1.0,
+            starting_model=components.model,
+        )
+        params.compute.tile_spatial = tile_spatial
+
+    return MagneticInversionDriver(params)
+
+
+def test_parallel_misfit_factory(tmp_path: Path):
+    driver = setup_magnetic_driver(tmp_path)
+
+    with driver.workspace.open():
+        tiles = driver.get_tiles()
+        split_list = [1] * len(tiles)
+
+        serial = MisfitFactory(driver.params, driver.simulation).build(
+            tiles, split_list
+        )
+        serial_ordering = driver.simulation.survey.ordering.copy()
+
+        driver.params.compute.n_tile_workers = 2
+        parallel = MisfitFactory(driver.params, driver.simulation).build(
+            tiles, split_list
+        )
+        model = driver.models.starting_model
+
+    assert len(serial.objfcts) == len(parallel.objfcts) == len(tiles)
+    np.testing.assert_array_equal(serial_ordering, driver.simulation.survey.ordering)
+
+    for local_serial, local_parallel in zip(
+        serial.objfcts, parallel.objfcts, strict=True
+    ):
+        assert local_serial.nD == local_parallel.nD
+        assert (
+            local_serial.simulation.simulations[0].mesh.n_cells
+            == local_parallel.simulation.simulations[0].mesh.n_cells
+        )
+        np.testing.assert_allclose(
+            local_parallel.simulation.dpred(model),
+            local_serial.simulation.dpred(model),
+        )
+
+
+def test_tile_cache(tmp_path: Path):
+    driver = setup_magnetic_driver(tmp_path, tile_spatial=2)
+    driver.params.compute.tile_cache = True
+
+    with driver.workspace.open():
+        tiles = driver.get_tiles()
+        first = MisfitFactory(driver.params, driver.simulation).build(tiles, [1, 1])
+        files = list((driver.params.workpath / "tiles").glob("*.npz"))
+        second = MisfitFactory(driver.params, driver.simulation).build(tiles, [1, 1])
+
+    assert len(files) == 4
+    for local_first, local_second in zip(first.objfcts, second.objfcts, strict=True):
+        mapping = local_second.simulation.mappings[0]
+        assert isinstance(mapping, CachedTileMap)
+        np.testing.assert_array_equal(
+            local_first.simulation.mappings[0].local_active, mapping.local_active
+        )
+        assert (
+            abs(local_first.simulation.mappings[0].projection - mapping.projection)
+        ).max() == 0
+        assert (
+            local_first.simulation.simulations[0].mesh.n_cells
+            == local_second.simulation.simulations[0].mesh.n_cells
+        )
+
+
+def test_cached_mesh_sources(tmp_path: Path):
+    _, base_mesh = setup_gravity_survey()
+    cache = TileCache(tmp_path)
+    locations = np.c_[np.linspace(-50.0, -10.0, 5), np.zeros(5), np.ones(5)]
+    receivers = resistivity.receivers.Dipole(locations[:-1], locations[1:])
+
+    # Same receivers, with the current electrodes moved away
+    for offset in [0.0, 20.0]:
+        source = resistivity.sources.Dipole(
+            [receivers], np.r_[-70.0 - offset, 0.0, 1.0], np.r_[10.0 + offset, 0.0, 1.0]
+        )
+        create_cached_mesh(
+            resistivity.Survey([source]), base_mesh, np.arange(4), cache=cache
+        )
+
+    assert len(list(tmp_path.glob("mesh_*.npz"))) == 2
+    # The global mesh is hashed once per cache
+    assert len(cache._mesh_hashes) == 1
+
+
+def test_cached_projections_components(tmp_path: Path):
+    _, base_mesh = setup_gravity_survey()
+    cache = TileCache(tmp_path)
+    locations = np.c_[np.linspace(-50.0, -10.0, 5), np.zeros(5), np.full(5, -10.0)]
+
+    # Same number of receivers, with the active components changed
+    projections = []
+    for orientation in ["z", "x"]:
+        receivers = [
+            fdem.receivers.PointMagneticFluxDensitySecondary(
+                locations, orientation=orientation, component=component
+            )
+            for component in ["real", "imag"]
+        ]
+        source = fdem.sources.MagDipole(
+            receivers, frequency=100.0, location=np.r_[0.0, 0.0, 10.0]
+        )
+        source.rx_ids = np.arange(5)
+        survey = fdem.Survey([source])
+        survey.locations = locations
+        simulation = fdem.Simulation3DMagneticFluxDensity(base_mesh, survey=survey)
+        compute_projections(
+            simulation, simulation, np.arange(5), channel=100.0, cache=cache
+        )
+        projections.append(receivers[0].spatialP)
+
+    assert len(list(tmp_path.glob("projections_*.npz"))) == 2
+    for projection, faces in zip(projections, ["faces_z", "faces_x"], strict=True):
+        expected = base_mesh.get_interpolation_matrix(locations, faces)
+        assert abs(projection - expected).max() == 0
+
+
+def test_sensitivity_dtype(tmp_path: Path):
+    driver = setup_magnetic_driver(tmp_path / "default", tile_spatial=2)
+    assert driver.params.compute.sensitivity_dtype is None
+
+    with driver.workspace.open():
+        policy = driver.simulation.compute_policy
+        assert "sensitivity_dtype" not in policy.simulation_kwargs()
+
+    driver = setup_magnetic_driver(tmp_path, tile_spatial=2)
+    driver.params.compute.sensitivity_dtype = "float32"
+
+    with driver.workspace.open():
+        assert driver.simulation.sensitivity_dtype == np.float32
+        misfits = MisfitFactory(driver.params, driver.simulation).build(
+            driver.get_tiles(), [1, 1]
+        )
+
+    for misfit in misfits.objfcts:
+        local_sim = misfit.simulation.simulations[0]
+        assert local_sim.sensitivity_dtype == np.float32
+        assert Path(local_sim.sensitivity_path).name.endswith("_float32.zarr")
+
+
+def test_compute_policy(tmp_path: Path):
+    driver = setup_magnetic_driver(tmp_path, tile_spatial=2)
+    driver.params.compute.max_chunk_size = 64
+    driver.params.store_sensitivities = "disk"
+
+    with driver.workspace.open():
+        policy = driver.simulation.compute_policy
+        misfits = MisfitFactory(driver.params, driver.simulation).build(
+            driver.get_tiles(), [1, 1]
+        )
+
+    assert isinstance(policy, ComputePolicy)
+    assert policy.max_chunk_size == 64
+    assert policy.store_sensitivities == "disk"
+
+    for misfit in misfits.objfcts:
+        local_sim = misfit.simulation.simulations[0]
+        assert local_sim.compute_policy == policy
+        assert local_sim.max_chunk_size == 64
+        assert local_sim.store_sensitivities == "disk"
+        assert Path(local_sim.sensitivity_path).parent == policy.sensitivity_path.parent
+
+
+def test_compute_policy_solver_threads():
+    class Solver(Pardiso):
+        pass
+
+    for solver in [Pardiso, Solver]:
+        policy = ComputePolicy(solver=solver, n_threads=2)
+        assert policy.simulation_kwargs()["solver_opts"] == {"n_threads": 2}
+
+    policy = ComputePolicy(solver=Mumps, n_threads=2)
+    assert "solver_opts" not in policy.simulation_kwargs()
+
+
+def test_tile_sensitivity_paths(tmp_path: Path):
+    opts = SyntheticsComponentsOptions(
+        method="direct current 3d",
+        survey=SurveyOptions(n_stations=4, n_lines=3),
+        mesh=MeshOptions(refinement=(4, 6)),
+        model=ModelOptions(background=0.01, anomaly=10.0),
+    )
+    with Workspace.create(tmp_path / "inversion_test.ui.geoh5") as geoh5:
+        components = SyntheticsComponents(geoh5, options=opts)
+        potential = components.survey.add_data(
+            {"potential": {"values": np.random.rand(components.survey.n_cells)}}
+        )
+        params = DC3DInversionOptions.build(
+            geoh5=geoh5,
+            mesh=components.mesh,
+            topography_object=components.topography,
+            data_object=components.survey,
+            potential_channel=potential,
+            potential_uncertainty=1e-3,
+            starting_model=1e-2,
+            store_sensitivities="disk",
+        )
+        params.compute.tile_spatial = 2
+
+    driver = DC3DInversionDriver(params)
+
+    with driver.workspace.open():
+        tiles = driver.get_tiles()
+        misfits = MisfitFactory(driver.params, driver.simulation).build(
+            tiles, [1] * len(tiles)
+        )
+
+    paths = [
+        Path(misfit.simulation.simulations[0].sensitivity_path)
+        for misfit in misfits.objfcts
+    ]
+    assert len(set(paths)) == len(misfits.objfcts) > 1
+    assert all(path.parent == params.workpath / "sensitivities" for path in paths)
@@ -0,0 +1,148 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from dask.distributed import LocalCluster
+
+from simpeg_drivers.utils.placement import (
+    RebalanceMisfits,
+    misfit_cost,
+    misfit_rows,
+    misfit_time,
+    place_misfits,
+    round_order,
+    scatter_misfits,
+    worker_loads,
+)
+from tests.utils_nested_test import setup_magnetic_driver
+
+
+def test_misfit_cost():
+    misfit = SimpleNamespace(nD=10, nP=5, simulation=None)
+
+    assert misfit_cost(misfit) == 50.0
+    assert misfit_time(misfit) == 0.0
+
+
+def test_place_misfits():
+    costs = [8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    workers = ["a", "b"]
+    placement = place_misfits(costs, workers)
+    loads = worker_loads(costs, placement)
+
+    # Every worker holds the same number of misfits
+    assert placement.count("a") == placement.count("b") == 4
+    assert loads == {"a": 18.0, "b": 18.0}
+
+    # Round-robin placement would load a single worker with 20
+    round_robin = [workers[ind % len(workers)] for ind in range(len(costs))]
+    assert max(worker_loads(costs, round_robin).values()) == 20.0
+
+
+def test_round_order():
+    placement = ["b", "a", "a", "b"]
+    order = round_order(placement, ["a", "b"])
+
+    assert [placement[ind] for ind in order] == ["a", "b", "a", "b"]
+    np.testing.assert_array_equal(order, [1, 0, 2, 3])
+    np.testing.assert_array_equal(
+        misfit_rows([1, 2, 3, 1], order), [1, 2, 0, 3, 4, 5, 6]
+    )
+
+
+def test_round_order_uneven():
+    workers = ["a", "b", "c"]
+    placement = place_misfits([1.0, 5.0, 2.0, 4.0, 3.0], workers)
+
+    # Same counts as a round-robin placement, leftovers on the first workers
+    assert [placement.count(worker) for worker in workers] == [2, 2, 1]
+
+    order = round_order(placement, workers)
+    assert sorted(order) == list(range(5))
+    assert [placement[ind] for ind in order] == ["a", "b", "c", "a", "b"]
+
+    # Fewer misfits than workers
+    assert place_misfits([1.0, 2.0], workers) == ["b", "a"]
+    np.testing.assert_array_equal(round_order(["b", "a"], workers), [1, 0])
+
+
+def test_scatter_misfits():
+    with (
+        LocalCluster(processes=False, n_workers=2, threads_per_worker=1) as cluster,
+        cluster.get_client() as client,
+    ):
+        workers = list(client.nthreads())
+        placement = place_misfits([3.0, 2.0, 1.0, 1.0], workers)
+        futures = scatter_misfits(client, ["w", "x", "y", "z"], placement)
+        who_has = client.who_has(futures)
+
+        for future, worker in zip(futures, placement, strict=True):
+            assert list(who_has[future.key]) == [worker]
+
+
+def located_data(driver, dpred: list[np.ndarray]) -> np.ndarray:
+    """Predicted data in the order of the survey."""
+    ordering = driver.inversion_data.survey.ordering
+    values = np.zeros(ordering.max(axis=0) + 1)
+    values[ordering[:, 0], ordering[:, 1], ordering[:, 2]] = np.hstack(dpred)
+    return values
+
+
+def test_rebalance_misfits(tmp_path: Path):
+    np.random.seed(0)
+    serial = setup_magnetic_driver(tmp_path / "serial")
+    with serial.workspace.open():
+        model = serial.models.starting_model
+        phi = serial.data_misfit(model)
+        deriv = serial.data_misfit.deriv(model)
+        dpred = located_data(serial, serial.inverse_problem.get_dpred(model))
+
+    with (
+        LocalCluster(processes=False, n_workers=2, threads_per_worker=1) as cluster,
+        cluster.get_client(),
+    ):
+        np.random.seed(0)
+        driver = setup_magnetic_driver(tmp_path / "distributed")
+        driver.params.compute.rebalance_misfits = True
+
+        with driver.workspace.open():
+            misfits = driver.data_misfit
+            directive = driver.directives.rebalance_misfits_directive
+            directive.tolerance = 0.0
+            directive.inversion = SimpleNamespace(
+                invProb=SimpleNamespace(
+                    dmisfit=misfits, dpred=None, opt=SimpleNamespace(iter=1)
+                )
+            )
+
+            # First iteration on the placement by estimated costs
+            np.testing.assert_allclose(misfits(model), phi)
+            np.testing.assert_allclose(misfits.deriv(model), deriv)
+
+            directive.endIter()
+            who_has = driver.client.who_has(directive.futures)
+            assert directive.rebalanced
+            assert directive.dmisfit.objfcts == directive.futures
+            for future, worker in zip(
+                directive.futures, directive.placement, strict=True
+            ):
+                assert list(who_has[future.key]) == [worker]
+
+            # Second iteration on the placement by measured times
+            np.testing.assert_allclose(misfits(model), phi)
+            np.testing.assert_allclose(misfits.deriv(model), deriv)
+            np.testing.assert_allclose(
+                located_data(driver, driver.inverse_problem.get_dpred(model)), dpred
+            )
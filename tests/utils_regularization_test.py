@@ -10,13 +10,18 @@
 
 import numpy as np
 from discretize import TreeMesh
+from simpeg.regularization import Sparse
 
 from simpeg_drivers.utils.regularization import (
     cell_adjacent,
+    cell_neighbors,
     cell_neighbors_along_axis,
     collect_all_neighbors,
     direction_and_dip,
     ensure_dip_direction_convention,
+    rotate_normals,
+    set_rotated_operators,
+    unique_pairs,
 )
 
 
@@ -134,3 +139,50 @@ def test_ensure_dip_direction_convention():
     dir_dip = ensure_dip_direction_convention(orientations, group_type="3D vector")
     assert np.allclose(dir_dip[:, 0], [90, 0, 270, 180] * 2 + [254])
     assert np.allclose(dir_dip[:, 1], [45] * 4 + [30] * 4 + [37])
+
+
+def test_unique_pairs():
+    pairs = np.array([[3, 1], [0, 2], [-1, 4], [3, 1], [0, 1], [2, -1]])
+    np.testing.assert_array_equal(unique_pairs(pairs), [[0, 1], [0, 2], [3, 1]])
+
+
+def test_set_rotated_operators():
+    mesh = get_mesh()
+    active = mesh.cell_centers[:, 2] < 30.0
+    dip = np.full(mesh.n_cells, np.deg2rad(30.0))
+    direction = np.full(mesh.n_cells, np.deg2rad(45.0))
+    neighbors = cell_neighbors(mesh)
+
+    operators = []
+    for forward in [True, True, False]:
+        reg = Sparse(mesh, active_cells=active)
+        fun = set_rotated_operators(
+            reg.objfcts[1], neighbors, "x", dip, direction, forward=forward
+        )
+        grad = fun.regularization_mesh.cell_gradient_x
+        average = fun.regularization_mesh.aveCC2Fx
+        operators.append(grad)
+
+        assert grad.shape == average.shape
+        assert grad.shape[1] == active.sum()
+        np.testing.assert_allclose(grad @ np.ones(active.sum()), 0.0, atol=1e-12)
+        np.testing.assert_allclose(average.sum(axis=1), 1.0)
+
+    # Operators are re-used for the same mesh and orientations
+    assert operators[0] is operators[1]
+    assert operators[0] is not operators[2]
+
+
+def test_rotate_normals():
+    dip = np.full(get_mesh().n_cells, np.deg2rad(30.0))
+    direction = np.full(len(dip), np.deg2rad(45.0))
+    mesh, other = get_mesh(), get_mesh()
+
+    normals = rotate_normals(mesh, "x", dip, direction)
+    assert rotate_normals(mesh, "x", dip, direction) is normals
+    assert rotate_normals(mesh, "y", dip, direction) is not normals
+
+    # The rotations are held by their own mesh only
+    rotated = rotate_normals(other, "y", dip, direction)
+    np.testing.assert_allclose(rotated, mesh._rotated_normals[1])
+    assert rotated is not mesh._rotated_normals[1]
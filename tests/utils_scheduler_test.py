@@ -0,0 +1,60 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import dask
+from dask.distributed import LocalCluster
+
+from simpeg_drivers.utils.scheduler import dask_client
+from tests.utils_nested_test import setup_magnetic_driver
+
+
+def test_dask_client_scheduler():
+    with LocalCluster(
+        processes=False,
+        n_workers=1,
+        threads_per_worker=2,
+        resources={"CPU": 2, "MEMORY": 4e9},
+    ) as cluster:
+        with dask_client(address=cluster.scheduler_address, n_threads=2) as client:
+            assert client.scheduler.address == cluster.scheduler_address
+            # The memory of the job is not requested by every task
+            assert dask.get_annotations() == {"resources": {"CPU": 2}}
+            assert client.submit(sum, [1, 2]).result() == 3
+
+        # The long-lived scheduler survives the job
+        assert cluster.status.name == "running"
+        assert len(cluster.scheduler_info["workers"]) == 1
+
+
+def test_dask_client_fallback(caplog):
+    with dask_client(address="tcp://127.0.0.1:1", timeout=1) as client:
+        assert client is None
+
+    assert "Falling back to a local cluster" in caplog.text
+
+    with dask_client(address="tcp://127.0.0.1:1", n_threads=1, timeout=1) as client:
+        assert client.submit(sum, [1, 2]).result() == 3
+
+
+def test_driver_closes_client(tmp_path: Path):
+    driver = setup_magnetic_driver(tmp_path)
+
+    with LocalCluster(processes=False, n_workers=1, threads_per_worker=1) as cluster:
+        driver.params.compute.distributed_workers = cluster.scheduler_address
+        client = driver.client
+        assert client.scheduler.address == cluster.scheduler_address
+
+        driver.close_client()
+        assert client.status == "closed"
+        assert cluster.status.name == "running"
@@ -0,0 +1,78 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+from discretize import TensorMesh
+from simpeg import maps
+from simpeg.potential_fields import gravity
+
+from simpeg_drivers.utils.sensitivity_store import (
+    store_is_complete,
+    validate_sensitivity_store,
+)
+
+
+def get_simulation(path: Path, n_receivers: int = 4):
+    mesh = TensorMesh([[(10.0, 6)], [(10.0, 6)], [(10.0, 4)]], "CCN")
+    locations = np.c_[
+        np.linspace(-20, 20, n_receivers), np.zeros(n_receivers), np.ones(n_receivers)
+    ]
+    receivers = gravity.receivers.Point(locations)
+    survey = gravity.survey.Survey(gravity.sources.SourceField([receivers]))
+
+    return gravity.simulation.Simulation3DIntegral(
+        mesh,
+        survey=survey,
+        rhoMap=maps.IdentityMap(nP=mesh.n_cells),
+        store_sensitivities="disk",
+        sensitivity_path=str(path),
+    )
+
+
+def test_sensitivity_store_reuse(tmp_path: Path):
+    path = tmp_path / "sensitivities" / "Tile0.zarr"
+    simulation = get_simulation(path)
+
+    assert not validate_sensitivity_store(simulation)
+    assert (tmp_path / "sensitivities" / "Tile0.zarr.json").exists()
+
+    _ = simulation.G
+    assert path.exists()
+
+    # Same geometry is re-used
+    assert validate_sensitivity_store(get_simulation(path))
+    assert path.exists()
+
+    # Different receivers invalidate the store
+    assert not validate_sensitivity_store(get_simulation(path, n_receivers=5))
+    assert not path.exists()
+
+
+def test_store_is_complete(tmp_path: Path):
+    path = tmp_path / "Tile0.zarr"
+    path.mkdir()
+    (path / ".zarray").write_text(
+        json.dumps({"shape": [10, 8], "chunks": [4, 8]}), encoding="utf-8"
+    )
+
+    for ind in range(2):
+        (path / f"{ind}.0").touch()
+
+    assert not store_is_complete(path, (10, 8))
+
+    (path / "2.0").touch()
+
+    assert store_is_complete(path, (10, 8))
+    assert not store_is_complete(path, (10, 9))
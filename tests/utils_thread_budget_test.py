@@ -0,0 +1,48 @@
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2025 Mira Geoscience Ltd.                                          '
+#                                                                                   '
+#  This file is part of simpeg-drivers package.                                     '
+#                                                                                   '
+#  simpeg-drivers is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                      '
+#                                                                                   '
+# '''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import numpy as np
+from threadpoolctl import threadpool_info
+
+from simpeg_drivers.utils.thread_budget import ThreadBudget
+
+
+def test_thread_budget_layout():
+    budget = ThreadBudget.from_compute(64, n_workers=4, n_threads=4)
+
+    assert budget.library_threads == 4
+    assert budget.environment()["OMP_NUM_THREADS"] == "4"
+    assert "4 worker(s) x 4 dask thread(s) x 4 BLAS/OpenMP" in budget.layout()
+
+    # Library calls of the main thread keep every CPU by default
+    default = ThreadBudget.from_compute(64)
+    assert not default.concurrent
+    assert default.n_threads == 64
+    assert default.library_threads == 64
+
+    # Workers run library calls concurrently
+    assert ThreadBudget.from_compute(64, n_workers=4).library_threads == 1
+
+    # Never fewer than one thread per library
+    assert ThreadBudget.from_compute(2, n_workers=4, n_threads=4).library_threads == 1
+
+
+def test_thread_budget_limits():
+    _ = np.ones((2, 2)) @ np.ones(2)  # Ensure a BLAS library is loaded
+    budget = ThreadBudget.from_compute(8, n_threads=4)
+
+    with budget.limits():
+        assert all(info["num_threads"] <= 2 for info in threadpool_info())
+
+    before = [info["num_threads"] for info in threadpool_info()]
+    with ThreadBudget.from_compute(8).limits():
+        assert [info["num_threads"] for info in threadpool_info()] == before